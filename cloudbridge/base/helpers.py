@@ -1,8 +1,13 @@
 import fnmatch
+import functools
+import itertools
 import logging
 import os
 import re
+import zlib
 from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterable
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
@@ -14,6 +19,20 @@ from cryptography.hazmat.primitives import serialization as crypt_serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 
 from ..interfaces.exceptions import InvalidParamException
+from ..interfaces.exceptions import ProviderInternalException
+
+try:
+    # Optional: computes CRC32C in C, orders of magnitude faster than the
+    # pure Python fallback below.
+    import google_crc32c
+except ImportError:
+    google_crc32c = None
+
+try:
+    # Optional: needed for zstd compressed transfers only.
+    import zstandard
+except ImportError:
+    zstandard = None
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +59,100 @@ def generate_key_pair() -> tuple[str, str]:
     return public_key, private_key
 
 
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+# The cost classes of find() predicates, cheapest first.
+_EQUALS, _IN_SET, _IN_RANGE, _GLOB = range(4)
+
+
+@functools.lru_cache(maxsize=512)
+def _glob_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _value_matcher(value: Any) -> tuple[int, Callable[[Any], bool]]:
+    """
+    Compile a single ``find()`` value into a test of an attribute value,
+    along with its cost class.
+
+    A string is a glob pattern matched against the whole attribute, a
+    ``slice`` a half-open ``[start, stop)`` range, and a list, tuple or set
+    matches if any of its members does. Anything else must be equal.
+    """
+    if isinstance(value, str):
+        if not _GLOB_CHARS.search(value):
+            return _EQUALS, lambda attr: attr == value
+        regex = _glob_regex(value)
+        return _GLOB, lambda attr: (isinstance(attr, str)
+                                    and regex.match(attr) is not None)
+    if isinstance(value, slice):
+        start, stop = value.start, value.stop
+
+        def in_range(attr: Any) -> bool:
+            return (attr is not None
+                    and (start is None or attr >= start)
+                    and (stop is None or attr < stop))
+        return _IN_RANGE, in_range
+    if isinstance(value, (list, tuple, set, frozenset)):
+        literals = set()
+        tests = []
+        for member in value:
+            cost, test = _value_matcher(member)
+            if cost == _EQUALS and isinstance(member, Hashable):
+                literals.add(member)
+            else:
+                tests.append(test)
+
+        def in_set(attr: Any) -> bool:
+            try:
+                if attr in literals:
+                    return True
+            except TypeError:
+                # An unhashable attribute can only match a pattern.
+                pass
+            return any(test(attr) for test in tests)
+        return _IN_SET if not tests else _GLOB, in_set
+    return _EQUALS, lambda attr: bool(attr == value)
+
+
+def compile_filters(filter_names: list[str],
+                    kwargs: dict[str, Any]) -> Callable[[Any], bool]:
+    """
+    Compile ``find()`` kwargs into a predicate over objects.
+
+    The filters named in ``filter_names`` are popped from ``kwargs``, and
+    an empty value leaves its filter out. The predicate tries the cheapest
+    tests first, stops at the first that fails, and reads each attribute at
+    most once, since an attribute may have to be looked up on the cloud.
+    Compile once and reuse the predicate when matching many objects.
+
+    :raise InvalidParamException: if ``kwargs`` holds any other filter.
+    """
+    checks = []
+    for name in filter_names:
+        prop_val = kwargs.pop(name, None)
+        if prop_val:
+            cost, test = _value_matcher(prop_val)
+            checks.append((cost, name, test))
+
+    # All kwargs should have been popped at this time.
+    if len(kwargs) > 0:
+        raise InvalidParamException(
+            "Unrecognised parameters for search: %s. Supported attributes: %s"
+            % (kwargs, filter_names))
+
+    # A stable sort keeps the caller's order within each cost class.
+    checks.sort(key=lambda check: check[0])
+    ordered = [(name, test) for _, name, test in checks]
+
+    def matches(obj: Any) -> bool:
+        for name, test in ordered:
+            if not test(getattr(obj, name)):
+                return False
+        return True
+    return matches
+
+
 def filter_by(prop_name: str, kwargs: dict[str, Any],
               objs: list[T]) -> list[T]:
     """
@@ -50,35 +163,68 @@ def filter_by(prop_name: str, kwargs: dict[str, Any],
     """
     prop_val = kwargs.pop(prop_name, None)
     if prop_val:
-        if isinstance(prop_val, str):
-            regex = fnmatch.translate(prop_val)
-            results = [o for o in objs
-                       if getattr(o, prop_name)
-                       and re.search(regex, getattr(o, prop_name))]
-        else:
-            results = [o for o in objs
-                       if getattr(o, prop_name) == prop_val]
-        return results
+        matches = compile_filters([prop_name], {prop_name: prop_val})
+        return [o for o in objs if matches(o)]
     else:
         return objs
 
 
-def generic_find(filter_names: list[str], kwargs: dict[str, Any],
-                 objs: list[T]) -> list[T]:
+def glob_prefix(pattern: str) -> str:
     """
-    Utility method for filtering a list of objects by a list of filters.
+    Return the literal leading part of a glob ``pattern``: everything before
+    its first wildcard (``*``, ``?`` or ``[``). Every name the pattern
+    matches starts with this prefix, so it can be used to narrow a listing
+    on the server before the pattern itself is matched.
     """
-    matches = objs
-    for name in filter_names:
-        matches = filter_by(name, kwargs, matches)
+    match = _GLOB_CHARS.search(pattern)
+    return pattern[:match.start()] if match else pattern
 
-    # All kwargs should have been popped at this time.
-    if len(kwargs) > 0:
-        raise InvalidParamException(
-            "Unrecognised parameters for search: %s. Supported attributes: %s"
-            % (kwargs, filter_names))
 
-    return matches
+def split_filters(kwargs: dict[str, Any],
+                  translators: dict[str, Callable[[Any], str | None]]
+                  ) -> tuple[list[str], dict[str, Any]]:
+    """
+    Split ``find()`` kwargs into native filter expressions and the rest.
+
+    Each translator renders one filter in the provider's own filter syntax,
+    or returns None when the value cannot be expressed there exactly. Empty
+    values and glob patterns are never pushed down, since ``find()`` matches
+    strings as globs. Whatever is not translated is returned untouched, to
+    be matched on the client with :func:`iter_find`.
+    """
+    native = []
+    remainder = {}
+    for name, value in kwargs.items():
+        translate = translators.get(name)
+        expression = None
+        if translate and value and not (isinstance(value, str)
+                                        and _GLOB_CHARS.search(value)):
+            expression = translate(value)
+        if expression is None:
+            remainder[name] = value
+        else:
+            native.append(expression)
+    return native, remainder
+
+
+def iter_find(filter_names: list[str], kwargs: dict[str, Any],
+              objs: Iterable[T]) -> Iterator[T]:
+    """
+    Utility method for lazily filtering objects by a list of filters.
+
+    The filters are checked straight away, but ``objs`` is only consumed as
+    the matches are, so a caller that stops early stops fetching objects.
+    """
+    matches = compile_filters(filter_names, kwargs)
+    return (o for o in objs if matches(o))
+
+
+def generic_find(filter_names: list[str], kwargs: dict[str, Any],
+                 objs: Iterable[T]) -> list[T]:
+    """
+    Utility method for filtering a list of objects by a list of filters.
+    """
+    return list(iter_find(filter_names, kwargs, objs))
 
 
 @contextmanager
@@ -153,3 +299,165 @@ def to_resource_name(value: str, replace_with: str = "-") -> str:
     """
     val = re.sub(NON_ALPHA_NUM, replace_with, value)
     return val.strip("-")
+
+
+# CRC-32C (Castagnoli), as used by Google Cloud Storage, in its reflected form.
+CRC32C_POLYNOMIAL = 0x82F63B78
+
+
+def _crc32c_table() -> list[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ (CRC32C_POLYNOMIAL if crc & 1 else 0)
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _crc32c_table()
+
+
+def crc32c(data: bytes | bytearray | memoryview, crc: int = 0) -> int:
+    """
+    Return the CRC32C of ``data``, continuing from the CRC32C ``crc`` of the
+    data before it. The ``google-crc32c`` package is used if it is installed.
+    """
+    if google_crc32c is not None:
+        return int(google_crc32c.extend(crc, data))
+    table = _CRC32C_TABLE
+    crc ^= 0xFFFFFFFF
+    for byte in memoryview(data).cast('B'):
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _gf2_times(matrix: list[int], vector: int) -> int:
+    total = 0
+    row = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[row]
+        vector >>= 1
+        row += 1
+    return total
+
+
+def _gf2_square(matrix: list[int]) -> list[int]:
+    return [_gf2_times(matrix, row) for row in matrix]
+
+
+def crc32c_combine(crc1: int, crc2: int, length2: int) -> int:
+    """
+    Return the CRC32C of two blocks of data joined together, given the
+    CRC32C ``crc1`` of the first, and the CRC32C ``crc2`` and length
+    ``length2`` of the second, without the data itself. This is zlib's
+    ``crc32_combine`` for the Castagnoli polynomial.
+    """
+    if length2 <= 0:
+        return crc1
+    # An operator that feeds one zero bit through the CRC, squared to feed
+    # two, then four zero bits.
+    odd = [CRC32C_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_square(odd)
+    odd = _gf2_square(even)
+    # Feed ``length2`` zero bytes into ``crc1``, one bit of the length at a
+    # time, squaring the operator as the length is halved.
+    while True:
+        even = _gf2_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+        odd = _gf2_square(even)
+        if length2 & 1:
+            crc1 = _gf2_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+    return crc1 ^ crc2
+
+
+# Content encodings that transfers can compress with, and the magic numbers
+# their streams start with.
+CONTENT_ENCODINGS = {'gzip': b'\x1f\x8b', 'zstd': b'\x28\xb5\x2f\xfd'}
+
+
+def check_content_encoding(encoding: str) -> None:
+    """
+    Raise an :class:`.InvalidParamException` unless transfers can compress
+    with ``encoding``.
+    """
+    if encoding not in CONTENT_ENCODINGS:
+        raise InvalidParamException(
+            "Unsupported content encoding: {0}. Supported encodings: {1}"
+            .format(encoding, ", ".join(CONTENT_ENCODINGS)))
+    if encoding == 'zstd' and zstandard is None:
+        raise InvalidParamException(
+            "zstd compression requires the zstandard package")
+
+
+def compress_chunks(chunks: Iterable[bytes],
+                    encoding: str) -> Iterator[bytes]:
+    """
+    Compress a stream of ``chunks`` with ``encoding`` (``'gzip'`` or
+    ``'zstd'``), yielding the compressed stream as it is produced.
+    """
+    check_content_encoding(encoding)
+    if encoding == 'gzip':
+        compressor: Any = zlib.compressobj(6, zlib.DEFLATED, 31)
+    else:
+        compressor = zstandard.ZstdCompressor().compressobj()
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def decompress_chunks(chunks: Iterable[bytes],
+                      encoding: str) -> Iterator[bytes]:
+    """
+    Decompress a stream of ``chunks`` compressed with ``encoding``, yielding
+    the content as it is produced. Streams made of several compressed members
+    (or frames) are decompressed as one. A stream that does not start with
+    the magic number of ``encoding`` is yielded as is, since HTTP clients
+    may have decompressed it on the way already.
+    """
+    check_content_encoding(encoding)
+    magic = CONTENT_ENCODINGS[encoding]
+    chunks = iter(chunks)
+    head = b''
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= len(magic):
+            break
+    if not head.startswith(magic):
+        if head:
+            yield head
+        yield from chunks
+        return
+
+    def new_decompressor() -> Any:
+        if encoding == 'gzip':
+            return zlib.decompressobj(31)
+        return zstandard.ZstdDecompressor().decompressobj()
+
+    decompressor = new_decompressor()
+    pending = False
+    for chunk in itertools.chain([head], chunks):
+        while chunk:
+            pending = True
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+            chunk = b''
+            if decompressor.eof:
+                # The next member starts with what the last one left over.
+                chunk = decompressor.unused_data
+                decompressor = new_decompressor()
+                pending = False
+    if pending:
+        raise ProviderInternalException(
+            "The {0} compressed content ended unexpectedly".format(encoding))
@@ -1,11 +1,19 @@
 """Base implementation of a provider interface."""
 import ast
+import copy
 import functools
 import logging
 import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from configparser import ConfigParser
+from contextlib import contextmanager
 from os.path import expanduser
 from typing import Any
+from typing import Iterator
+from typing import TypeVar
 from typing import cast
 
 from pyeventsystem.middleware import MiddlewareManager
@@ -14,11 +22,15 @@ from pyeventsystem.middleware import SimpleMiddlewareManager
 from ..base.middleware import ExceptionWrappingMiddleware
 from ..interfaces import CloudProvider
 from ..interfaces.exceptions import ProviderConnectionException
+from ..interfaces.resources import CloudResource
 from ..interfaces.resources import Configuration
+from ..interfaces.resources import PageableObjectMixin
 from ..interfaces.resources import PlacementZone
 
 log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 DEFAULT_RESULT_LIMIT = 50
 DEFAULT_WAIT_TIMEOUT = 600
 DEFAULT_WAIT_INTERVAL = 5
@@ -85,6 +97,239 @@ class BaseConfiguration(Configuration):
                                    os.environ.get('CB_DEBUG', False)))
 
 
+class ProviderClonePool(object):
+    """
+    A thread-safe pool of clones of a provider, for code that works on
+    several threads at once.
+
+    Cloning a provider (see :meth:`.CloudProvider.clone`) re-reads the
+    CloudBridge configuration files, rebuilds the middleware and, on first
+    use, opens new SDK sessions and connections. Instead of cloning for every
+    parallel operation, clones are checked out of this pool and checked back
+    in when done, so a clone and its connections serve one thread at a time
+    but outlive the operation. The most recently used clone is handed out
+    first, to keep connections warm.
+
+    Checking out never blocks: when no clone is idle, a new one is made. At
+    most ``clone_pool_max_size`` idle clones are kept
+    (``CB_CLONE_POOL_MAX_SIZE``, 16 if not set), and clones left idle for
+    more than ``clone_pool_idle_timeout`` seconds are dropped
+    (``CB_CLONE_POOL_IDLE_TIMEOUT``, 300 if not set).
+    """
+
+    CB_CLONE_POOL_MAX_SIZE = int(os.environ.get(
+        'CB_CLONE_POOL_MAX_SIZE', 16))
+    CB_CLONE_POOL_IDLE_TIMEOUT = float(os.environ.get(
+        'CB_CLONE_POOL_IDLE_TIMEOUT', 300))
+
+    def __init__(self, provider: "BaseCloudProvider") -> None:
+        self._provider = provider
+        self._max_size = max(0, int(provider._get_config_value(
+            'clone_pool_max_size', self.CB_CLONE_POOL_MAX_SIZE)))
+        self._idle_timeout = float(provider._get_config_value(
+            'clone_pool_idle_timeout', self.CB_CLONE_POOL_IDLE_TIMEOUT))
+        self._lock = threading.Lock()
+        # (time checked in, clone), oldest first.
+        self._idle: list[tuple[float, CloudProvider]] = []
+
+    @property
+    def idle_count(self) -> int:
+        """
+        The number of clones waiting in the pool.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            return len(self._idle)
+
+    def _evict(self, now: float) -> None:
+        expired = 0
+        while (expired < len(self._idle) and
+               now - self._idle[expired][0] > self._idle_timeout):
+            expired += 1
+        del self._idle[:expired]
+
+    def checkout(self) -> CloudProvider:
+        """
+        Take a clone out of the pool, cloning the provider if none is idle.
+        The caller has sole use of the clone until it is checked back in.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            if self._idle:
+                return self._idle.pop()[1]
+        return self._provider.clone()
+
+    def checkin(self, clone: CloudProvider) -> None:
+        """
+        Return a clone taken with :meth:`checkout` to the pool. It is dropped
+        if the pool already holds its maximum of idle clones.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            if len(self._idle) < self._max_size:
+                self._idle.append((now, clone))
+
+    @contextmanager
+    def borrow(self) -> Iterator[CloudProvider]:
+        """
+        Check out a clone for the duration of a ``with`` block.
+        """
+        clone = self.checkout()
+        try:
+            yield clone
+        finally:
+            self.checkin(clone)
+
+    def clear(self) -> None:
+        """
+        Drop every idle clone.
+        """
+        with self._lock:
+            self._idle.clear()
+
+    def rebind(self, result: T) -> T:
+        """
+        Return ``result``, a resource obtained through one of the pool's
+        clones, as bound to the pool's provider instead.
+
+        Resources keep the provider they were obtained through, and with it
+        its SDK clients, which would then be shared with the clone's next
+        user, and they only compare equal to resources of the same provider.
+        So results of work done on a clone are rebound before they are handed
+        to callers of the provider: the resource, and the resources and
+        sub-services it holds, are copied, with their references to the clone
+        and to its SDK objects replaced by the provider's own (see
+        :meth:`.BaseCloudProvider._rebind_native`), including those found in
+        lists, tuples and dicts. Results of the provider itself, or of no
+        provider, are returned as they are.
+        """
+        clone = getattr(result, '_provider', self._provider)
+        if clone is self._provider:
+            return result
+        return cast(T, self._rebound(result, clone, {}))
+
+    def _rebound(self, value: Any, clone: CloudProvider,
+                 memo: dict[int, Any]) -> Any:
+        if value is clone:
+            return self._provider
+        # Resources and their sub-services refer to each other, so each is
+        # copied once, as is each container holding any of them.
+        rebound = memo.get(id(value))
+        if rebound is not None:
+            return rebound
+        if type(value) is list:
+            rebound = memo[id(value)] = []
+            rebound.extend(self._rebound(item, clone, memo) for item in value)
+        elif type(value) is dict:
+            rebound = memo[id(value)] = {}
+            rebound.update((key, self._rebound(item, clone, memo))
+                           for key, item in value.items())
+        elif type(value) is tuple:
+            rebound = memo[id(value)] = tuple(
+                self._rebound(item, clone, memo) for item in value)
+        elif not isinstance(value, (CloudResource, PageableObjectMixin)):
+            return self._provider._rebind_native(value)
+        else:
+            rebound = memo[id(value)] = copy.copy(value)
+            attributes = vars(rebound)
+            for name, attribute in list(attributes.items()):
+                attributes[name] = self._rebound(attribute, clone, memo)
+        return rebound
+
+
+class ResultSnapshotCache(object):
+    """
+    A thread-safe, short-lived store of complete result sets, for lists that
+    are paged on the client side.
+
+    When a cloud offers no server-side paging for a listing, every page of a
+    ``list(limit, marker)`` walk would fetch the whole inventory again, only
+    to find the marker in it. Instead, the result set fetched for the first
+    page is kept here, along with the offset of each object id in it, and
+    the markers handed out reference it (see
+    :class:`.ClientPagedResultList`). Following pages are then served from
+    the snapshot, with no further calls to the cloud.
+
+    A snapshot is dropped once it has not been used for
+    ``result_snapshot_ttl`` seconds (``CB_RESULT_SNAPSHOT_TTL``, 60 if not
+    set), and at most ``result_snapshot_max_count`` snapshots are kept
+    (``CB_RESULT_SNAPSHOT_MAX_COUNT``, 32 if not set), the least recently
+    used being dropped first. A marker whose snapshot has been dropped
+    still works, at the cost of fetching the result set again.
+    """
+
+    CB_RESULT_SNAPSHOT_TTL = float(os.environ.get(
+        'CB_RESULT_SNAPSHOT_TTL', 60))
+    CB_RESULT_SNAPSHOT_MAX_COUNT = int(os.environ.get(
+        'CB_RESULT_SNAPSHOT_MAX_COUNT', 32))
+
+    def __init__(self, provider: "BaseCloudProvider") -> None:
+        self._ttl = float(provider._get_config_value(
+            'result_snapshot_ttl', self.CB_RESULT_SNAPSHOT_TTL))
+        self._max_count = max(0, int(provider._get_config_value(
+            'result_snapshot_max_count', self.CB_RESULT_SNAPSHOT_MAX_COUNT)))
+        self._lock = threading.Lock()
+        # token -> (time last used, objects, id -> offset), least recently
+        # used first.
+        self._snapshots: OrderedDict[
+            str, tuple[float, list[Any], dict[str, int]]] = OrderedDict()
+
+    def _evict(self, now: float) -> None:
+        while self._snapshots:
+            token, (used, _, _) = next(iter(self._snapshots.items()))
+            if (now - used <= self._ttl and
+                    len(self._snapshots) <= self._max_count):
+                break
+            del self._snapshots[token]
+
+    def put(self, objects: list[Any]) -> str | None:
+        """
+        Keep a snapshot of a result set.
+
+        :rtype: ``str``
+        :return: The token by which the snapshot can be retrieved, or
+                 ``None`` if snapshots are disabled.
+        """
+        if not self._max_count or self._ttl <= 0:
+            return None
+        index: dict[str, int] = {}
+        for offset, obj in enumerate(objects):
+            index.setdefault(str(obj.id), offset)
+        token = uuid.uuid4().hex
+        now = time.monotonic()
+        with self._lock:
+            self._snapshots[token] = (now, objects, index)
+            self._evict(now)
+        return token
+
+    def get(self, token: str
+            ) -> tuple[list[Any], dict[str, int]] | None:
+        """
+        Retrieve a snapshot kept with :meth:`put`, and mark it as used.
+
+        :rtype: ``tuple``
+        :return: The result set and the offset of each object id in it, or
+                 ``None`` if there is no such snapshot (anymore).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            snapshot = self._snapshots.pop(token, None)
+            if snapshot is None:
+                return None
+            _, objects, index = snapshot
+            self._snapshots[token] = (now, objects, index)
+            return objects, index
+
+    def clear(self) -> None:
+        """
+        Drop every snapshot.
+        """
+        with self._lock:
+            self._snapshots.clear()
+
+
 class BaseCloudProvider(CloudProvider):
 
     PROVIDER_ID: str
@@ -97,6 +342,8 @@ class BaseCloudProvider(CloudProvider):
         self.add_required_middleware()
         self._region_name: str | None = None
         self._zone_name: str | None = None
+        self._clone_pool = ProviderClonePool(self)
+        self._result_snapshots = ResultSnapshotCache(self)
 
     @property
     def region_name(self) -> str | None:
@@ -160,6 +407,16 @@ class BaseCloudProvider(CloudProvider):
             cloned_provider._zone_name = zone.name
         return cloned_provider
 
+    def _rebind_native(self, value: Any) -> Any:
+        """
+        Return ``value``, an attribute of a resource obtained through a clone
+        of this provider, as bound to this provider (see
+        :meth:`ProviderClonePool.rebind`). Providers whose resources hold SDK
+        objects tied to the clients of the provider they came from, rather
+        than plain data, override this to rebuild them on their own clients.
+        """
+        return value
+
     def _deepgetattr(self, obj: object, attr: str) -> Any:
         """Recurses through an attribute chain to get the ultimate value."""
         return functools.reduce(getattr, attr.split('.'), obj)
@@ -1,34 +1,45 @@
 """
 Base implementation for data objects exposed through a provider or service
 """
+import hashlib
 import inspect
 import io
 import itertools
+import json
 import logging
+import mmap
 import os
 import queue
+import random
 import re
 import shutil
+import sys
 import threading
 import time
 import uuid
+from collections import OrderedDict
 from concurrent.futures import FIRST_COMPLETED
 from concurrent.futures import Future
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import wait
+from contextlib import contextmanager
 from typing import Any
+from typing import Callable
 from typing import IO
+from typing import Iterable
 from typing import Iterator
 from typing import Sequence
 from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import cast
 
+from cloudbridge.interfaces.exceptions import ChecksumMismatchException
 from cloudbridge.interfaces.exceptions import \
     InvalidConfigurationException
 from cloudbridge.interfaces.exceptions import InvalidLabelException
 from cloudbridge.interfaces.exceptions import InvalidNameException
 from cloudbridge.interfaces.exceptions import InvalidValueException
+from cloudbridge.interfaces.exceptions import ProviderInternalException
 from cloudbridge.interfaces.exceptions import WaitStateException
 from cloudbridge.interfaces.provider import CloudProvider
 from cloudbridge.interfaces.resources import AttachmentInfo
@@ -61,6 +72,7 @@ from cloudbridge.interfaces.resources import SnapshotState
 from cloudbridge.interfaces.resources import Subnet
 from cloudbridge.interfaces.resources import SubnetState
 from cloudbridge.interfaces.resources import TransferConfig
+from cloudbridge.interfaces.resources import TransferManager
 from cloudbridge.interfaces.resources import UploadPart
 from cloudbridge.interfaces.resources import VMFirewall
 from cloudbridge.interfaces.resources import VMFirewallRule
@@ -82,6 +94,8 @@ log = logging.getLogger(__name__)
 # Element type for the generic pageable collections defined in this module
 # (mirrors ``cloudbridge.interfaces.resources.T``).
 T = TypeVar("T", bound=CloudResource)
+# Result type of the tasks run by a TransferWorkerPool.
+R = TypeVar("R")
 
 
 class BaseCloudResource(CloudResource):
@@ -212,13 +226,15 @@ class BaseResultList(ResultList[T]):
     def __init__(
             self, is_truncated: bool, marker: str | None,
             supports_total: bool, total: int | None = None,
-            data: Sequence[T] | None = None) -> None:
+            data: Sequence[T] | None = None,
+            prefixes: Sequence[str] | None = None) -> None:
         # call list constructor
         super(BaseResultList, self).__init__(data or [])
         self._marker = marker
         self._is_truncated = is_truncated
         self._supports_total = True if supports_total else False
         self._total = total
+        self._prefixes = list(prefixes or [])
 
     @property
     def marker(self) -> str | None:
@@ -236,6 +252,10 @@ class BaseResultList(ResultList[T]):
     def total_results(self) -> int:
         return cast(int, self._total)
 
+    @property
+    def prefixes(self) -> list[str]:
+        return self._prefixes
+
 
 class ServerPagedResultList(BaseResultList[T]):
     """
@@ -264,27 +284,66 @@ class ClientPagedResultList(BaseResultList[T]):
     This class can be used to wrap a full result list when an operation does
     not support server side paging. This class will then provide a paged view
     of the full result set entirely on the client side.
+
+    When there are more pages, the full result set is kept in the provider's
+    :class:`.ResultSnapshotCache`, and the returned marker references it.
+    ``objects`` may be given as a callable that fetches the result set, which
+    is then not called at all for pages served from a snapshot. Markers are
+    opaque; an object id is also accepted as a marker.
     """
 
-    def __init__(self, provider: CloudProvider, objects: Sequence[T],
+    _MARKER_PREFIX = 'cbpage:'
+    _TOKEN_LENGTH = 32
+
+    def __init__(self, provider: CloudProvider,
+                 objects: Sequence[T] | Callable[[], Iterable[T]],
                  limit: int | None = None, marker: str | None = None) -> None:
-        self._objects = list(objects)
         limit = limit or provider.config.default_result_limit
-        total_size = len(objects)
-        if marker:
-            from_marker = itertools.dropwhile(
-                lambda obj: not obj.id == marker, objects)
-            # skip one past the marker
-            next(from_marker, None)
-            objects = list(from_marker)
-        is_truncated = len(objects) > limit
-        results = list(itertools.islice(objects, limit))
+        snapshots = getattr(provider, '_result_snapshots', None)
+        token, marker_id = self._parse_marker(marker)
+        snapshot = snapshots.get(token) if snapshots and token else None
+        self._objects: list[T]
+        if snapshot is not None:
+            self._objects, index = snapshot
+        else:
+            self._objects = list(objects() if callable(objects) else objects)
+            index = None
+        start = 0
+        if marker_id is not None:
+            if index is None:
+                # skip one past the marker
+                start = next((offset + 1 for offset, obj
+                              in enumerate(self._objects)
+                              if str(obj.id) == marker_id),
+                             len(self._objects))
+            else:
+                start = index.get(marker_id, len(self._objects) - 1) + 1
+        results = self._objects[start:start + limit]
+        is_truncated = len(self._objects) > start + limit
+        next_marker = None
+        if is_truncated:
+            if snapshot is None:
+                token = snapshots.put(self._objects) if snapshots else None
+            next_marker = (self._MARKER_PREFIX + token + ':' + str(
+                results[-1].id) if token else results[-1].id)
         super(ClientPagedResultList, self).__init__(
-            is_truncated,
-            results[-1].id if is_truncated else None,
-            True, total=total_size,
+            is_truncated, next_marker, True, total=len(self._objects),
             data=results)
 
+    @classmethod
+    def _parse_marker(cls, marker: Any) -> tuple[str | None, str | None]:
+        # A marker is either "cbpage:<token>:<id>" or a bare object id. An
+        # empty marker, like no marker at all, starts from the beginning.
+        if not marker:
+            return None, None
+        marker = str(marker)
+        prefix_length = len(cls._MARKER_PREFIX)
+        token_end = prefix_length + cls._TOKEN_LENGTH
+        if (marker.startswith(cls._MARKER_PREFIX) and
+                marker[token_end:token_end + 1] == ':'):
+            return marker[prefix_length:token_end], marker[token_end + 1:]
+        return None, marker
+
     @property
     def supports_server_paging(self) -> bool:
         return False
@@ -298,15 +357,38 @@ class BasePageableObjectMixin(PageableObjectMixin[T]):
     """
     A mixin to provide iteration capability for a class
     that support a list(limit, marker) method.
+
+    When iterating a collection that is paged on the server, the next pages
+    can be fetched on a background thread while the current one is being
+    consumed, up to ``list_prefetch_depth`` pages ahead
+    (``CB_LIST_PREFETCH_DEPTH``, 0, i.e. no prefetching, if not set).
     """
 
+    CB_LIST_PREFETCH_DEPTH = int(os.environ.get('CB_LIST_PREFETCH_DEPTH', 0))
+
     def __iter__(self) -> Iterator[T]:
         for result in self.iter():
             yield result
 
-    def iter(self, **kwargs: Any) -> Iterator[T]:
+    def iter(self, prefetch: int | None = None, **kwargs: Any) -> Iterator[T]:
+        """
+        Iterate through every object, paging them in as needed. Any
+        ``kwargs`` are passed on to ``list``.
+
+        :type prefetch: ``int``
+        :param prefetch: The number of pages to fetch ahead of the one being
+                         consumed. Defaults to ``list_prefetch_depth``.
+        """
         result_list = self.list(**kwargs)
         if result_list.supports_server_paging:
+            if prefetch is None:
+                provider = cast(Any, self)._provider
+                prefetch = int(provider._get_config_value(
+                    'list_prefetch_depth', self.CB_LIST_PREFETCH_DEPTH))
+            if prefetch > 0 and result_list.is_truncated:
+                yield from self._iter_prefetched(result_list, prefetch,
+                                                 kwargs)
+                return
             for result in result_list:
                 yield result
             while result_list.is_truncated:
@@ -317,6 +399,103 @@ class BasePageableObjectMixin(PageableObjectMixin[T]):
             for result in result_list.data:
                 yield result
 
+    def find_iter(self, **kwargs: Any) -> Iterator[T]:
+        """
+        Iterate through the objects that ``find`` returns for ``kwargs``.
+
+        This default iterates through the result of ``find``. Services that
+        search on the client override it to fetch and filter pages only as
+        the matches are consumed, and those that search on the server to
+        follow every page of matches, so a caller that stops early does not
+        fetch the whole collection.
+        """
+        return iter(cast(Any, self).find(**kwargs))
+
+    def find_first(self, **kwargs: Any) -> T | None:
+        """
+        Return the first object that ``find`` would return for ``kwargs``,
+        or ``None`` if there is none, fetching no more pages than needed.
+        """
+        return next(self.find_iter(**kwargs), None)
+
+    def _on_provider(self, provider: CloudProvider
+                     ) -> "BasePageableObjectMixin[T] | None":
+        """
+        Return this service as found on ``provider``, a clone of its own, or
+        ``None`` if it cannot be found there.
+        """
+        pattern = getattr(self, '_service_event_pattern', 'provider')
+        if pattern == 'provider':
+            return None
+        return cast("BasePageableObjectMixin[T]", cast(Any, provider)
+                    ._deepgetattr(provider, pattern.split('.', 1)[1]))
+
+    @contextmanager
+    def _pager(self) -> Iterator["BasePageableObjectMixin[T]"]:
+        # Fetch pages on the background thread through a clone of the
+        # provider, where one can be had, so that the thread shares no SDK
+        # client with the caller. Their results are rebound to the provider
+        # (see _rebound) as they are yielded.
+        provider = cast(Any, self)._provider
+        clone_pool = getattr(provider, '_clone_pool', None)
+        if clone_pool is None:
+            yield self
+            return
+        with clone_pool.borrow() as clone:
+            yield self._on_provider(clone) or self
+
+    def _iter_prefetched(self, result_list: ResultList[T], depth: int,
+                         kwargs: dict[str, Any]) -> Iterator[T]:
+        # A single thread follows the chain of markers, keeping up to
+        # ``depth`` pages queued. Closing the iterator early stops it after
+        # its page in flight.
+        pages: "queue.Queue[ResultList[T] | BaseException | None]" = \
+            queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def put(item: "ResultList[T] | BaseException | None") -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch() -> None:
+            try:
+                with self._pager() as pager:
+                    page = result_list
+                    while page.is_truncated and not stop.is_set():
+                        page = pager.list(marker=page.marker, **kwargs)
+                        if not put(page):
+                            return
+                put(None)
+            except BaseException as e:
+                put(e)
+
+        thread = threading.Thread(target=fetch, name="cb-list-prefetch",
+                                  daemon=True)
+        thread.start()
+        try:
+            yield from result_list
+            while True:
+                item = pages.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield from map(self._rebound, item)
+        finally:
+            stop.set()
+
+    def _rebound(self, result: T) -> T:
+        # A result obtained through a clone of the provider, as bound to the
+        # provider itself (see ProviderClonePool.rebind).
+        clone_pool = getattr(cast(Any, self)._provider, '_clone_pool', None)
+        return clone_pool.rebind(result) if clone_pool is not None \
+            else result
+
 
 class BaseVMType(BaseCloudResource, VMType):
 
@@ -818,6 +997,801 @@ class BaseMultipartUpload(BaseCloudResource, MultipartUpload):
         return storage._bucket_objects
 
 
+class TransferJournal(object):
+    """
+    A small JSON sidecar file recording the progress of a resumable transfer,
+    so that repeating a failed transfer can pick up where it stopped.
+
+    The journal is bound to an ``identity`` describing what is being
+    transferred (e.g. the object's name, size and ETag). Progress saved under
+    a different identity is ignored rather than resumed, so a transfer never
+    mixes data from two versions of an object. Updates are thread-safe and
+    each one atomically replaces the file on disk.
+    """
+
+    def __init__(self, path: str, identity: dict[str, Any]) -> None:
+        self.path = path
+        self.identity = identity
+        self._state: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """
+        Load previously saved progress.
+
+        :rtype: ``bool``
+        :return: ``True`` if a journal for the same identity was found.
+        """
+        try:
+            with open(self.path, 'r') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(saved, dict) or \
+                saved.get('identity') != self.identity:
+            return False
+        self._state = saved.get('state') or {}
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._state.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._state[key] = value
+            self._save()
+
+    def append(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._state.setdefault(key, []).append(value)
+            self._save()
+
+    def remove(self) -> None:
+        with self._lock:
+            self._state = {}
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def _save(self) -> None:
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'identity': self.identity, 'state': self._state}, f)
+        os.replace(temp_path, self.path)
+
+
+class ObjectCache(object):
+    """
+    A size-bounded local disk cache of downloaded objects, shared by every
+    process that is configured to use the same directory.
+
+    Entries are keyed by the provider, bucket, name and ETag of an object, so
+    a new version of an object is never served from an older copy. Each
+    entry is written in full to a private file and renamed into place, so
+    readers in other processes only ever see whole entries. Entries are
+    delivered to the requested path as a hard link where possible, falling
+    back to a reflink or a plain copy, and then renamed over it, so
+    delivering is atomic too. Delivered files that are hard links share
+    their storage with the cache, and must be replaced rather than modified
+    in place.
+
+    Each use of an entry bumps its modification time, and once the cache
+    grows beyond ``max_size`` bytes, the least recently used entries are
+    removed.
+    """
+
+    def __init__(self, root: str, max_size: int) -> None:
+        self.root = root
+        self.max_size = max_size
+
+    @staticmethod
+    def key(obj: "BaseBucketObject",
+            encoding: str | None = None) -> str | None:
+        """
+        The cache key of the current version of ``obj``, or ``None`` if the
+        provider does not report an ETag for it, in which case it cannot be
+        cached. The content of an object decompressed from ``encoding`` is
+        cached apart from its content as stored.
+        """
+        etag = obj._etag
+        if not etag:
+            return None
+        identity = [obj._provider.PROVIDER_ID, obj.bucket.name, obj.name,
+                    etag]
+        if encoding:
+            identity.append(encoding)
+        return hashlib.sha256(json.dumps(identity).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def fetch(self, key: str, path: str,
+              download: Callable[[str], None]) -> None:
+        """
+        Deliver the entry ``key`` to ``path``. On a miss, ``download(target)``
+        is called to write the object to ``target`` (atomically, as
+        :meth:`BaseBucketObject.download_to_file` does), and the new entry is
+        added to the cache.
+        """
+        entry = self._entry_path(key)
+        if self._deliver(entry, path):
+            log.debug("Delivered %s from the object cache", path)
+            return
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        download(entry)
+        self._evict(keep=entry)
+        if not self._deliver(entry, path):
+            # Evicted by another process in the meantime.
+            download(path)
+
+    def _deliver(self, entry: str, path: str) -> bool:
+        try:
+            os.utime(entry)  # most recently used
+        except FileNotFoundError:
+            return False
+        if os.path.exists(path) and os.path.samefile(entry, path):
+            return True
+        temp_path = f"{path}.{uuid.uuid4().hex}.cbpart"
+        try:
+            self._link(entry, temp_path)
+            os.replace(temp_path, path)
+        except FileNotFoundError:
+            if os.path.exists(entry):
+                raise
+            return False
+        finally:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return True
+
+    @staticmethod
+    def _link(source: str, target: str) -> None:
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass  # across file systems, or not supported
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            if sys.platform == 'linux':
+                import fcntl
+                try:
+                    # FICLONE: share the blocks on copy-on-write file systems
+                    fcntl.ioctl(dst.fileno(), 0x40049409, src.fileno())
+                    return
+                except OSError:
+                    pass
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    def _evict(self, keep: str) -> None:
+        # Remove the least recently used entries until the cache fits. Files
+        # being written (``.cbpart``) and resumable-download journals are
+        # not entries and are left alone.
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if len(filename) != 64 or '.' in filename:
+                    continue
+                entry = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(entry)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+                total += stat.st_size
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                return
+            if entry == keep:
+                continue
+            try:
+                os.remove(entry)
+            except FileNotFoundError:
+                pass  # evicted by another process
+            total -= size
+
+
+class Crc32cHash(object):
+    """
+    A CRC32C with the interface of a :mod:`hashlib` hash. The digest is the
+    CRC in big-endian byte order, as Google Cloud Storage reports it.
+    """
+
+    def __init__(self) -> None:
+        self._crc = 0
+
+    def update(self, data: bytes | bytearray | memoryview) -> None:
+        self._crc = cb_helpers.crc32c(data, self._crc)
+
+    def digest(self) -> bytes:
+        return self._crc.to_bytes(4, 'big')
+
+
+class TransferChecksum(object):
+    """
+    Digests of the parts of a transfer, computed from each part's data as it
+    is sent or received, so that the object can be verified without reading
+    it a second time.
+
+    Each part is added under a key that orders it within the object: its part
+    number for uploads, or its offset for downloads. The digests are combined
+    in that order into a checksum comparable with one kept by the provider
+    (see :meth:`BaseBucketObject._stored_checksum`), which is either a digest
+    of the whole content, or a digest of the concatenated digests of the
+    parts, as in the ETag of an S3 multipart upload. A digest of the whole
+    content can only be derived from several parts for CRC32C.
+    """
+
+    ALGORITHMS = ('crc32c', 'md5', 'sha256')
+
+    def __init__(self, algorithm: str) -> None:
+        if algorithm not in self.ALGORITHMS:
+            raise InvalidValueException('checksum', algorithm)
+        self.algorithm = algorithm
+        self._parts: dict[int, tuple[bytes, int]] = {}
+        self._lock = threading.Lock()
+
+    def new(self) -> Any:
+        """
+        Return a new hash object of this algorithm, with ``update()`` and
+        ``digest()`` methods.
+        """
+        if self.algorithm == 'crc32c':
+            return Crc32cHash()
+        return hashlib.new(self.algorithm, usedforsecurity=False)
+
+    def add(self, key: int, digest: bytes, length: int) -> None:
+        with self._lock:
+            self._parts[key] = (digest, length)
+
+    def add_data(self, key: int, data: bytes | bytearray | memoryview
+                 ) -> bytes:
+        """
+        Digest ``data`` as the part at ``key``, and return its digest.
+        """
+        digest = self.new()
+        digest.update(data)
+        value = cast(bytes, digest.digest())
+        self.add(key, value, memoryview(data).nbytes)
+        return value
+
+    def _ordered(self) -> list[tuple[bytes, int]]:
+        with self._lock:
+            return [self._parts[key] for key in sorted(self._parts)]
+
+    def whole(self) -> bytes | None:
+        """
+        The digest of the whole content, or ``None`` if it cannot be derived
+        from the digests of the parts.
+        """
+        parts = self._ordered()
+        if not parts:
+            return cast(bytes, self.new().digest())
+        if len(parts) == 1:
+            return parts[0][0]
+        if self.algorithm != 'crc32c':
+            return None
+        crc = 0
+        for digest, length in parts:
+            crc = cb_helpers.crc32c_combine(
+                crc, int.from_bytes(digest, 'big'), length)
+        return crc.to_bytes(4, 'big')
+
+    def composite(self, part_size: int) -> bytes | None:
+        """
+        The digest of the concatenated digests of the parts, or ``None`` if
+        the content was not transferred in parts of ``part_size`` bytes (the
+        last one excepted).
+        """
+        parts = self._ordered()
+        if not parts or \
+                any(length != part_size for _, length in parts[:-1]) or \
+                not 0 < parts[-1][1] <= part_size:
+            return None
+        digest = self.new()
+        for part_digest, _ in parts:
+            digest.update(part_digest)
+        return cast(bytes, digest.digest())
+
+    def verify(self, name: str,
+               stored: tuple[bytes, int | None] | None) -> None:
+        """
+        Compare the checksum of the transferred data with the ``stored``
+        one, as returned by :meth:`BaseBucketObject._stored_checksum`.
+
+        :raise ChecksumMismatchException: If they differ.
+        """
+        if stored is None:
+            log.warning("Cannot verify %s: the provider keeps no %s checksum "
+                        "for it", name, self.algorithm)
+            return
+        expected, part_size = stored
+        actual = self.whole() if part_size is None else \
+            self.composite(part_size)
+        if actual is None:
+            log.warning("Cannot verify %s: its %s checksum cannot be derived "
+                        "from the parts transferred", name, self.algorithm)
+            return
+        if actual != expected:
+            raise ChecksumMismatchException(
+                "The {0} checksum of {1} is {2}, but the data transferred "
+                "has {3}".format(self.algorithm, name, expected.hex(),
+                                 actual.hex()))
+        log.debug("Verified the %s checksum of %s", self.algorithm, name)
+
+
+class TransferWorkerPool(object):
+    """
+    A bounded pool of threads that carry out the requests of object
+    transfers, such as uploading a part or fetching a range.
+
+    To stay safe even on providers whose SDK client/connection is not
+    thread-safe, every task is handed a bucket-object service of its own
+    cloned provider (see :meth:`.CloudProvider.clone`), so no provider state
+    is shared between threads. A clone is checked out of the provider's
+    :class:`.ProviderClonePool` when a worker first needs one, and is then
+    reused by every task, so a pool can serve any number of transfers, one
+    after another or interleaved, without further setup, and workers that
+    are never busy cost nothing. The clones go back to the provider on
+    shutdown, for the next pool to reuse.
+    """
+
+    def __init__(self, provider: CloudProvider, max_workers: int) -> None:
+        self._clone_pool = cast("BaseCloudProvider", provider)._clone_pool
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._clones: list[CloudProvider] = []
+        self._clones_lock = threading.Lock()
+        self._services: "queue.Queue[BucketObjectService]" = queue.Queue()
+
+    def submit(self, fn: Callable[..., R], *args: Any) -> "Future[R]":
+        """
+        Run ``fn(service, *args)`` on a worker, where ``service`` is that
+        worker's bucket-object service.
+        """
+        return self._executor.submit(self._run, fn, *args)
+
+    def _run(self, fn: Callable[..., R], *args: Any) -> R:
+        try:
+            service = self._services.get_nowait()
+        except queue.Empty:
+            # Every clone so far is busy on another worker.
+            clone = self._clone_pool.checkout()
+            with self._clones_lock:
+                self._clones.append(clone)
+            service = cast("BaseStorageService",
+                           clone.storage)._bucket_objects
+        try:
+            return fn(service, *args)
+        finally:
+            self._services.put(service)
+
+    def run_windowed(
+            self, tasks: Iterable[tuple[Callable[..., R], tuple[Any, ...]]],
+            window: "int | AdaptiveConcurrency") -> list[R]:
+        """
+        Run ``tasks``, each a ``(fn, args)`` pair as taken by :meth:`submit`,
+        with at most ``window`` of them in flight, and return their results in
+        the order they finished.
+
+        Tasks are taken from the iterable only as earlier ones finish, so it
+        can produce them lazily, and transfers sharing the pool take turns
+        rather than queueing all of their parts ahead of one another. If a
+        task fails, no more are started, and the error is raised once the
+        tasks still in flight have finished. The ``window`` may be an
+        :class:`AdaptiveConcurrency`, whose current size is used each time a
+        task is started.
+        """
+        tasks = iter(tasks)
+        results: list[R] = []
+        in_flight: set[Future[R]] = set()
+        try:
+            while True:
+                while len(in_flight) < (window if isinstance(window, int)
+                                        else window.size):
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    fn, args = task
+                    in_flight.add(self.submit(fn, *args))
+                if not in_flight:
+                    return results
+                done, in_flight = wait(in_flight,
+                                       return_when=FIRST_COMPLETED)
+                for future in done:
+                    results.append(future.result())
+        finally:
+            wait(in_flight)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        while self._clones:
+            self._clone_pool.checkin(self._clones.pop())
+
+    def __enter__(self) -> "TransferWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+
+class AdaptiveConcurrency(object):
+    """
+    The number of parts a transfer keeps in flight, adjusted to the
+    throughput it observes.
+
+    Throughput is measured over rounds, each lasting until as many parts as
+    are allowed in flight have finished, so that it reflects both the size
+    and the latency of the parts. Starting from a couple of parts, the number
+    doubles while each round is markedly faster than the best so far; once a
+    round is not, it settles back on the best number seen, and every few
+    rounds probes one part above it, in case conditions have improved. When a
+    request is throttled, the number is halved, and grows again one part per
+    faster round.
+
+    :meth:`call` makes the request of a part through this controller: it is
+    timed, and retried with a randomised exponential backoff if
+    ``is_throttled`` says it failed for being throttled.
+    """
+
+    # A round counts as faster only if it beats the best by this fraction.
+    GAIN = 0.1
+    # Rounds spent at a settled size before probing one part above it.
+    PROBE_ROUNDS = 8
+    # How many times a throttled part is retried, and the base and cap, in
+    # seconds, of the backoff between attempts.
+    RETRIES = 5
+    BACKOFF = 0.5
+    MAX_BACKOFF = 20.0
+
+    def __init__(self, ceiling: int,
+                 is_throttled: Callable[[BaseException], bool],
+                 initial: int = 2) -> None:
+        self.ceiling = max(1, ceiling)
+        self._is_throttled = is_throttled
+        self._size = min(max(1, initial), self.ceiling)
+        self._lock = threading.Lock()
+        self._slow_start = True
+        self._best_rate = 0.0
+        self._best_size = self._size
+        self._settled_rounds = 0
+        self._start_round()
+
+    @property
+    def size(self) -> int:
+        """The number of parts currently allowed in flight."""
+        return self._size
+
+    def _start_round(self) -> None:
+        self._round_start = time.monotonic()
+        self._round_bytes = 0
+        self._round_parts = 0
+
+    def record(self, nbytes: int) -> None:
+        """Record that a part of ``nbytes`` bytes has been transferred."""
+        with self._lock:
+            self._round_bytes += nbytes
+            self._round_parts += 1
+            if self._round_parts < self._size:
+                return
+            elapsed = time.monotonic() - self._round_start
+            rate = self._round_bytes / max(elapsed, 1e-6)
+            self._end_round(rate)
+            self._start_round()
+
+    def _end_round(self, rate: float) -> None:
+        if rate > self._best_rate * (1 + self.GAIN):
+            self._best_rate, self._best_size = rate, self._size
+            self._settled_rounds = 0
+            grown = self._size * 2 if self._slow_start else self._size + 1
+            self._size = min(grown, self.ceiling)
+            return
+        # The last increase bought nothing; settle on the best size.
+        self._slow_start = False
+        self._size = self._best_size
+        self._settled_rounds += 1
+        if self._settled_rounds >= self.PROBE_ROUNDS:
+            # Measure the settled size afresh and try one part more.
+            self._best_rate = rate
+            self._settled_rounds = 0
+            self._size = min(self._best_size + 1, self.ceiling)
+        log.debug("Transfer concurrency settled at %d parts (%.0f B/s)",
+                  self._size, rate)
+
+    def throttled(self) -> None:
+        """Back off after a request was throttled."""
+        with self._lock:
+            self._slow_start = False
+            self._size = max(1, self._size // 2)
+            self._best_size = self._size
+            self._best_rate = 0.0
+            self._settled_rounds = 0
+            self._start_round()
+        log.debug("Throttled; transfer concurrency reduced to %d parts",
+                  self._size)
+
+    def call(self, nbytes: int, fn: Callable[..., R], *args: Any) -> R:
+        """
+        Make the request ``fn(*args)``, which transfers ``nbytes`` bytes,
+        retrying it if it is throttled, and record it once it succeeds.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if attempt >= self.RETRIES or not self._is_throttled(e):
+                    raise
+                attempt += 1
+                self.throttled()
+                time.sleep(random.uniform(
+                    0, min(self.MAX_BACKOFF, self.BACKOFF * 2 ** attempt)))
+                continue
+            self.record(nbytes)
+            return result
+
+
+class MemoryPartReader(io.RawIOBase):
+    """
+    A read-only, seekable file object over a ``memoryview``.
+
+    Uploads from a file map it into memory and hand each part to
+    ``upload_part`` as one of these, over a slice of the mapping, so a part
+    is never copied into a buffer of its own; the SDK streams it from the
+    page cache instead. :meth:`read_part` splits off the next part without
+    copying. Closing the reader releases its view of the mapping.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        super(MemoryPartReader, self).__init__()
+        self._view = view
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._view.nbytes
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self)
+        if offset < 0:
+            raise ValueError("negative seek position {0}".format(offset))
+        self._position = offset
+        return offset
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = len(self) if size is None or size < 0 else \
+            self._position + size
+        data = bytes(self._view[self._position:end])
+        self._position += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer: Any) -> int:
+        target = memoryview(buffer).cast('B')
+        data = self._view[self._position:self._position + target.nbytes]
+        count = data.nbytes
+        target[:count] = data
+        self._position += count
+        return count
+
+    def getbuffer(self) -> memoryview:
+        """
+        Return the view this reader reads from, without copying.
+        """
+        return self._view
+
+    def read_part(self, size: int) -> "MemoryPartReader":
+        """
+        Return a reader over the next ``size`` bytes (fewer only at the end)
+        and move past them, without copying.
+        """
+        part = MemoryPartReader(
+            self._view[self._position:self._position + size])
+        self._position += len(part)
+        return part
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super(MemoryPartReader, self).close()
+
+
+class IterableReader(io.RawIOBase):
+    """
+    A read-only, non-seekable file object over an iterable of byte chunks,
+    such as a generator. Chunks are pulled from the iterable only as they are
+    read, so the content is never held in memory as a whole.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        super(IterableReader, self).__init__()
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b'')
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        target = memoryview(buffer).cast('B')
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk).cast('B')
+        count = min(target.nbytes, self._pending.nbytes)
+        target[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+    def __next__(self) -> bytes:
+        # Iterating yields the chunks, rather than lines.
+        if self._pending:
+            chunk = bytes(self._pending)
+            self._pending = memoryview(b'')
+            return chunk
+        return next(self._chunks)
+
+
+class BaseBucketObjectReader(io.RawIOBase):
+    """
+    A read-only, seekable file object over a bucket object, as returned by
+    :meth:`.BucketObject.open`.
+
+    Content is fetched in ``block_size`` blocks through
+    :meth:`.BucketObjectService.download_range` and kept in a small LRU cache
+    of ``cache_blocks`` blocks. When reads move sequentially from one block to
+    the next, the following ``read_ahead`` blocks are fetched on a thread pool
+    so the next read is already in memory. The read-ahead runs on a
+    :class:`TransferWorkerPool`, so each background worker reads through its
+    own cloned provider and no provider state is shared between threads;
+    reads on the caller's thread use the object's own provider. The clones
+    are checked out of the provider's :class:`.ProviderClonePool` only as
+    workers need them, and returned to it when the reader is closed.
+    """
+
+    def __init__(self, obj: "BaseBucketObject", block_size: int,
+                 cache_blocks: int, read_ahead: int) -> None:
+        super(BaseBucketObjectReader, self).__init__()
+        self._obj = obj
+        self._bucket = obj.bucket
+        self._name = obj.name
+        self._size = obj.size
+        self._block_size = block_size
+        self._read_ahead = max(0, read_ahead)
+        # Always keep room for the block being read plus its read-ahead, or
+        # prefetched blocks would be evicted before they are used.
+        self._cache_blocks = max(1, cache_blocks, self._read_ahead + 1)
+        self._position = 0
+        self._last_block = -1
+        self._cache: "OrderedDict[int, bytes]" = OrderedDict()
+        self._pending: dict[int, Future[bytes]] = {}
+        self._workers: TransferWorkerPool | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._check_open()
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError("Invalid whence ({0})".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {0}".format(position))
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        self._check_open()
+        view = memoryview(buffer).cast('B')
+        written = 0
+        while written < len(view) and self._position < self._size:
+            index, start = divmod(self._position, self._block_size)
+            block = self._get_block(index)
+            count = min(len(view) - written, len(block) - start)
+            if count <= 0:
+                # The object is shorter than when it was opened.
+                break
+            view[written:written + count] = block[start:start + count]
+            written += count
+            self._position += count
+        return written
+
+    def readall(self) -> bytes:
+        return self.read(max(0, self._size - self._position)) or b''
+
+    def close(self) -> None:
+        if not self.closed:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            if self._workers:
+                # Returns the clones, once no fetch is using them.
+                self._workers.shutdown()
+                self._workers = None
+            self._cache.clear()
+        super(BaseBucketObjectReader, self).close()
+
+    def _fetch(self, service: "BucketObjectService", index: int) -> bytes:
+        offset = index * self._block_size
+        length = min(self._block_size, self._size - offset)
+        return service.download_range(self._bucket, self._name, offset, length)
+
+    def _get_block(self, index: int) -> bytes:
+        block = self._cache.get(index)
+        if block is not None:
+            self._cache.move_to_end(index)
+        else:
+            future = self._pending.pop(index, None)
+            if future is not None and not future.cancelled():
+                block = future.result()
+            else:
+                block = self._fetch(self._obj._bucket_objects, index)
+            self._cache[index] = block
+            while len(self._cache) > self._cache_blocks:
+                self._cache.popitem(last=False)
+        if index == self._last_block + 1:
+            self._schedule_read_ahead(index)
+        self._last_block = index
+        return block
+
+    def _schedule_read_ahead(self, index: int) -> None:
+        if not self._read_ahead:
+            return
+        last = (self._size - 1) // self._block_size
+        wanted = range(index + 1, min(index + self._read_ahead, last) + 1)
+        # Drop prefetches left behind by an earlier seek.
+        for stale in [i for i in self._pending if i not in wanted]:
+            self._pending.pop(stale).cancel()
+        if not wanted:
+            return
+        if self._workers is None:
+            self._workers = TransferWorkerPool(self._obj._provider,
+                                               self._read_ahead)
+        for i in wanted:
+            if i not in self._cache and i not in self._pending:
+                self._pending[i] = self._workers.submit(self._fetch, i)
+
+
 class BaseBucketObject(BaseCloudResource, BucketObject):
 
     # Regular expression for valid bucket keys.
@@ -837,9 +1811,31 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
     # Portable floor: S3 and Swift reject non-final parts smaller than 5 MiB,
     # so part sizes below this are rejected up-front.
     CB_MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+    # The provider's limits on the number of parts of a multipart upload, and
+    # on the size of each (S3: 10,000 parts of up to 5 GiB).
+    CB_MULTIPART_MAX_PARTS = 10000
+    CB_MULTIPART_MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
     # Number of parts uploaded in parallel by the transparent multipart path.
     CB_MULTIPART_MAX_CONCURRENCY = int(os.environ.get(
         'CB_MULTIPART_MAX_CONCURRENCY', 5))
+    # The most parts in flight when a transfer adapts its concurrency.
+    CB_MULTIPART_ADAPTIVE_MAX_CONCURRENCY = int(os.environ.get(
+        'CB_MULTIPART_ADAPTIVE_MAX_CONCURRENCY', 32))
+    # Size of each ranged read made by the random-access reader (``open``).
+    CB_READER_BLOCK_SIZE = int(os.environ.get(
+        'CB_READER_BLOCK_SIZE', 8 * 1024 * 1024))       # 8 MiB
+    # Number of blocks the random-access reader keeps cached in memory.
+    CB_READER_CACHE_BLOCKS = int(os.environ.get(
+        'CB_READER_CACHE_BLOCKS', 8))
+    # Number of blocks prefetched in the background during sequential reads.
+    CB_READER_READ_AHEAD = int(os.environ.get(
+        'CB_READER_READ_AHEAD', 2))
+    # Directory of the local object cache used by downloads; unset, objects
+    # are not cached.
+    CB_OBJECT_CACHE_DIR = os.environ.get('CB_OBJECT_CACHE_DIR')
+    # Size in bytes the local object cache is kept within.
+    CB_OBJECT_CACHE_MAX_SIZE = int(os.environ.get(
+        'CB_OBJECT_CACHE_MAX_SIZE', 10 * 1024 * 1024 * 1024))  # 10 GiB
 
     def __init__(self, provider: CloudProvider) -> None:
         super(BaseBucketObject, self).__init__(provider)
@@ -851,8 +1847,11 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
             "BucketObject subclasses must implement the bucket property")
 
     def _upload_single_shot(
-            self, data: str | bytes | IO[bytes]) -> BucketObject:
-        # Provider-implemented single-shot (non-multipart) upload.
+            self, data: str | bytes | IO[bytes],
+            config: TransferConfig | None = None) -> BucketObject:
+        # Provider-implemented single-shot (non-multipart) upload. If
+        # ``config`` names a compression, ``data`` is already compressed with
+        # it (see :meth:`_upload_encoding`).
         raise NotImplementedError(
             "BucketObject subclasses must implement _upload_single_shot")
 
@@ -863,6 +1862,79 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         storage = cast("BaseStorageService", self._provider.storage)
         return storage._bucket_objects
 
+    @property
+    def _etag(self) -> str | None:
+        """
+        The provider's entity tag for the object's current content, or
+        ``None`` if it is not known. Used to tell whether data transferred
+        earlier still belongs to the same version of the object.
+        """
+        return None
+
+    def _stored_checksum(self, algorithm: str
+                         ) -> tuple[bytes, int | None] | None:
+        """
+        The checksum of the given ``algorithm`` that the provider keeps for
+        the object's current content, as a ``(digest, part_size)`` pair, or
+        ``None`` if it keeps none. ``part_size`` is ``None`` for a digest of
+        the whole content, or the size of every part but the last for a
+        digest of the concatenated digests of the parts (see
+        :class:`TransferChecksum`).
+        """
+        return None
+
+    @property
+    def _content_encoding(self) -> str | None:
+        """
+        The ``Content-Encoding`` the object is stored with, or ``None``.
+        """
+        return None
+
+    def _set_content_encoding(self, service: "BucketObjectService",
+                              encoding: str) -> None:
+        # Provider-implemented: record the Content-Encoding of the content
+        # just uploaded, through ``service``, unless it was already sent with
+        # the upload itself.
+        raise NotImplementedError(
+            "BucketObject subclasses must implement _set_content_encoding")
+
+    def _ranged_reads_of_encoding(self, encoding: str) -> bool:
+        """
+        Whether the content as stored of an object with this content
+        ``encoding`` can be fetched as ranges. Providers whose HTTP client
+        decompresses encoded responses on its own return ``False``, as a
+        range of a compressed stream cannot be decompressed by itself.
+        """
+        return True
+
+    @staticmethod
+    def _upload_encoding(config: TransferConfig | None = None) -> str | None:
+        if config is None or config.compression in (None, 'identity'):
+            return None
+        cb_helpers.check_content_encoding(config.compression)
+        return config.compression
+
+    def _decoded_encoding(self, config: TransferConfig | None = None
+                          ) -> str | None:
+        # The encoding to decompress downloads from: the one named by the
+        # config, or else the one the object is stored with, if it is one
+        # CloudBridge can decompress.
+        if config is not None and config.compression is not None:
+            return self._upload_encoding(config)
+        encoding = self._content_encoding
+        return encoding if encoding in cb_helpers.CONTENT_ENCODINGS else None
+
+    @staticmethod
+    def _content_chunks(content: Any) -> Iterator[bytes]:
+        # Chunks of content given as text, bytes, a stream or an iterable.
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if isinstance(content, (bytes, bytearray)):
+            return iter([bytes(content)])
+        if hasattr(content, 'read'):
+            return iter(lambda: content.read(1024 * 1024), b'')
+        return iter(content)
+
     @staticmethod
     def is_valid_resource_name(name: str) -> bool:
         return (True if BaseBucketObject.CB_NAME_PATTERN.match(name)
@@ -878,6 +1950,22 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
                 "in: http://docs.aws.amazon.com/AmazonS3/latest/dev/UsingMeta"
                 "data.html#object-key-guidelines" % name)
 
+    def iter_content(self) -> Iterable[bytes]:
+        # Content stored compressed, with a Content-Encoding, is decompressed
+        # as it is read.
+        content = self._iter_content()
+        encoding = self._decoded_encoding()
+        if encoding is None:
+            return content
+        return IterableReader(cb_helpers.decompress_chunks(
+            self._content_chunks(content), encoding))
+
+    def _iter_content(self) -> Iterable[bytes]:
+        # Provider-implemented: the content as stored, as an iterable that
+        # also supports ``read``.
+        raise NotImplementedError(
+            "BucketObject subclasses must implement _iter_content")
+
     def save_content(self, target_stream: IO[bytes]) -> None:
         # iter_content() is declared Iterable[bytes] on the interface, but the
         # concrete objects returned by providers also support .read(); cast so
@@ -885,6 +1973,23 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         shutil.copyfileobj(
             cast("SupportsRead[bytes]", self.iter_content()), target_stream)
 
+    def open(self, block_size: int | None = None,
+             cache_blocks: int | None = None,
+             read_ahead: int | None = None) -> io.RawIOBase:
+        if block_size is None:
+            block_size = int(self._provider._get_config_value(
+                'reader_block_size', self.CB_READER_BLOCK_SIZE))
+        if cache_blocks is None:
+            cache_blocks = int(self._provider._get_config_value(
+                'reader_cache_blocks', self.CB_READER_CACHE_BLOCKS))
+        if read_ahead is None:
+            read_ahead = int(self._provider._get_config_value(
+                'reader_read_ahead', self.CB_READER_READ_AHEAD))
+        if block_size < 1:
+            raise InvalidValueException('block_size', block_size)
+        return BaseBucketObjectReader(self, block_size, cache_blocks,
+                                      read_ahead)
+
     def download_to_file(self, path: str,
                          config: TransferConfig | None = None) -> None:
         # Assemble the object in a private file alongside the destination and
@@ -894,9 +1999,99 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         # let concurrent downloads truncate each other's file - or rename it
         # away mid-transfer - and would destroy a previously downloaded copy
         # when a transfer fails.
+        encoding = self._decoded_encoding(config)
+        self._download_cached(
+            path, config, lambda target: self._download_decoded(
+                target, config, encoding,
+                lambda raw_path: self._download_file(raw_path, config)),
+            encoding=encoding)
+
+    def _download_file(self, path: str,
+                       config: TransferConfig | None = None) -> None:
+        if config is not None and config.resumable:
+            size = self.size
+            if size > self._multipart_threshold(config):
+                self._download_resumable(path, size, config)
+                return
+        self._download_via_part_file(
+            path, lambda part_path: self._download_to_path(part_path, config))
+
+    def _download_decoded(self, path: str, config: TransferConfig | None,
+                          encoding: str | None,
+                          download: Callable[[str], None]) -> None:
+        # Have ``download(raw_path)`` fetch the content as stored, then
+        # decompress it into ``path``. Where ranges of the stored content
+        # cannot be fetched, it is streamed instead.
+        if encoding is None:
+            download(path)
+            return
+        if not self._ranged_reads_of_encoding(encoding):
+            self._download_via_part_file(
+                path, lambda part_path: self._write_chunks(
+                    part_path, self.iter_content()))
+            return
+        # A resumable download keeps the stored content it has fetched at a
+        # path that the next attempt can find.
+        resumable = config is not None and config.resumable
+        raw_path = f"{path}.cbraw" if resumable else \
+            f"{path}.{uuid.uuid4().hex}.cbraw"
+        download(raw_path)
+        try:
+            with open(raw_path, 'rb') as raw:
+                self._download_via_part_file(
+                    path, lambda part_path: self._write_chunks(
+                        part_path, cb_helpers.decompress_chunks(
+                            self._content_chunks(raw), encoding)))
+        finally:
+            os.remove(raw_path)
+
+    @staticmethod
+    def _write_chunks(path: str, chunks: Iterable[bytes]) -> None:
+        with open(path, 'wb') as f:
+            for chunk in BaseBucketObject._content_chunks(chunks):
+                f.write(chunk)
+
+    def _object_cache(self, config: TransferConfig | None = None
+                      ) -> ObjectCache | None:
+        if config is not None and not config.cache:
+            return None
+        root = self._provider._get_config_value(
+            'object_cache_dir', self.CB_OBJECT_CACHE_DIR)
+        if not root:
+            return None
+        return ObjectCache(os.path.expanduser(root), int(
+            self._provider._get_config_value(
+                'object_cache_max_size', self.CB_OBJECT_CACHE_MAX_SIZE)))
+
+    def _download_cached(self, path: str, config: TransferConfig | None,
+                         download: Callable[[str], None],
+                         validate: bool = True,
+                         encoding: str | None = None) -> None:
+        # Serve the download from the local object cache, if one is
+        # configured, calling ``download(target)`` to fill it on a miss.
+        # Unless the caller has just fetched this object's metadata, it is
+        # refreshed first (a HEAD request), so that the current version of
+        # the object is looked up.
+        cache = self._object_cache(config)
+        if cache is None:
+            download(path)
+            return
+        if validate:
+            self.refresh()
+        key = cache.key(self, encoding)
+        if key is None or self.size > cache.max_size:
+            download(path)
+            return
+        cache.fetch(key, path, download)
+
+    @staticmethod
+    def _download_via_part_file(path: str,
+                                fetch: Callable[[str], None]) -> None:
+        # Have ``fetch`` write the object to a private file beside ``path``,
+        # then move it into place, or remove it if the transfer fails.
         part_path = f"{path}.{uuid.uuid4().hex}.cbpart"
         try:
-            self._download_to_path(part_path, config)
+            fetch(part_path)
             os.replace(part_path, path)
         except BaseException:
             try:
@@ -905,6 +2100,13 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
                 pass
             raise
 
+    def _download_ranged_to_path(self, path: str, size: int,
+                                 config: TransferConfig | None = None,
+                                 pool: TransferWorkerPool | None = None
+                                 ) -> None:
+        with open(path, 'w+b') as f:
+            self._download_ranged(f, size, config, pool=pool)
+
     def _download_to_path(self, path: str,
                           config: TransferConfig | None = None) -> None:
         """
@@ -917,74 +2119,212 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         """
         size = self.size
         if size <= self._multipart_threshold(config):
+            checksum = self._transfer_checksum(config)
             with open(path, 'wb') as f:
-                self.save_content(f)
+                if checksum is None:
+                    for chunk in self._content_chunks(self._iter_content()):
+                        f.write(chunk)
+                    return
+                digest = checksum.new()
+                for chunk in self._content_chunks(self._iter_content()):
+                    f.write(chunk)
+                    digest.update(chunk)
+            checksum.add(0, digest.digest(), size)
+            checksum.verify(self.name, self._stored_checksum(
+                checksum.algorithm))
             return
-        with open(path, 'w+b') as f:
-            self._download_ranged(f, size, config)
+        self._download_ranged_to_path(path, size, config)
+
+    def _download_resumable(self, path: str, size: int,
+                            config: TransferConfig,
+                            pool: TransferWorkerPool | None = None) -> None:
+        """
+        Ranged download that survives failures.
+
+        The object is assembled in ``<path>.cbpart`` and every range written
+        is recorded in a :class:`TransferJournal` beside it. If the transfer
+        fails, both are kept; the next call for the same version of the
+        object (same name, size and ETag, and the same part size) fetches only
+        the ranges the journal does not list. This always goes through the
+        generic ranged driver, even on providers that override
+        :meth:`_download_to_path` with a native downloader, since those do not
+        expose which ranges have completed.
+        """
+        part_path = f"{path}.cbpart"
+        identity = {
+            'name': self.name,
+            'size': size,
+            'etag': self._etag,
+            'part_size': self._multipart_part_size(config, size)}
+        if config.checksum:
+            identity['checksum'] = config.checksum
+        journal = TransferJournal(f"{part_path}.journal", identity)
+        resuming = (journal.load() and os.path.exists(part_path) and
+                    os.path.getsize(part_path) == size)
+        if resuming:
+            log.debug("Resuming download of %s into %s", self.name, path)
+        else:
+            journal.remove()
+        try:
+            with open(part_path, 'r+b' if resuming else 'w+b') as f:
+                self._download_ranged(f, size, config, journal, pool)
+        except ChecksumMismatchException:
+            # Some range is corrupt, and there is no telling which, so the
+            # next attempt starts over.
+            journal.remove()
+            os.remove(part_path)
+            raise
+        os.replace(part_path, path)
+        journal.remove()
 
     def _download_ranged(self, target: IO[bytes], size: int,
-                         config: TransferConfig | None = None) -> None:
+                         config: TransferConfig | None = None,
+                         journal: TransferJournal | None = None,
+                         pool: TransferWorkerPool | None = None) -> None:
         """
         Fetch the object as ranged reads across a bounded thread pool,
         writing each range at its offset into a preallocated file.
 
-        To stay safe even on providers whose SDK client/connection is not
-        thread-safe, each worker reads through its own cloned provider (see
-        :meth:`.CloudProvider.clone`), so no provider state is shared between
-        threads. Memory is bounded to ~concurrency * part_size.
+        The ranges are fetched by the workers of a :class:`TransferWorkerPool`,
+        either the given ``pool`` or one made for this transfer, so no
+        provider state is shared between threads. Ranges are streamed (see
+        :meth:`.BucketObjectService.iter_range`) and written with positional
+        writes on the file descriptor as they arrive, so workers never wait
+        on each other to write and memory stays bounded to a few chunks per
+        worker.
+
+        If a ``journal`` is given, ranges it lists as completed are skipped
+        and each newly written range is recorded in it.
+
+        If the ``config`` asks for a checksum, each range is digested as it is
+        written, and the object is verified once all are. Where the provider
+        keeps a digest of the digests of the parts the object was uploaded
+        in, the ranges are those parts, so that it can be compared. If the
+        ``config`` asks to adapt the concurrency, ranges are fetched through
+        an :class:`AdaptiveConcurrency`.
         """
-        part_size = self._multipart_part_size(config)
+        checksum = self._transfer_checksum(config)
+        if checksum is None:
+            stored = None
+        elif pool is None:
+            stored = self._stored_checksum(checksum.algorithm)
+        else:
+            stored = self._request(pool, self._get_stored_checksum,
+                                   checksum.algorithm)
+        if stored is not None and stored[1] is not None:
+            part_size = stored[1]
+        else:
+            part_size = self._multipart_part_size(config, size)
         if part_size < 1:
             raise InvalidValueException('part_size', part_size)
         concurrency = max(1, self._multipart_max_concurrency(config))
+        adaptive = self._adaptive_concurrency(config, concurrency)
         target.truncate(size)
+        target.flush()
         ranges = [(offset, min(part_size, size - offset))
                   for offset in range(0, size, part_size)]
-        if concurrency == 1:
+        if journal is not None:
+            completed = set(journal.get('completed', []))
+            if checksum is not None:
+                # Ranges completed before are verified with the digests
+                # recorded for them; any without one is fetched again.
+                digests = dict(journal.get('digests', []))
+                completed &= set(digests)
+                for offset, length in ranges:
+                    if offset in completed:
+                        checksum.add(offset, bytes.fromhex(digests[offset]),
+                                     length)
+            ranges = [(offset, length) for offset, length in ranges
+                      if offset not in completed]
+        # Ranges are written through the one descriptor the caller opened, so
+        # a range can never be written to a file that has since been replaced.
+        fd = target.fileno()
+        if pool is None and concurrency == 1:
             bucket_objects = self._bucket_objects
             for offset, length in ranges:
-                target.seek(offset)
-                target.write(bucket_objects.download_range(
-                    self.bucket, self.name, offset, length))
+                self._write_range(bucket_objects, fd, offset, length, journal,
+                                  checksum)
         else:
-            self._download_ranges_concurrently(target, ranges, concurrency)
+            self._download_ranges_concurrently(fd, ranges, concurrency,
+                                               journal, pool, checksum,
+                                               adaptive)
+        if checksum is not None:
+            checksum.verify(self.name, stored)
 
     def _download_ranges_concurrently(
-            self, target: IO[bytes], ranges: list[tuple[int, int]],
-            concurrency: int) -> None:
-        # A pool of cloned bucket-object services, one per worker, so each
-        # thread touches an isolated provider/connection.
-        clones: "queue.Queue[BucketObjectService]" = queue.Queue()
-        for _ in range(concurrency):
-            storage = cast("BaseStorageService",
-                           self._provider.clone().storage)
-            clones.put(storage._bucket_objects)
-
-        bucket = self.bucket
-        name = self.name
-        write_lock = threading.Lock()
-
-        def fetch_one(offset: int, length: int) -> None:
-            service = clones.get()
-            try:
-                data = service.download_range(bucket, name, offset, length)
-            finally:
-                clones.put(service)
-            # Ranges are fetched in parallel but written through the one
-            # handle the caller opened, so a range can never be written to a
-            # file that has since been replaced. Serializing the writes costs
-            # little next to the fetches, and the data is released as soon as
-            # it is written, bounding memory to ~concurrency * part_size.
-            with write_lock:
-                target.seek(offset)
-                target.write(data)
-
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            futures = [executor.submit(fetch_one, offset, length)
-                       for offset, length in ranges]
-            for future in futures:
-                future.result()
+            self, fd: int, ranges: list[tuple[int, int]],
+            concurrency: int, journal: TransferJournal | None = None,
+            pool: TransferWorkerPool | None = None,
+            checksum: TransferChecksum | None = None,
+            adaptive: AdaptiveConcurrency | None = None) -> None:
+        if pool is None:
+            with TransferWorkerPool(self._provider, concurrency) as pool:
+                self._download_ranges_concurrently(fd, ranges, concurrency,
+                                                   journal, pool, checksum,
+                                                   adaptive)
+            return
+
+        def fetch(service: "BucketObjectService", offset: int,
+                  length: int) -> None:
+            if adaptive is None:
+                self._write_range(service, fd, offset, length, journal,
+                                  checksum)
+            else:
+                # A throttled range is fetched again from its start.
+                adaptive.call(length, self._write_range, service, fd, offset,
+                              length, journal, checksum)
+
+        pool.run_windowed(
+            ((fetch, (offset, length)) for offset, length in ranges),
+            adaptive or concurrency)
+
+    def _write_range(self, service: "BucketObjectService", fd: int,
+                     offset: int, length: int,
+                     journal: TransferJournal | None = None,
+                     checksum: TransferChecksum | None = None) -> None:
+        digest: Any = checksum.new() if checksum is not None else None
+        position = offset
+        for chunk in service.iter_range(self.bucket, self.name, offset,
+                                        length):
+            self._write_at(fd, chunk, position)
+            if digest is not None:
+                digest.update(chunk)
+            position += len(chunk)
+        if position != offset + length:
+            raise ProviderInternalException(
+                "Expected {0} bytes at offset {1} of {2}, got {3}".format(
+                    length, offset, self.name, position - offset))
+        if checksum is not None:
+            value = digest.digest()
+            checksum.add(offset, value, length)
+            if journal is not None:
+                journal.append('digests', [offset, value.hex()])
+        if journal is not None:
+            # The range is in the OS's hands once written, so it survives
+            # this process exiting.
+            journal.append('completed', offset)
+
+    _write_at_lock = threading.Lock()
+
+    @classmethod
+    def _write_at(cls, fd: int, data: bytes, offset: int) -> None:
+        """
+        Write all of ``data`` at ``offset`` in ``fd`` without moving, or
+        depending on, the descriptor's file position, so that concurrent
+        writers need no lock. Where ``os.pwrite`` is unavailable (Windows),
+        writes fall back to seeking under a lock.
+        """
+        view = memoryview(data)
+        if not hasattr(os, 'pwrite'):
+            with cls._write_at_lock:
+                os.lseek(fd, offset, os.SEEK_SET)
+                while view:
+                    view = view[os.write(fd, view):]
+            return
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
 
     # The three resolvers below pick, in order of precedence: an explicit
     # per-call TransferConfig field, the provider/global config, then the class
@@ -995,19 +2335,117 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         return int(self._provider._get_config_value(
             'multipart_threshold', self.CB_MULTIPART_THRESHOLD))
 
-    def _multipart_part_size(self, config: TransferConfig | None = None) -> int:
+    def _multipart_part_size(self, config: TransferConfig | None = None,
+                             size: int | None = None) -> int:
+        """
+        The part size for a transfer of ``size`` bytes. Unless the ``config``
+        sets one, the configured part size is grown to the smallest multiple
+        of itself that keeps the transfer within the provider's limit on the
+        number of parts.
+        """
         if config is not None and config.part_size is not None:
             return int(config.part_size)
-        return int(self._provider._get_config_value(
+        part_size = int(self._provider._get_config_value(
             'multipart_part_size', self.CB_MULTIPART_PART_SIZE))
+        if size is None or part_size < 1:
+            return part_size
+        parts = -(-size // part_size)
+        if parts <= self.CB_MULTIPART_MAX_PARTS:
+            return part_size
+        fitted = part_size * -(-parts // self.CB_MULTIPART_MAX_PARTS)
+        log.debug("Using parts of %d bytes to transfer %d bytes in at most "
+                  "%d parts", fitted, size, self.CB_MULTIPART_MAX_PARTS)
+        return fitted
 
     def _multipart_max_concurrency(
             self, config: TransferConfig | None = None) -> int:
         if config is not None and config.max_concurrency is not None:
             return int(config.max_concurrency)
+        if config is not None and config.adaptive:
+            return int(self._provider._get_config_value(
+                'multipart_adaptive_max_concurrency',
+                self.CB_MULTIPART_ADAPTIVE_MAX_CONCURRENCY))
         return int(self._provider._get_config_value(
             'multipart_max_concurrency', self.CB_MULTIPART_MAX_CONCURRENCY))
 
+    def _check_part_size(self, part_size: int,
+                         size: int | None = None) -> None:
+        # Reject part sizes the provider would refuse, before anything is
+        # uploaded, rather than on the first part too small or too many.
+        if (part_size < self.CB_MULTIPART_MIN_PART_SIZE or
+                part_size > self.CB_MULTIPART_MAX_PART_SIZE or
+                (size is not None and
+                 -(-size // part_size) > self.CB_MULTIPART_MAX_PARTS)):
+            raise InvalidValueException('multipart_part_size', part_size)
+
+    def _adaptive_concurrency(self, config: TransferConfig | None,
+                              concurrency: int
+                              ) -> AdaptiveConcurrency | None:
+        if config is None or not config.adaptive:
+            return None
+        return AdaptiveConcurrency(concurrency, self._is_throttled)
+
+    def _is_throttled(self, error: BaseException) -> bool:
+        """
+        Whether ``error``, or any error it was raised from, is the provider
+        throttling requests, as decided by :meth:`_is_throttling_error`.
+        """
+        seen: set[int] = set()
+        cause: BaseException | None = error
+        while cause is not None and id(cause) not in seen:
+            if self._is_throttling_error(cause):
+                return True
+            seen.add(id(cause))
+            cause = cause.__cause__ or cause.__context__
+        return False
+
+    @staticmethod
+    def _is_throttling_error(error: BaseException) -> bool:
+        # Provider-implemented; recognises the SDK's error for a throttled or
+        # temporarily overloaded service.
+        return False
+
+    @staticmethod
+    def _is_missing_upload_error(error: BaseException) -> bool:
+        # Provider-implemented; recognises the SDK's error for a multipart
+        # upload, or parts of one, that no longer exist on the server, such
+        # as one that was aborted or expired.
+        return False
+
+    @staticmethod
+    def _needs_generic_driver(config: TransferConfig | None = None) -> bool:
+        """
+        Whether ``config`` asks for a feature that only the generic transfer
+        driver provides: verifying a checksum, or adapting the concurrency.
+        Providers with a native transfer path fall back to the generic one
+        when it does.
+        """
+        return config is not None and bool(config.checksum or config.adaptive)
+
+    def _needs_generic_file_upload(self, path: str,
+                                   config: TransferConfig | None = None
+                                   ) -> bool:
+        """
+        Whether uploading the file at ``path`` with ``config`` needs the
+        generic :meth:`upload_from_file`: for a feature of the generic driver
+        (see :meth:`_needs_generic_driver`), or to resume a multipart upload,
+        as native uploaders do not report which parts have completed.
+        Providers that override ``upload_from_file`` with a native uploader
+        defer to the generic one when it does.
+        """
+        if self._needs_generic_driver(config) or \
+                self._upload_encoding(config) is not None:
+            return True
+        return (config is not None and config.resumable and
+                os.path.getsize(path) > self._multipart_threshold(config))
+
+    @staticmethod
+    def _transfer_checksum(config: TransferConfig | None = None
+                           ) -> TransferChecksum | None:
+        if config is None or not config.checksum:
+            return None
+        return TransferChecksum(config.checksum)
+
     @staticmethod
     def _data_size(data: str | bytes | IO[bytes]) -> int | None:
         """
@@ -1037,20 +2475,166 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
             return io.BytesIO(data)
         return data
 
-    def upload(self, data: str | bytes | IO[bytes],
+    def upload(self, data: str | bytes | IO[bytes] | Iterable[bytes],
                config: TransferConfig | None = None) -> BucketObject:
+        encoding = self._upload_encoding(config)
+        if encoding is not None:
+            return self._upload_compressed(
+                self._content_chunks(data), encoding, config)
+        return self._upload_data(data, config)
+
+    def _upload_compressed(self, chunks: Iterable[bytes], encoding: str,
+                           config: TransferConfig | None = None,
+                           pool: TransferWorkerPool | None = None
+                           ) -> BucketObject:
+        # The compressed size is not known until the end, so the content is
+        # uploaded as an unsized stream, in parts if it grows beyond the
+        # threshold, and compressed only as fast as the parts are sent.
+        stream = IterableReader(cb_helpers.compress_chunks(chunks, encoding))
+        if pool is None:
+            result = self._upload_data(stream, config)
+        else:
+            # A single request would be made through this object's own
+            # provider, so the workers of a pool upload in parts even if the
+            # compressed content turns out to fit in one.
+            result = self._upload_multipart_in_parts(
+                cast(IO[bytes], stream), config, pool)
+        self._request(pool, self._set_content_encoding, encoding)
+        return result
+
+    def _upload_data(self, data: str | bytes | IO[bytes] | Iterable[bytes],
+                     config: TransferConfig | None = None) -> BucketObject:
+        if not isinstance(data, (str, bytes, bytearray)) and \
+                not hasattr(data, 'read'):
+            data = IterableReader(data)
+        data = cast("str | bytes | IO[bytes]", data)
+        threshold = self._multipart_threshold(config)
         size = self._data_size(data)
-        if size is not None and size > self._multipart_threshold(config):
+        if size is None:
+            # The length of a pipe or a generator is only known once it has
+            # been read to the end. Read up to the threshold: a payload that
+            # fits is sent in one request, as it would be if its size were
+            # known, and a larger one is uploaded in parts, starting with the
+            # data read so far.
+            stream = cast(IO[bytes], data)
+            head = cast(bytes, self._read_part(stream, threshold + 1))
+            if len(head) > threshold:
+                return self._upload_multipart(
+                    self._prepend(head, stream), config)
+            data = head
+        elif size > threshold:
             return self._upload_multipart(self._as_stream(data), config)
-        return self._upload_single_shot(data)
+        checksum = self._transfer_checksum(config)
+        if checksum is None:
+            return self._upload_single_shot(data, config)
+        data = self._digest_payload(data, checksum)
+        result = self._upload_single_shot(data, config)
+        self._verify_upload(checksum)
+        return result
+
+    @staticmethod
+    def _prepend(head: bytes, stream: IO[bytes]) -> IO[bytes]:
+        # Buffered, so that every read of a part size returns a full part,
+        # as SDKs that read unsized streams themselves expect.
+        rest = iter(lambda: stream.read(1024 * 1024), b'')
+        return cast(IO[bytes], io.BufferedReader(
+            IterableReader(itertools.chain([head], rest))))
 
     def upload_from_file(
             self, path: str,
             config: TransferConfig | None = None) -> BucketObject:
-        if os.path.getsize(path) > self._multipart_threshold(config):
+        encoding = self._upload_encoding(config)
+        if encoding is not None:
             with open(path, 'rb') as f:
-                return self._upload_multipart(f, config)
-        return self._upload_from_file_single_shot(path)
+                return self._upload_compressed(
+                    self._content_chunks(f), encoding, config)
+        size = os.path.getsize(path)
+        if size > self._multipart_threshold(config):
+            if config is not None and config.resumable:
+                return self._upload_resumable(path, size, config)
+            with self._open_parts(path) as stream:
+                return self._upload_multipart(stream, config)
+        checksum = self._transfer_checksum(config)
+        if checksum is None:
+            return self._upload_from_file_single_shot(path)
+        with open(path, 'rb') as f:
+            self._digest_payload(f, checksum)
+        result = self._upload_from_file_single_shot(path)
+        self._verify_upload(checksum)
+        return result
+
+    @staticmethod
+    def _digest_payload(data: str | bytes | IO[bytes],
+                        checksum: TransferChecksum
+                        ) -> str | bytes | IO[bytes]:
+        """
+        Digest a payload uploaded in a single request, and return the payload
+        to upload. Single requests are at most the multipart threshold, so
+        seekable streams are read ahead and rewound, and only other streams
+        are read into memory.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if isinstance(data, (bytes, bytearray)):
+            checksum.add_data(0, data)
+            return data
+        try:
+            position = data.tell()
+        except (AttributeError, OSError, ValueError):
+            content = data.read()
+            checksum.add_data(0, content)
+            return content
+        digest = checksum.new()
+        length = 0
+        for chunk in iter(lambda: data.read(1024 * 1024), b''):
+            digest.update(chunk)
+            length += len(chunk)
+        data.seek(position)
+        checksum.add(0, digest.digest(), length)
+        return data
+
+    def _verify_upload(self, checksum: TransferChecksum,
+                       pool: TransferWorkerPool | None = None) -> None:
+        # Compare with the checksum of the object as now stored, fetched
+        # afresh since an object's metadata is not updated by uploading.
+        stored = self._request(pool, self._get_stored_checksum,
+                               checksum.algorithm)
+        checksum.verify(self.name, stored)
+
+    def _get_stored_checksum(self, service: "BucketObjectService",
+                             algorithm: str
+                             ) -> tuple[bytes, int | None] | None:
+        obj = cast("BaseBucketObject | None",
+                   service.get(self.bucket, self.name))
+        return obj._stored_checksum(algorithm) if obj is not None else None
+
+    @staticmethod
+    @contextmanager
+    def _open_parts(path: str) -> Iterator[IO[bytes]]:
+        """
+        Open ``path`` as the source of a multipart upload. The file is mapped
+        into memory where possible, so that its parts are read-only slices of
+        the mapping (see :class:`MemoryPartReader`) rather than copies, and
+        falls back to a regular file otherwise.
+        """
+        with open(path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None
+            if mapped is None:
+                yield f
+                return
+            try:
+                with MemoryPartReader(memoryview(mapped)) as reader:
+                    yield cast(IO[bytes], reader)
+            finally:
+                try:
+                    mapped.close()
+                except BufferError:
+                    # A part is still referenced elsewhere (e.g. by a
+                    # traceback); the mapping is released with it.
+                    pass
 
     def _upload_multipart(self, stream: IO[bytes],
                           config: TransferConfig | None = None) -> BucketObject:
@@ -1067,87 +2651,298 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         Providers with an efficient, thread-safe native uploader (e.g. AWS via
         boto3's ``upload_fileobj``) override this method to use it directly.
         """
-        part_size = self._multipart_part_size(config)
-        if part_size < self.CB_MULTIPART_MIN_PART_SIZE:
-            raise InvalidValueException('multipart_part_size', part_size)
+        return self._upload_multipart_in_parts(stream, config)
 
-        concurrency = max(1, self._multipart_max_concurrency(config))
-        upload = self.create_multipart_upload()
+    def _upload_multipart_in_parts(
+            self, stream: IO[bytes], config: TransferConfig | None = None,
+            pool: TransferWorkerPool | None = None) -> BucketObject:
+        """
+        The generic driver behind :meth:`_upload_multipart`. If a ``pool`` is
+        given, every request of the upload, not only the parts, is made by
+        its workers.
+        """
+        size = self._data_size(stream)
+        part_size = self._multipart_part_size(config, size)
+        self._check_part_size(part_size, size)
+        checksum = self._transfer_checksum(config)
+
+        upload = self._request(pool, self._create_upload, config)
         try:
-            if concurrency == 1:
-                parts = self._upload_parts_serially(upload, stream, part_size)
-            else:
-                parts = self._upload_parts_concurrently(
-                    upload, stream, part_size, concurrency)
-            return upload.complete(parts)
+            parts = self._upload_parts(upload, stream, part_size, config,
+                                       pool=pool, checksum=checksum)
+            result = self._request(pool, self._complete_upload, upload,
+                                   parts)
         except Exception:
-            upload.abort()
+            self._request(pool, self._abort_upload, upload)
             raise
+        if checksum is not None:
+            self._verify_upload(checksum, pool)
+        return result
+
+    def _request(self, pool: TransferWorkerPool | None,
+                 fn: Callable[..., R], *args: Any) -> R:
+        # Make one request of a transfer, as ``fn(service, *args)``, on a
+        # worker of ``pool`` if given, or through this object's own service.
+        if pool is None:
+            return fn(self._bucket_objects, *args)
+        return pool.submit(fn, *args).result()
+
+    def _create_upload(self, service: "BucketObjectService",
+                       config: TransferConfig | None = None
+                       ) -> MultipartUpload:
+        # ``config`` is that of the upload, as for _upload_single_shot.
+        return service.create_multipart_upload(self.bucket, self.name)
+
+    def _resume_upload(self, service: "BucketObjectService",
+                       upload_id: str) -> MultipartUpload:
+        # Provider-overridable: providers that keep track of uploads check,
+        # through ``service``, that the upload still exists.
+        return BaseMultipartUpload(service.provider, self.bucket, self.name,
+                                   upload_id)
+
+    @staticmethod
+    def _complete_upload(service: "BucketObjectService",
+                         upload: MultipartUpload,
+                         parts: list[UploadPart]) -> BucketObject:
+        return service.complete_multipart_upload(upload.bucket, upload, parts)
+
+    @staticmethod
+    def _abort_upload(service: "BucketObjectService",
+                      upload: MultipartUpload) -> None:
+        service.abort_multipart_upload(upload.bucket, upload)
+
+    def _upload_resumable(self, path: str, size: int,
+                          config: TransferConfig,
+                          pool: TransferWorkerPool | None = None
+                          ) -> BucketObject:
+        """
+        Multipart upload of a file that survives failures and restarts.
+
+        The upload id and every completed part are recorded in a
+        :class:`TransferJournal` at ``<path>.cbupload``. If the transfer
+        fails, the upload is not aborted and the journal is kept; the next
+        call for the same, unmodified file (same size and modification time,
+        destination and part size) continues the same multipart upload and
+        sends only the parts the journal does not list. If the upload no
+        longer exists on the server by then, because it was aborted or has
+        expired, the journal is dropped and the file uploaded afresh. This
+        always goes through the generic driver, even on providers that
+        override :meth:`_upload_multipart` with a native uploader, since those
+        do not expose which parts have completed.
+        """
+        part_size = self._multipart_part_size(config, size)
+        self._check_part_size(part_size, size)
+        identity = {
+            'bucket': self.bucket.name,
+            'name': self.name,
+            'size': size,
+            'mtime': os.stat(path).st_mtime_ns,
+            'part_size': part_size}
+        checksum = self._transfer_checksum(config)
+        if checksum is not None:
+            identity['checksum'] = checksum.algorithm
+        journal = TransferJournal(f"{path}.cbupload", identity)
+        upload_id = journal.get('upload_id') if journal.load() else None
+        if upload_id:
+            log.debug("Resuming multipart upload %s of %s", upload_id, path)
+            try:
+                return self._upload_journalled(
+                    path, size, part_size, config, journal,
+                    self._request(pool, self._resume_upload, upload_id), pool)
+            except Exception as e:
+                if not self._is_missing_upload_error(e):
+                    raise
+                log.warning("Multipart upload %s of %s no longer exists; "
+                            "uploading it again", upload_id, path)
+        journal.remove()
+        upload = self._request(pool, self._create_upload)
+        journal.set('upload_id', upload.id)
+        return self._upload_journalled(path, size, part_size, config, journal,
+                                       upload, pool)
+
+    def _upload_journalled(self, path: str, size: int, part_size: int,
+                           config: TransferConfig, journal: TransferJournal,
+                           upload: MultipartUpload,
+                           pool: TransferWorkerPool | None = None
+                           ) -> BucketObject:
+        # Send the parts of ``path`` that ``journal`` does not list as parts
+        # of ``upload``, and complete it.
+        checksum = self._transfer_checksum(config)
+        completed: dict[int, UploadPart] = {}
+        for entry in journal.get('parts', []):
+            part_number, etag = entry[0], entry[1]
+            completed[part_number] = BaseUploadPart(part_number, etag)
+            if checksum is not None:
+                # Parts are journalled with their digest when verifying.
+                offset = (part_number - 1) * part_size
+                checksum.add(part_number, bytes.fromhex(entry[2]),
+                             min(part_size, size - offset))
+        with self._open_parts(path) as stream:
+            parts = self._upload_parts(upload, stream, part_size, config,
+                                       completed, journal, pool, checksum)
+        result = self._request(pool, self._complete_upload, upload, parts)
+        journal.remove()
+        if checksum is not None:
+            self._verify_upload(checksum, pool)
+        return result
+
+    def _upload_parts(self, upload: MultipartUpload, stream: IO[bytes],
+                      part_size: int, config: TransferConfig | None = None,
+                      completed: dict[int, UploadPart] | None = None,
+                      journal: TransferJournal | None = None,
+                      pool: TransferWorkerPool | None = None,
+                      checksum: TransferChecksum | None = None
+                      ) -> list[UploadPart]:
+        """
+        Upload ``stream`` as parts of ``upload``. Parts listed in
+        ``completed`` are skipped over rather than sent again, and if a
+        ``journal`` is given each newly uploaded part is recorded in it.
+        Parts are sent by the workers of ``pool`` if one is given. If a
+        ``checksum`` is given, each part is digested, from the same buffer,
+        just before it is sent. If the ``config`` asks to adapt the
+        concurrency, parts are sent through an :class:`AdaptiveConcurrency`.
+        """
+        concurrency = max(1, self._multipart_max_concurrency(config))
+        adaptive = self._adaptive_concurrency(config, concurrency)
+        if pool is None and concurrency == 1:
+            return self._upload_parts_serially(
+                upload, stream, part_size, completed or {}, journal,
+                checksum)
+        return self._upload_parts_concurrently(
+            upload, stream, part_size, concurrency, completed or {}, journal,
+            pool, checksum, adaptive)
+
+    @staticmethod
+    def _skip_completed_parts(stream: IO[bytes], part_number: int,
+                              part_size: int,
+                              completed: dict[int, UploadPart],
+                              parts: list[UploadPart]) -> int:
+        # Seek past the parts that were uploaded by an earlier attempt,
+        # returning the number of the next part to send.
+        while part_number in completed:
+            stream.seek(part_size, os.SEEK_CUR)
+            parts.append(completed[part_number])
+            part_number += 1
+        return part_number
+
+    @staticmethod
+    def _digest_part(checksum: TransferChecksum | None, part_number: int,
+                     chunk: bytes | IO[bytes]) -> bytes | None:
+        if checksum is None:
+            return None
+        if isinstance(chunk, MemoryPartReader):
+            return checksum.add_data(part_number, chunk.getbuffer())
+        return checksum.add_data(part_number, cast(bytes, chunk))
 
-    def _upload_parts_serially(self, upload: MultipartUpload,
-                               stream: IO[bytes],
-                               part_size: int) -> list[UploadPart]:
-        parts = []
+    @staticmethod
+    def _record_part(journal: TransferJournal | None, part: UploadPart,
+                     digest: bytes | None = None) -> None:
+        if journal is not None:
+            entry = [part.part_number, part.etag]
+            if digest is not None:
+                entry.append(digest.hex())
+            journal.append('parts', entry)
+
+    def _upload_parts_serially(
+            self, upload: MultipartUpload, stream: IO[bytes], part_size: int,
+            completed: dict[int, UploadPart],
+            journal: TransferJournal | None = None,
+            checksum: TransferChecksum | None = None) -> list[UploadPart]:
+        parts: list[UploadPart] = []
         part_number = 1
         while True:
+            part_number = self._skip_completed_parts(
+                stream, part_number, part_size, completed, parts)
             chunk = self._read_part(stream, part_size)
             if not chunk:
                 break
-            parts.append(upload.upload_part(part_number, chunk))
+            try:
+                digest = self._digest_part(checksum, part_number, chunk)
+                part = upload.upload_part(part_number, chunk)
+            finally:
+                self._release_part(chunk)
+            self._record_part(journal, part, digest)
+            parts.append(part)
             part_number += 1
         return parts
 
-    def _upload_parts_concurrently(self, upload: MultipartUpload,
-                                   stream: IO[bytes], part_size: int,
-                                   concurrency: int) -> list[UploadPart]:
-        # A pool of cloned bucket-object services, one per worker, so each
-        # thread touches an isolated provider/connection.
-        clones: "queue.Queue[BucketObjectService]" = queue.Queue()
-        for _ in range(concurrency):
-            storage = cast("BaseStorageService",
-                           self._provider.clone().storage)
-            clones.put(storage._bucket_objects)
-
-        def upload_one(part_number: int, chunk: bytes) -> UploadPart:
-            service = clones.get()
+    def _upload_parts_concurrently(
+            self, upload: MultipartUpload, stream: IO[bytes], part_size: int,
+            concurrency: int, completed: dict[int, UploadPart],
+            journal: TransferJournal | None = None,
+            pool: TransferWorkerPool | None = None,
+            checksum: TransferChecksum | None = None,
+            adaptive: AdaptiveConcurrency | None = None) -> list[UploadPart]:
+        if pool is None:
+            with TransferWorkerPool(self._provider, concurrency) as pool:
+                return self._upload_parts_concurrently(
+                    upload, stream, part_size, concurrency, completed,
+                    journal, pool, checksum, adaptive)
+
+        def send(service: "BucketObjectService", part_number: int,
+                 chunk: bytes | IO[bytes]) -> UploadPart:
+            if hasattr(chunk, 'seek'):
+                # A retried part is read again from its start.
+                chunk.seek(0)
+            return service.upload_part(upload.bucket, upload, part_number,
+                                       chunk)
+
+        def upload_one(service: "BucketObjectService", part_number: int,
+                       chunk: bytes | IO[bytes]) -> UploadPart:
+            # Parts are digested on the workers, so that they are hashed in
+            # parallel too.
             try:
-                return service.upload_part(
-                    upload.bucket, upload, part_number, chunk)
+                digest = self._digest_part(checksum, part_number, chunk)
+                if adaptive is None:
+                    part = service.upload_part(
+                        upload.bucket, upload, part_number, chunk)
+                else:
+                    part = adaptive.call(len(cast(Any, chunk)), send,
+                                         service, part_number, chunk)
             finally:
-                clones.put(service)
+                self._release_part(chunk)
+            self._record_part(journal, part, digest)
+            return part
 
         parts: list[UploadPart] = []
-        in_flight: set[Future[UploadPart]] = set()
-        part_number = 1
-        depleted = False
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            while not depleted or in_flight:
-                # Keep the pool fed but never read more than ``concurrency``
-                # parts ahead, bounding memory to ~concurrency * part_size.
-                while not depleted and len(in_flight) < concurrency:
-                    chunk = self._read_part(stream, part_size)
-                    if not chunk:
-                        depleted = True
-                        break
-                    in_flight.add(
-                        executor.submit(upload_one, part_number, chunk))
-                    part_number += 1
-                if not in_flight:
-                    break
-                done, in_flight = wait(
-                    in_flight, return_when=FIRST_COMPLETED)
-                for future in done:
-                    parts.append(future.result())
-        return parts
+
+        def read_parts() -> Iterator[tuple[Callable[..., UploadPart],
+                                           tuple[Any, ...]]]:
+            # Parts are read only as earlier ones finish, so no more than
+            # ``concurrency`` are read ahead, bounding memory to
+            # ~concurrency * part_size, even when adapting.
+            part_number = 1
+            while True:
+                part_number = self._skip_completed_parts(
+                    stream, part_number, part_size, completed, parts)
+                chunk = self._read_part(stream, part_size)
+                if not chunk:
+                    return
+                yield upload_one, (part_number, chunk)
+                part_number += 1
+
+        uploaded = pool.run_windowed(read_parts(), adaptive or concurrency)
+        return parts + uploaded
 
     @staticmethod
-    def _read_part(stream: IO[bytes], part_size: int) -> bytes:
+    def _read_part(stream: IO[bytes],
+                   part_size: int) -> bytes | IO[bytes]:
         """
         Read exactly ``part_size`` bytes from ``stream`` (fewer only at EOF),
         coalescing short reads so non-final parts always meet the provider
         minimum part size.
+
+        A part of a memory-mapped file is returned as a
+        :class:`MemoryPartReader` over the mapping instead of being copied.
+        Otherwise a full read is returned as is, and only short reads are
+        gathered into a buffer.
         """
-        buffer = bytearray()
+        if isinstance(stream, MemoryPartReader):
+            return cast(IO[bytes], stream.read_part(part_size))
+        data = stream.read(part_size)
+        if not data or len(data) == part_size:
+            return data
+        buffer = bytearray(data)
         while len(buffer) < part_size:
             chunk = stream.read(part_size - len(buffer))
             if not chunk:
@@ -1155,6 +2950,13 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
             buffer.extend(chunk)
         return bytes(buffer)
 
+    @staticmethod
+    def _release_part(chunk: bytes | IO[bytes]) -> None:
+        # Drop a mapped part's view as soon as it has been sent, so the file
+        # mapping can be closed when the upload finishes.
+        if isinstance(chunk, MemoryPartReader):
+            chunk.close()
+
     def _upload_from_file_single_shot(
             self, path: str) -> BucketObject:
         """
@@ -1165,11 +2967,33 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
         with open(path, 'rb') as f:
             return self._upload_single_shot(f)
 
+    def copy_to(self, bucket: Bucket | str, name: str | None = None,
+                config: TransferConfig | None = None) -> BucketObject:
+        if isinstance(bucket, str):
+            found = self._provider.storage.buckets.get(bucket)
+            if found is None:
+                raise InvalidValueException('bucket', bucket)
+            bucket = found
+        name = name or self.name
+        self.assert_valid_resource_name(name)
+        if bucket.name == self.bucket.name and name == self.name:
+            raise InvalidValueException('name', name)
+        return self._copy_to(bucket, name, config)
+
+    def _copy_to(self, bucket: Bucket, name: str,
+                 config: TransferConfig | None = None) -> BucketObject:
+        # Provider-implemented server-side copy.
+        raise NotImplementedError(
+            "BucketObject subclasses must implement _copy_to")
+
     def create_multipart_upload(self) -> MultipartUpload:
         # pylint:disable=protected-access
         return self._bucket_objects.create_multipart_upload(
             self.bucket, self.name)
 
+    def resume_multipart_upload(self, upload_id: str) -> MultipartUpload:
+        return self._resume_upload(self._bucket_objects, upload_id)
+
     def __eq__(self, other: object) -> bool:
         return (isinstance(other, BucketObject) and
                 # pylint:disable=protected-access
@@ -1179,6 +3003,156 @@ class BaseBucketObject(BaseCloudResource, BucketObject):
                 self.name == other.name)
 
 
+class BaseTransferManager(TransferManager):
+    """
+    Runs transfers on one shared :class:`TransferWorkerPool`.
+
+    Each transfer is driven by a thread of its own that makes no requests
+    itself: it hands every request, including looking up the object's
+    encoding and checksum, and creating, resuming and completing a multipart
+    upload, to the pool and waits for it. Transfers below the multipart
+    threshold, and compressed objects that can only be streamed whole, take a
+    single task. Larger ones use the generic part
+    and range drivers of :class:`BaseBucketObject`, even on providers with a
+    native transfer manager of their own, so that their parts share the pool
+    too.
+    """
+
+    # Number of workers, and so of requests in flight, of a transfer manager.
+    CB_TRANSFER_MAX_CONCURRENCY = int(os.environ.get(
+        'CB_TRANSFER_MAX_CONCURRENCY', 10))
+
+    def __init__(self, provider: CloudProvider,
+                 max_concurrency: int | None = None) -> None:
+        if max_concurrency is None:
+            max_concurrency = int(
+                cast("BaseCloudProvider", provider)._get_config_value(
+                    'transfer_max_concurrency',
+                    self.CB_TRANSFER_MAX_CONCURRENCY))
+        if max_concurrency < 1:
+            raise InvalidValueException('max_concurrency', max_concurrency)
+        self._pool = TransferWorkerPool(provider, max_concurrency)
+        self._clone_pool = cast("BaseCloudProvider", provider)._clone_pool
+        # The threads driving transfers only wait on the pool, but each holds
+        # a file open, and possibly a multipart upload, so only a few more
+        # transfers are underway than there are workers.
+        self._transfers = ThreadPoolExecutor(max_workers=2 * max_concurrency)
+        self._buckets: dict[str, Bucket] = {}
+
+    def upload_file(self, path: str, bucket: Bucket | str, name: str,
+                    config: TransferConfig | None = None
+                    ) -> "Future[BucketObject]":
+        return self._transfers.submit(self._upload_file, path, bucket, name,
+                                      config)
+
+    def download_file(self, bucket: Bucket | str, name: str, path: str,
+                      config: TransferConfig | None = None) -> "Future[None]":
+        return self._transfers.submit(self._download_file, bucket, name,
+                                      path, config)
+
+    def shutdown(self) -> None:
+        self._transfers.shutdown(wait=True)
+        self._pool.shutdown()
+
+    def _bucket(self, bucket: Bucket | str) -> Bucket:
+        if not isinstance(bucket, str):
+            return bucket
+        found = self._buckets.get(bucket)
+        if found is None:
+            found = self._pool.submit(self._get_bucket, bucket).result()
+            if found is None:
+                raise InvalidValueException('bucket', bucket)
+            self._buckets[bucket] = found
+        return found
+
+    @staticmethod
+    def _get_bucket(service: "BucketObjectService",
+                    name: str) -> Bucket | None:
+        return service.provider.storage.buckets.get(name)
+
+    def _upload_file(self, path: str, bucket: Bucket | str, name: str,
+                     config: TransferConfig | None) -> BucketObject:
+        # The object is obtained through the clones of the pool's workers.
+        return self._clone_pool.rebind(
+            self._upload(path, bucket, name, config))
+
+    def _upload(self, path: str, bucket: Bucket | str, name: str,
+                config: TransferConfig | None) -> BucketObject:
+        size = os.path.getsize(path)
+        obj, uploaded = self._pool.submit(
+            self._start_upload, self._bucket(bucket), name, path, size,
+            config).result()
+        if uploaded:
+            return obj
+        encoding = obj._upload_encoding(config)
+        if encoding is not None:
+            with open(path, 'rb') as f:
+                return obj._upload_compressed(obj._content_chunks(f),
+                                              encoding, config, self._pool)
+        if config is not None and config.resumable:
+            return obj._upload_resumable(path, size, config, self._pool)
+        with obj._open_parts(path) as stream:
+            return obj._upload_multipart_in_parts(stream, config, self._pool)
+
+    @staticmethod
+    def _start_upload(service: "BucketObjectService", bucket: Bucket,
+                      name: str, path: str, size: int,
+                      config: TransferConfig | None
+                      ) -> tuple[BaseBucketObject, bool]:
+        # Small files are uploaded outright, within this one task.
+        obj = cast(BaseBucketObject, service.create(bucket, name))
+        if size <= obj._multipart_threshold(config):
+            obj.upload_from_file(path, config)
+            return obj, True
+        return obj, False
+
+    def _download_file(self, bucket: Bucket | str, name: str, path: str,
+                       config: TransferConfig | None) -> None:
+        started = self._pool.submit(self._start_download,
+                                    self._bucket(bucket), name, path,
+                                    config).result()
+        if started is None:
+            return
+        obj, encoding = started
+        size = obj.size
+
+        def fetch(target: str) -> None:
+            if config is not None and config.resumable:
+                obj._download_resumable(target, size, config, self._pool)
+                return
+            obj._download_via_part_file(
+                target, lambda part_path: obj._download_ranged_to_path(
+                    part_path, size, config, self._pool))
+
+        def download(target: str) -> None:
+            obj._download_decoded(target, config, encoding, fetch)
+
+        # The object was just looked up, so its metadata is current.
+        obj._download_cached(path, config, download, validate=False,
+                             encoding=encoding)
+
+    @staticmethod
+    def _start_download(service: "BucketObjectService", bucket: Bucket,
+                        name: str, path: str,
+                        config: TransferConfig | None
+                        ) -> tuple[BaseBucketObject, str | None] | None:
+        # Small objects, and compressed ones that can only be streamed whole,
+        # are downloaded outright, within this one task. Otherwise the object
+        # is returned with the encoding to decompress it from.
+        obj = cast("BaseBucketObject | None", service.get(bucket, name))
+        if obj is None:
+            raise InvalidValueException('name', name)
+        if obj.size <= obj._multipart_threshold(config):
+            obj.download_to_file(path, config)
+            return None
+        encoding = obj._decoded_encoding(config)
+        if encoding is not None and \
+                not obj._ranged_reads_of_encoding(encoding):
+            obj.download_to_file(path, config)
+            return None
+        return obj, encoding
+
+
 class BaseBucket(BaseCloudResource, Bucket):
 
     def __init__(self, provider: CloudProvider) -> None:
@@ -1197,8 +3171,13 @@ class BaseBucket(BaseCloudResource, Bucket):
         Delete this bucket.
         """
         if delete_contents:
-            for obj in self.objects:
-                obj.delete()
+            errors = self.objects.delete_many(
+                obj.name for obj in self.objects)
+            if errors:
+                name, error = next(iter(errors.items()))
+                raise ProviderInternalException(
+                    "Could not delete {0} object(s) from bucket {1}, e.g. "
+                    "{2}: {3}".format(len(errors), self.name, name, error))
         self._provider.storage.buckets.delete(self.id)
 
     # TODO: Discuss creating `create_object` method, or change docs
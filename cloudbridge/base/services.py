@@ -1,14 +1,27 @@
 """
 Base implementation for services available through a provider
 """
+import itertools
 import logging
+import os
 from abc import abstractmethod
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import contextmanager
 from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import Iterator
+from typing import TYPE_CHECKING
 from typing import cast
 
-from cloudbridge.interfaces.exceptions import InvalidParamException
+from cloudbridge.interfaces.exceptions import InvalidValueException
 from cloudbridge.interfaces.provider import CloudProvider
 from cloudbridge.interfaces.resources import Bucket
+from cloudbridge.interfaces.resources import BucketObject
 from cloudbridge.interfaces.resources import DnsRecord
 from cloudbridge.interfaces.resources import DnsRecordType
 from cloudbridge.interfaces.resources import DnsZone
@@ -23,6 +36,7 @@ from cloudbridge.interfaces.resources import ResultList
 from cloudbridge.interfaces.resources import Router
 from cloudbridge.interfaces.resources import Snapshot
 from cloudbridge.interfaces.resources import Subnet
+from cloudbridge.interfaces.resources import TransferManager
 from cloudbridge.interfaces.resources import VMFirewall
 from cloudbridge.interfaces.resources import VMFirewallRule
 from cloudbridge.interfaces.resources import VMType
@@ -58,8 +72,12 @@ from .resources import BaseNetwork
 from .resources import BasePageableObjectMixin
 from .resources import BaseRouter
 from .resources import BaseSubnet
+from .resources import BaseTransferManager
 from .resources import ClientPagedResultList
 
+if TYPE_CHECKING:
+    from .provider import BaseCloudProvider
+
 log = logging.getLogger(__name__)
 
 
@@ -104,21 +122,15 @@ class BaseVMFirewallService(
         super(BaseVMFirewallService, self).__init__(provider)
         self._service_event_pattern += ".security.vm_firewalls"
 
+    def find_iter(self, **kwargs: Any) -> Iterator[VMFirewall]:
+        filters = ['label']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
+
     @dispatch(event="provider.security.vm_firewalls.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[VMFirewall]:
-        obj_list = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
 
 # The pageable mixin's list(limit, marker) intentionally differs from this
@@ -147,15 +159,20 @@ class BaseVMFirewallRuleService(  # type: ignore[misc]
         else:
             return None
 
+    # Like find(), this takes a leading firewall, unlike the pageable mixin.
+    def find_iter(self,  # type: ignore[override]
+                  firewall: VMFirewall, **kwargs: Any) -> Iterator[VMFirewallRule]:
+        filters = ['name', 'direction', 'protocol', 'from_port', 'to_port',
+                   'cidr', 'src_dest_fw', 'src_dest_fw_id']
+        return cb_helpers.iter_find(filters, kwargs,
+                                    cast(Any, firewall.rules).iter())
+
     @dispatch(event="provider.security.vm_firewall_rules.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, firewall: VMFirewall,
              **kwargs: Any) -> ResultList[VMFirewallRule]:
-        obj_list = list(firewall.rules)
-        filters = ['name', 'direction', 'protocol', 'from_port', 'to_port',
-                   'cidr', 'src_dest_fw', 'src_dest_fw_id']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self._provider, list(matches))
+        return ClientPagedResultList(
+            self._provider, list(self.find_iter(firewall, **kwargs)))
 
 
 class BaseStorageService(StorageService, BaseCloudService):
@@ -177,6 +194,10 @@ class BaseStorageService(StorageService, BaseCloudService):
         """
         pass
 
+    def transfer_manager(self, max_concurrency: int | None = None
+                         ) -> TransferManager:
+        return BaseTransferManager(self.provider, max_concurrency)
+
 
 class BaseVolumeService(
         BasePageableObjectMixin[Volume], VolumeService, BaseCloudService):
@@ -203,21 +224,15 @@ class BaseBucketService(
 
     # Generic find will be used for providers where we have not implemented
     # provider-specific querying for find method
+    def find_iter(self, **kwargs: Any) -> Iterator[Bucket]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
+
     @dispatch(event="provider.storage.buckets.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Bucket]:
-        obj_list = list(self)
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
 
 class BaseBucketObjectService(BucketObjectService, BaseCloudService):
@@ -227,6 +242,285 @@ class BaseBucketObjectService(BucketObjectService, BaseCloudService):
         self._service_event_pattern += ".storage._bucket_objects"
         self._bucket: Bucket | None = None
 
+    # Size of the chunks yielded by providers that stream ranged reads.
+    _RANGE_CHUNK_SIZE = 1024 * 1024
+    # Number of names sent in one bulk-delete request; providers set this to
+    # their API's limit.
+    _DELETE_BATCH_SIZE = 1000
+    # Number of bulk-delete requests in flight at once.
+    CB_DELETE_MAX_CONCURRENCY = int(os.environ.get(
+        'CB_DELETE_MAX_CONCURRENCY', 8))
+    # Number of listing requests in flight at once in iter_parallel.
+    CB_LIST_MAX_CONCURRENCY = int(os.environ.get(
+        'CB_LIST_MAX_CONCURRENCY', 8))
+
+    def find_iter(self, bucket: Bucket | str,
+                  **kwargs: Any) -> Iterator[BucketObject]:
+        filters = ['name']
+        # Only names starting with the literal part of a name pattern can
+        # match, so only those are listed, and the filters are then matched
+        # against each page as it arrives.
+        name = kwargs.get('name')
+        prefix = cb_helpers.glob_prefix(name) \
+            if isinstance(name, str) and name else None
+        return cb_helpers.iter_find(filters, kwargs,
+                                    self._iter_objects(bucket, prefix))
+
+    @dispatch(event="provider.storage._bucket_objects.find",
+              priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
+    def find(self, bucket: Bucket | str,
+             **kwargs: Any) -> ResultList[BucketObject]:
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(bucket, **kwargs)),
+                                     limit=None, marker=None)
+
+    @staticmethod
+    def _delimited_marker(marker: str | None, prefix: str | None,
+                          delimiter: str | None) -> str | None:
+        # With a delimiter, the marker of a page can be a common prefix. The
+        # next page has to start after every name beneath it, or the first of
+        # them would be rolled up into the same prefix again. A name equal to
+        # the listed prefix is an object of its own and is left alone.
+        if (marker and delimiter and marker.endswith(delimiter)
+                and len(marker) > len(prefix or '')):
+            return marker + '\U0010ffff'
+        return marker
+
+    def _iter_pages(self, bucket: Bucket | str, prefix: str | None = None,
+                    delimiter: str | None = None
+                    ) -> Iterator[ResultList[BucketObject]]:
+        # Walk every page of a listing, as BasePageableObjectMixin.iter does.
+        # A client-paged listing already holds every object in its data.
+        result_list = self.list(bucket, prefix=prefix, delimiter=delimiter)
+        if not result_list.supports_server_paging:
+            yield ClientPagedResultList(self.provider, result_list.data,
+                                        limit=len(result_list.data) or None)
+            return
+        yield result_list
+        while result_list.is_truncated:
+            result_list = self.list(bucket, prefix=prefix,
+                                    delimiter=delimiter,
+                                    marker=result_list.marker)
+            yield result_list
+
+    def _iter_objects(self, bucket: Bucket | str,
+                      prefix: str | None = None) -> Iterator[BucketObject]:
+        for page in self._iter_pages(bucket, prefix):
+            yield from page
+
+    @contextmanager
+    def _pooled_service(self) -> Iterator["BaseBucketObjectService"]:
+        # Borrow the service of a clone from the provider's clone pool, so
+        # each thread touches an isolated provider/connection. Clones are
+        # kept between operations, so short ones do not pay for cloning.
+        provider = cast("BaseCloudProvider", self.provider)
+        with provider._clone_pool.borrow() as clone:
+            storage = cast("BaseStorageService", clone.storage)
+            yield cast("BaseBucketObjectService", storage._bucket_objects)
+
+    def _discover_shards(
+            self, bucket: Bucket | str, prefix: str, delimiter: str,
+            concurrency: int,
+            probe: Callable[[list[str]], Iterable[ResultList[BucketObject]]]
+    ) -> Generator[BucketObject, None, list[str]]:
+        """
+        Find shards to list ``prefix`` by in parallel, descending one level
+        of common prefixes at a time until there are ``concurrency`` of them,
+        and yield the objects found above the shards along the way. Return
+        the shards.
+
+        Only the first page of each candidate is listed, by ``probe`` for a
+        whole level at once, to tell folders that hold further folders from
+        those that hold objects only. The latter are kept whole as shards
+        rather than listed here, so a layout of a few large, flat folders is
+        still listed in parallel, and descending stops at a level where no
+        folder holds further folders. Objects that ``probe`` lists through a
+        clone of the provider are rebound to the provider as they are
+        yielded.
+        """
+        rebind = cast("BaseCloudProvider", self.provider)._clone_pool.rebind
+        leaves: list[str] = []
+        frontier = [prefix]
+        while frontier and len(leaves) + len(frontier) < concurrency:
+            firsts = list(zip(frontier, probe(frontier)))
+            if not any(page.prefixes for _, page in firsts):
+                break
+            subshards: list[str] = []
+            for shard, page in firsts:
+                if not page.prefixes:
+                    # Its first page is listed again, undelimited, as a shard.
+                    leaves.append(shard)
+                    continue
+                while True:
+                    yield from map(rebind, page if page.supports_server_paging
+                                   else page.data)
+                    subshards.extend(page.prefixes)
+                    if not (page.supports_server_paging and
+                            page.is_truncated):
+                        break
+                    page = self.list(bucket, prefix=shard,
+                                     delimiter=delimiter, marker=page.marker)
+            frontier = subshards
+        return leaves + frontier
+
+    def iter_parallel(self, bucket: Bucket | str, prefix: str | None = None,
+                      shards: Iterable[str] | None = None,
+                      delimiter: str = '/') -> Iterator[BucketObject]:
+        provider = cast("BaseCloudProvider", self.provider)
+        concurrency = max(1, int(provider._get_config_value(
+            'list_max_concurrency', self.CB_LIST_MAX_CONCURRENCY)))
+        if shards is not None:
+            shards = [(prefix or '') + shard for shard in shards]
+        if concurrency == 1:
+            for shard in shards if shards is not None else [prefix or '']:
+                yield from self._iter_objects(bucket, shard)
+            return
+
+        def list_page(shard: str, marker: str | None,
+                      delimiter: str | None = None
+                      ) -> tuple[str, ResultList[BucketObject]]:
+            # Pages are listed through clones of the provider, and their
+            # objects rebound to the provider as they are yielded.
+            with self._pooled_service() as service:
+                return shard, service.list(bucket, prefix=shard,
+                                           delimiter=delimiter,
+                                           marker=marker)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if shards is None:
+                shards = yield from self._discover_shards(
+                    bucket, prefix or '', delimiter, concurrency,
+                    lambda level: [page for _, page in executor.map(
+                        lambda shard: list_page(shard, None, delimiter),
+                        level)])
+            if len(shards) <= 1:
+                for shard in shards:
+                    yield from self._iter_objects(bucket, shard)
+                return
+
+            # Each shard is a chain of page requests. A shard's next page is
+            # only requested once its previous page has been yielded, and no
+            # more than ``concurrency`` pages are in flight, so the listing
+            # is consumed lazily.
+            pending = iter(shards)
+            in_flight: set[Future[tuple[str, ResultList[BucketObject]]]] = \
+                set()
+            for shard in itertools.islice(pending, concurrency):
+                in_flight.add(executor.submit(list_page, shard, None))
+            while in_flight:
+                done, in_flight = wait(
+                    in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard, page = future.result()
+                    if not page.supports_server_paging:
+                        yield from map(provider._clone_pool.rebind, page.data)
+                    else:
+                        yield from map(provider._clone_pool.rebind, page)
+                        if page.is_truncated:
+                            in_flight.add(executor.submit(
+                                list_page, shard, page.marker))
+                            continue
+                    next_shard = next(pending, None)
+                    if next_shard is not None:
+                        in_flight.add(executor.submit(
+                            list_page, next_shard, None))
+
+    def iter_range(self, bucket: Bucket | str, object_name: str,
+                   offset: int, length: int) -> Iterator[bytes]:
+        # Providers that cannot stream a ranged read yield it whole.
+        yield self.download_range(bucket, object_name, offset, length)
+
+    @dispatch(event="provider.storage._bucket_objects.delete_many",
+              priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
+    def delete_many(self, bucket: Bucket | str,
+                    names: Iterable[str]) -> dict[str, Exception]:
+        provider = cast("BaseCloudProvider", self.provider)
+        concurrency = max(1, int(provider._get_config_value(
+            'delete_max_concurrency', self.CB_DELETE_MAX_CONCURRENCY)))
+        names = iter(names)
+        batches: Iterator[list[str]] = iter(lambda: list(itertools.islice(
+            names, self._DELETE_BATCH_SIZE)), [])
+        errors: dict[str, Exception] = {}
+        first = next(batches, [])
+        second = next(batches, [])
+        if concurrency == 1 or not second:
+            for batch in itertools.chain([first, second], batches):
+                if batch:
+                    errors.update(
+                        self._delete_batch_safely(self, bucket, batch))
+            return errors
+        batches = itertools.chain([first, second], batches)
+
+        def delete_one(batch: list[str]) -> dict[str, Exception]:
+            with self._pooled_service() as service:
+                return self._delete_batch_safely(service, bucket, batch)
+
+        in_flight: set[Future[dict[str, Exception]]] = set()
+        depleted = False
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while not depleted or in_flight:
+                # Only list as many batches ahead as there are workers, so
+                # names are consumed lazily.
+                while not depleted and len(in_flight) < concurrency:
+                    batch = next(batches, [])
+                    if not batch:
+                        depleted = True
+                        break
+                    in_flight.add(executor.submit(delete_one, batch))
+                if not in_flight:
+                    break
+                done, in_flight = wait(
+                    in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    errors.update(future.result())
+        return errors
+
+    @dispatch(event="provider.storage._bucket_objects.generate_urls",
+              priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
+    def generate_urls(self, bucket: Bucket | str,
+                      objects: Iterable[BucketObject | str],
+                      expires_in: int,
+                      writable: bool = False) -> list[str]:
+        urls = []
+        for obj in objects:
+            if isinstance(obj, str):
+                found = self.get(bucket, obj)
+                if found is None:
+                    raise InvalidValueException('objects', obj)
+                obj = found
+            urls.append(obj.generate_url(expires_in, writable=writable))
+        return urls
+
+    @staticmethod
+    def _delete_batch_safely(service: "BaseBucketObjectService",
+                             bucket: Bucket | str,
+                             names: list[str]) -> dict[str, Exception]:
+        # A batch that fails as a whole is reported against each of its
+        # names, so that one bad request does not stop the other batches.
+        try:
+            return service._delete_batch(bucket, names)
+        except Exception as e:
+            log.debug("Bulk delete of %d objects failed: %s", len(names), e)
+            return {name: e for name in names}
+
+    def _delete_batch(self, bucket: Bucket | str,
+                      names: list[str]) -> dict[str, Exception]:
+        """
+        Delete one batch of at most ``_DELETE_BATCH_SIZE`` objects, returning
+        the names that could not be deleted with their errors. Providers
+        override this with their bulk-delete primitive; by default, objects
+        are deleted one at a time.
+        """
+        errors: dict[str, Exception] = {}
+        for name in names:
+            try:
+                obj = self.get(bucket, name)
+                if obj is not None:
+                    obj.delete()
+            except Exception as e:
+                errors[name] = e
+        return errors
+
 
 class BaseComputeService(ComputeService, BaseCloudService):
 
@@ -263,13 +557,15 @@ class BaseVMTypeService(
         vm_type = (t for t in self if t.id == vm_type_id)
         return next(vm_type, None)
 
+    def find_iter(self, **kwargs: Any) -> Iterator[VMType]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
+
     @dispatch(event="provider.compute.vm_types.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[VMType]:
-        obj_list = list(self)
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self._provider, list(matches))
+        return ClientPagedResultList(self._provider,
+                                     list(self.find_iter(**kwargs)))
 
 
 class BaseRegionService(
@@ -279,13 +575,15 @@ class BaseRegionService(
         super(BaseRegionService, self).__init__(provider)
         self._service_event_pattern += ".compute.regions"
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Region]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
+
     @dispatch(event="provider.compute.regions.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Region]:
-        obj_list = list(self)
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self._provider, list(matches))
+        return ClientPagedResultList(self._provider,
+                                     list(self.find_iter(**kwargs)))
 
 
 class BaseNetworkingService(NetworkingService, BaseCloudService):
@@ -322,21 +620,15 @@ class BaseNetworkService(
             return self.provider.networking.networks.create(
                 BaseNetwork.CB_DEFAULT_NETWORK_LABEL, '10.0.0.0/16')
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Network]:
+        filters = ['label']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
+
     @dispatch(event="provider.networking.networks.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Network]:
-        obj_list = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise TypeError("Unrecognised parameters for search: %s."
-                            " Supported attributes: %s" % (kwargs,
-                                                           ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
 
 class BaseSubnetService(
@@ -346,18 +638,22 @@ class BaseSubnetService(
         super(BaseSubnetService, self).__init__(provider)
         self._service_event_pattern += ".networking.subnets"
 
-    @dispatch(event="provider.networking.subnets.find",
-              priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
-    def find(self, network: Network | None = None,
-             **kwargs: Any) -> ResultList[Subnet]:
+    def find_iter(self, network: Network | None = None,
+                  **kwargs: Any) -> Iterator[Subnet]:
         obj_list: Any
         if not network:
             obj_list = self
         else:
             obj_list = network.subnets
         filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self._provider, list(matches))
+        return cb_helpers.iter_find(filters, kwargs, obj_list.iter())
+
+    @dispatch(event="provider.networking.subnets.find",
+              priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
+    def find(self, network: Network | None = None,
+             **kwargs: Any) -> ResultList[Subnet]:
+        return ClientPagedResultList(
+            self._provider, list(self.find_iter(network, **kwargs)))
 
     def get_or_create_default(self) -> Subnet:
         # Look for a CB-default subnet
@@ -405,14 +701,18 @@ class BaseFloatingIPService(FloatingIPService, BaseCloudService):
     def __init__(self, provider: CloudProvider) -> None:
         super(BaseFloatingIPService, self).__init__(provider)
 
+    def find_iter(self, gateway: Gateway,
+                  **kwargs: Any) -> Iterator[FloatingIP]:
+        filters = ['name', 'public_ip']
+        return cb_helpers.iter_find(filters, kwargs,
+                                    cast(Any, gateway.floating_ips).iter())
+
     @dispatch(event="provider.networking.floating_ips.find",
               priority=BaseCloudService.STANDARD_EVENT_PRIORITY)
     def find(self, gateway: Gateway,
              **kwargs: Any) -> ResultList[FloatingIP]:
-        obj_list = list(gateway.floating_ips)
-        filters = ['name', 'public_ip']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self._provider, list(matches))
+        return ClientPagedResultList(
+            self._provider, list(self.find_iter(gateway, **kwargs)))
 
 
 class BaseDnsService(DnsService, BaseCloudService):
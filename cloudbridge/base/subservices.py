@@ -1,6 +1,8 @@
 import builtins
 import logging
 from typing import Any
+from typing import Iterable
+from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -45,6 +47,10 @@ class BaseBucketObjectSubService(BasePageableObjectMixin[BucketObject],
     def _provider(self) -> CloudProvider:
         return self.__provider
 
+    def _on_provider(self, provider: CloudProvider
+                     ) -> "BaseBucketObjectSubService":
+        return type(self)(provider, self.bucket)
+
     @property
     def _bucket_objects(self) -> BucketObjectService:
         # ``_bucket_objects`` is a base-layer member (BaseStorageService), not
@@ -56,9 +62,14 @@ class BaseBucketObjectSubService(BasePageableObjectMixin[BucketObject],
         return self._bucket_objects.get(self.bucket, name)
 
     def list(self, limit: int | None = None, marker: str | None = None,
-             prefix: str | None = None) -> ResultList[BucketObject]:
+             prefix: str | None = None,
+             delimiter: str | None = None) -> ResultList[BucketObject]:
         return self._bucket_objects.list(self.bucket, limit=limit,
-                                         marker=marker, prefix=prefix)
+                                         marker=marker, prefix=prefix,
+                                         delimiter=delimiter)
+
+    def find_iter(self, **kwargs: Any) -> Iterator[BucketObject]:
+        return self._bucket_objects.find_iter(self.bucket, **kwargs)
 
     def find(self, **kwargs: Any) -> ResultList[BucketObject]:
         return self._bucket_objects.find(self.bucket, **kwargs)
@@ -66,6 +77,28 @@ class BaseBucketObjectSubService(BasePageableObjectMixin[BucketObject],
     def create(self, name: str) -> BucketObject:
         return self._bucket_objects.create(self.bucket, name)
 
+    def delete_many(self,
+                    names_or_prefix: str | Iterable[str]
+                    ) -> dict[str, Exception]:
+        if isinstance(names_or_prefix, str):
+            names: Iterable[str] = (
+                obj.name for obj in self.iter(prefix=names_or_prefix))
+        else:
+            names = names_or_prefix
+        return self._bucket_objects.delete_many(self.bucket, names)
+
+    def generate_urls(self, objects: Iterable[BucketObject | str],
+                      expires_in: int,
+                      writable: bool = False) -> builtins.list[str]:
+        return self._bucket_objects.generate_urls(
+            self.bucket, objects, expires_in, writable=writable)
+
+    def iter_parallel(self, prefix: str | None = None,
+                      shards: Iterable[str] | None = None,
+                      delimiter: str = '/') -> Iterator[BucketObject]:
+        return self._bucket_objects.iter_parallel(
+            self.bucket, prefix=prefix, shards=shards, delimiter=delimiter)
+
 
 class BaseGatewaySubService(GatewaySubService,
                             BasePageableObjectMixin[InternetGateway]):
@@ -78,6 +111,9 @@ class BaseGatewaySubService(GatewaySubService,
     def _provider(self) -> CloudProvider:
         return self.__provider
 
+    def _on_provider(self, provider: CloudProvider) -> "BaseGatewaySubService":
+        return type(self)(provider, self._network)
+
     def get_or_create(self) -> InternetGateway:
         return (self._provider.networking
                               ._gateways
@@ -107,6 +143,10 @@ class BaseVMFirewallRuleSubService(BasePageableObjectMixin[VMFirewallRule],
     def _provider(self) -> CloudProvider:
         return self.__provider
 
+    def _on_provider(self, provider: CloudProvider
+                     ) -> "BaseVMFirewallRuleSubService":
+        return type(self)(provider, self._firewall)
+
     def get(self, rule_id: str) -> VMFirewallRule | None:
         return self._provider.security._vm_firewall_rules.get(self._firewall,
                                                               rule_id)
@@ -149,6 +189,10 @@ class BaseFloatingIPSubService(FloatingIPSubService,
     def _provider(self) -> CloudProvider:
         return self.__provider
 
+    def _on_provider(self, provider: CloudProvider
+                     ) -> "BaseFloatingIPSubService":
+        return type(self)(provider, self.gateway)
+
     def get(self, fip_id: str) -> FloatingIP | None:
         return self._provider.networking._floating_ips.get(self.gateway,
                                                            fip_id)
@@ -180,6 +224,9 @@ class BaseSubnetSubService(SubnetSubService, BasePageableObjectMixin[Subnet]):
     def _provider(self) -> CloudProvider:
         return self.__provider
 
+    def _on_provider(self, provider: CloudProvider) -> "BaseSubnetSubService":
+        return type(self)(provider, self.network)
+
     def get(self, subnet_id: str) -> Subnet | None:
         sn = self._provider.networking.subnets.get(subnet_id)
         if sn and sn.network_id != self.network.id:
@@ -219,6 +266,10 @@ class BaseDnsRecordSubService(DnsRecordSubService,
     def _provider(self) -> CloudProvider:
         return self.__provider
 
+    def _on_provider(self, provider: CloudProvider
+                     ) -> "BaseDnsRecordSubService":
+        return type(self)(provider, self.dns_zone)
+
     def get(self, rec_id: str) -> DnsRecord | None:
         # pylint:disable=protected-access
         return self._provider.dns._records.get(self.dns_zone, rec_id)
@@ -102,3 +102,13 @@ class InvalidParamException(InvalidNameException):
 
     def __init__(self, msg: str) -> None:
         super(InvalidParamException, self).__init__(msg)
+
+
+class ChecksumMismatchException(CloudBridgeBaseException):
+    """
+    Marker interface for a transfer whose data does not match the checksum
+    the provider keeps for the object, meaning the data was corrupted on its
+    way to or from the provider. Thrown when a transfer asked to verify a
+    checksum (see :class:`.TransferConfig`).
+    """
+    pass
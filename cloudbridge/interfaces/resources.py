@@ -3,6 +3,7 @@ Specifications for data objects exposed through a ``provider`` or ``service``.
 """
 from __future__ import annotations
 
+import io
 from abc import ABCMeta
 from abc import abstractmethod
 from abc import abstractproperty
@@ -17,6 +18,8 @@ from typing import TYPE_CHECKING
 from typing import TypeVar
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from cloudbridge.interfaces.provider import CloudProvider
     from cloudbridge.interfaces.subservices import BucketObjectSubService
     from cloudbridge.interfaces.subservices import DnsRecordSubService
@@ -424,6 +427,67 @@ class PageableObjectMixin(Generic[T]):
         """
         pass
 
+    @abstractmethod
+    def iter(self, prefetch: int | None = None,
+             **kwargs: Any) -> Iterator[T]:
+        """
+        Iterate through every object, paging them in with ``list`` as
+        needed. Any ``kwargs`` are passed on to ``list``.
+
+        Where the provider pages results on the server, the next pages are
+        fetched in the background while the current one is consumed.
+
+        Example:
+
+        .. code-block:: python
+
+            for obj in bucket.objects.iter(prefix='logs/', prefetch=4):
+                print(obj.name)
+
+        :type prefetch: ``int``
+        :param prefetch: The number of pages to fetch ahead of the one being
+            consumed, or 0 to fetch each page only when it is reached.
+            Defaults to the ``list_prefetch_depth`` configuration value
+            (``CB_LIST_PREFETCH_DEPTH``).
+
+        :rtype: iterator
+        :return: The objects, in the order ``list`` returns them.
+        """
+        pass
+
+    @abstractmethod
+    def find_iter(self, **kwargs: Any) -> Iterator[T]:
+        """
+        Iterate through the objects that ``find`` returns for ``kwargs``,
+        where ``find`` is supported.
+
+        Where the search is carried out on the client, pages are fetched and
+        filtered only as the matches are consumed, so a caller that stops
+        early does not fetch the whole collection.
+
+        :rtype: iterator
+        :return: The objects matching the supplied attributes.
+        """
+        pass
+
+    @abstractmethod
+    def find_first(self, **kwargs: Any) -> T | None:
+        """
+        Return the first object that ``find`` would return for ``kwargs``,
+        fetching no more pages than needed.
+
+        Example:
+
+        .. code-block:: python
+
+            obj = bucket.objects.find_first(name='logs/2026-10-*')
+
+        :rtype: object or ``None``
+        :return: The first object matching the supplied attributes, or
+            ``None`` if there is none.
+        """
+        pass
+
 
 class ResultList(list[T]):
     """
@@ -505,6 +569,18 @@ class ResultList(list[T]):
     def data(self) -> list[T]:
         pass
 
+    @abstractproperty
+    def prefixes(self) -> list[str]:
+        """
+        The common prefixes found by a listing that was given a delimiter.
+
+        When bucket objects are listed with a ``delimiter``, the names that
+        continue past it are not returned as objects but rolled up into one
+        prefix per "directory", much like the entries of a file system
+        listing. Empty for every other listing.
+        """
+        pass
+
 
 class InstanceState(object):
 
@@ -2177,7 +2253,12 @@ class TransferConfig(object):
 
     def __init__(self, threshold: int | None = None,
                  part_size: int | None = None,
-                 max_concurrency: int | None = None) -> None:
+                 max_concurrency: int | None = None,
+                 resumable: bool = False,
+                 checksum: str | None = None,
+                 adaptive: bool = False,
+                 cache: bool = True,
+                 compression: str | None = None) -> None:
         """
         :type threshold: ``int``
         :param threshold: Size in bytes above which the transfer is split
@@ -2186,20 +2267,164 @@ class TransferConfig(object):
         :type part_size: ``int``
         :param part_size: Size in bytes of each part. For uploads this must
             be at least the provider minimum (5 MiB on S3) for all but the
-            final part; downloads have no minimum.
+            final part; downloads have no minimum. If left as ``None``, the
+            configured part size is grown, for large objects, to a multiple
+            of itself that keeps the object within the provider's limit on
+            the number of parts (10,000 on S3).
 
         :type max_concurrency: ``int``
         :param max_concurrency: Maximum number of parts to transfer in
             parallel.
+
+        :type resumable: ``bool``
+        :param resumable: Keep the progress of a multi-part transfer on disk
+            when it fails, so that repeating the same call transfers only the
+            parts that are still missing. Transfers below ``threshold`` are
+            always restarted from scratch.
+
+        :type checksum: ``str``
+        :param checksum: Verify the transfer with this checksum algorithm,
+            one of ``'md5'``, ``'crc32c'`` or ``'sha256'``. The checksum is
+            computed from the data as it is sent or received, and compared
+            with the one the provider keeps for the object (the ETag on S3
+            and Swift, ``md5Hash`` or ``crc32c`` on GCS, ``Content-MD5`` on
+            Azure). A mismatch fails the transfer with a
+            :class:`.ChecksumMismatchException`. Providers may use their
+            generic transfer path, rather than their native one, to compute
+            it.
+
+        :type adaptive: ``bool``
+        :param adaptive: Adjust the number of parts in flight to the network,
+            rather than keeping it fixed. The transfer starts with a few
+            parts, and adds more for as long as doing so raises the measured
+            throughput; when a provider throttles requests, the number is
+            halved and the throttled part retried. ``max_concurrency`` is then
+            the most parts ever in flight, and defaults to the
+            ``CB_MULTIPART_ADAPTIVE_MAX_CONCURRENCY`` setting. Providers use
+            their generic transfer path, rather than their native one, to
+            adapt.
+
+        :type cache: ``bool``
+        :param cache: Serve downloads from the local object cache, and add
+            the objects downloaded to it, when one is configured with the
+            ``CB_OBJECT_CACHE_DIR`` setting. Set to ``False`` to bypass the
+            cache for this transfer.
+
+        :type compression: ``str``
+        :param compression: Compress uploads on the fly with this content
+            encoding, ``'gzip'`` or ``'zstd'`` (which needs the
+            ``zstandard`` package), and store the object with it as its
+            ``Content-Encoding``. Downloads decompress objects stored with
+            either encoding anyway, as they are received; naming one here
+            decompresses objects stored without a ``Content-Encoding``, and
+            ``'identity'`` keeps downloaded content as it is stored.
         """
         self.threshold = threshold
         self.part_size = part_size
         self.max_concurrency = max_concurrency
+        self.resumable = resumable
+        self.checksum = checksum
+        self.adaptive = adaptive
+        self.cache = cache
+        self.compression = compression
 
     def __repr__(self) -> str:
         return ("<CB-TransferConfig: threshold={0}, part_size={1}, "
-                "max_concurrency={2}>".format(
-                    self.threshold, self.part_size, self.max_concurrency))
+                "max_concurrency={2}, resumable={3}, checksum={4}, "
+                "adaptive={5}, cache={6}, compression={7}>".format(
+                    self.threshold, self.part_size, self.max_concurrency,
+                    self.resumable, self.checksum, self.adaptive,
+                    self.cache, self.compression))
+
+
+class TransferManager(object):
+    """
+    Runs a batch of uploads and downloads on one shared, bounded set of
+    workers.
+
+    Transfers are queued as they are submitted, and each returns a
+    :class:`~concurrent.futures.Future` for its result. The requests of all
+    transfers, down to the parts of multipart uploads and the ranges of large
+    downloads, share the same workers, so the number of connections in use
+    never exceeds the manager's concurrency, however many transfers are
+    queued. Obtain one with :meth:`.StorageService.transfer_manager`.
+
+    Example:
+
+    .. code-block:: python
+
+        with provider.storage.transfer_manager(max_concurrency=16) as tm:
+            futures = {path: tm.upload_file(path, bucket, name)
+                       for path, name in artifacts}
+        for path, future in futures.items():
+            future.result()  # raises if the upload failed
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def upload_file(self, path: str, bucket: Bucket | str, name: str,
+                    config: TransferConfig | None = None
+                    ) -> Future[BucketObject]:
+        """
+        Queue the upload of a local file.
+
+        :type path: ``str``
+        :param path: The file to upload.
+
+        :type bucket: :class:`.Bucket` or ``str``
+        :param bucket: The bucket, or bucket name, to upload to.
+
+        :type name: ``str``
+        :param name: The name of the object to create.
+
+        :type config: :class:`.TransferConfig`
+        :param config: Per-transfer tuning, as for
+            :meth:`.BucketObject.upload_from_file`. Its ``max_concurrency``
+            limits how many parts of this file are in flight at once.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        :return: A future for the uploaded :class:`.BucketObject`.
+        """
+        pass
+
+    @abstractmethod
+    def download_file(self, bucket: Bucket | str, name: str, path: str,
+                      config: TransferConfig | None = None) -> Future[None]:
+        """
+        Queue the download of an object to a local file.
+
+        :type bucket: :class:`.Bucket` or ``str``
+        :param bucket: The bucket, or bucket name, to download from.
+
+        :type name: ``str``
+        :param name: The name of the object to download.
+
+        :type path: ``str``
+        :param path: The file to write, which is replaced only once the
+            download is complete.
+
+        :type config: :class:`.TransferConfig`
+        :param config: Per-transfer tuning, as for
+            :meth:`.BucketObject.download_to_file`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        :return: A future that is done when the file has been written.
+        """
+        pass
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """
+        Wait for every queued transfer to finish and release the workers.
+        No transfers can be submitted afterwards.
+        """
+        pass
+
+    def __enter__(self) -> TransferManager:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
 
 
 class UploadPart(object):
@@ -2361,6 +2586,9 @@ class BucketObject(CloudResource):
         """
         Returns this object's content as an iterable.
 
+        Content stored with a ``gzip`` or ``zstd`` ``Content-Encoding`` is
+        decompressed as it is read.
+
         :rtype: Iterable
         :return: An iterable of the file contents
 
@@ -2374,6 +2602,46 @@ class BucketObject(CloudResource):
         """
         pass
 
+    @abstractmethod
+    def open(self, block_size: int | None = None,
+             cache_blocks: int | None = None,
+             read_ahead: int | None = None) -> io.RawIOBase:
+        """
+        Open this object for random-access reading.
+
+        Returns a read-only, seekable file object. Content is fetched in
+        blocks of ``block_size`` bytes with ranged reads, so seeking within a
+        large object (e.g. to read a zip central directory or a Parquet
+        footer) only transfers the blocks that are actually read. Recently
+        read blocks are cached, and sequential reads fetch the next
+        ``read_ahead`` blocks in the background.
+
+        Example:
+
+        .. code-block:: python
+
+            with obj.open() as f:
+                f.seek(-8, os.SEEK_END)
+                footer = f.read(8)
+
+        :type block_size: ``int``
+        :param block_size: Size in bytes of each ranged read. Defaults to the
+            provider/global ``reader_block_size`` (``CB_READER_BLOCK_SIZE``).
+
+        :type cache_blocks: ``int``
+        :param cache_blocks: Maximum number of blocks kept in memory.
+            Defaults to ``reader_cache_blocks`` (``CB_READER_CACHE_BLOCKS``).
+
+        :type read_ahead: ``int``
+        :param read_ahead: Number of blocks to prefetch in parallel during
+            sequential reads; ``0`` disables read-ahead. Defaults to
+            ``reader_read_ahead`` (``CB_READER_READ_AHEAD``).
+
+        :rtype: :class:`io.RawIOBase`
+        :return: A readable, seekable file object over this object's content.
+        """
+        pass
+
     @abstractmethod
     def download_to_file(self, path: str,
                          config: TransferConfig | None = None) -> None:
@@ -2387,6 +2655,17 @@ class BucketObject(CloudResource):
         streamed in a single request. ``iter_content``/``save_content``
         remain single-stream alternatives for arbitrary target streams.
 
+        Objects stored with a ``gzip`` or ``zstd`` ``Content-Encoding`` are
+        fetched as stored, and decompressed into ``path`` (see
+        :class:`.TransferConfig` ``compression``).
+
+        With ``TransferConfig(resumable=True)``, a failed ranged download
+        keeps its partial file (``<path>.cbpart``) and a small progress
+        journal next to ``path`` instead of deleting them, and repeating the
+        call fetches only the ranges that are still missing, provided the
+        object has not changed in the meantime. Resumable downloads to the
+        same path must not run concurrently.
+
         :type path: ``str``
         :param path: Local path to write the object's content to. The object
             is assembled out of the way and moved into place once complete,
@@ -2403,11 +2682,24 @@ class BucketObject(CloudResource):
         pass
 
     @abstractmethod
-    def upload(self, source_stream: IO[bytes],
+    def upload(self, source_stream: IO[bytes] | Iterable[bytes],
                config: TransferConfig | None = None) -> BucketObject | None:
         """
         Set the contents of the object to the data read from the source stream.
 
+        Payloads larger than the configured multipart threshold are uploaded
+        in parts. The source may also be a stream whose size is not known in
+        advance, such as a pipe, or an iterable of ``bytes`` chunks, such as a
+        generator. These are read up to the threshold, then sent in a single
+        request if they end there, or uploaded in parts otherwise, until they
+        are exhausted. As the size of such a payload is not known, the part
+        size is not grown to fit it within the provider's limit on the number
+        of parts; set ``part_size`` for very large streams.
+
+        :type source_stream: file-like object or iterable of ``bytes``
+        :param source_stream: The content to upload. ``str`` and ``bytes``
+            are accepted too.
+
         :type config: :class:`.TransferConfig`
         :param config: Optional per-call upload tuning (multipart threshold,
             part size, concurrency). Any field left unset falls back to the
@@ -2427,6 +2719,15 @@ class BucketObject(CloudResource):
         Files larger than the configured multipart threshold are streamed to
         the provider in parts, so the whole file is never held in memory.
 
+        With ``TransferConfig(resumable=True)``, the multipart upload of a
+        large file is not aborted when it fails. Its upload id and completed
+        parts are kept in a session file next to the source
+        (``<path>.cbupload``), and repeating the call with the same settings
+        continues the same upload, sending only the parts that are still
+        missing, provided the file has not been modified in the meantime.
+        Delete the session file to start over instead. Resumable uploads of
+        the same file must not run concurrently.
+
         :type path: ``str``
         :param path: Absolute path to the file to be uploaded to S3.
 
@@ -2437,6 +2738,42 @@ class BucketObject(CloudResource):
         """
         pass
 
+    @abstractmethod
+    def copy_to(self, bucket: Bucket | str, name: str | None = None,
+                config: TransferConfig | None = None) -> BucketObject:
+        """
+        Copy this object to another bucket or name, within the provider.
+
+        The content never passes through this host: the copy is made by the
+        provider (S3 ``CopyObject``, or ``UploadPartCopy`` of parallel parts
+        for large objects; GCS ``rewrite``; Swift ``COPY``; Azure
+        ``start_copy_from_url``). Providers that copy asynchronously are
+        polled until the copy has finished. To move an object, copy it and
+        delete the original.
+
+        Example:
+
+        .. code-block:: python
+
+            obj = bucket.objects.get('incoming/data.csv')
+            obj.copy_to(archive_bucket, 'data/2024/data.csv')
+
+        :type bucket: :class:`.Bucket` or ``str``
+        :param bucket: The bucket to copy to, or its name. It may be this
+            object's own bucket.
+
+        :type name: ``str``
+        :param name: The name of the copy. Defaults to this object's name.
+
+        :type config: :class:`.TransferConfig`
+        :param config: Optional tuning of copies made in parts (threshold,
+            part size, concurrency), where the provider copies in parts.
+
+        :rtype: :class:`.BucketObject`
+        :return: The copy.
+        """
+        pass
+
     @abstractmethod
     def create_multipart_upload(self) -> MultipartUpload:
         """
@@ -2458,6 +2795,31 @@ class BucketObject(CloudResource):
         """
         pass
 
+    @abstractmethod
+    def resume_multipart_upload(self, upload_id: str) -> MultipartUpload:
+        """
+        Return a handle for an in-progress multipart upload to this object,
+        begun earlier with :meth:`create_multipart_upload`.
+
+        This lets a process carry on with an upload started by another (or
+        by itself before a restart) given only the upload's ``id``. Parts
+        already uploaded do not need to be sent again, but their
+        :class:`.UploadPart` handles must still be passed to
+        :meth:`.MultipartUpload.complete`.
+
+        If the upload was aborted or has expired, providers that keep track
+        of uploads raise their error for it here; others raise it when parts
+        are uploaded or the upload is completed.
+
+        :type upload_id: ``str``
+        :param upload_id: The ``id`` of the :class:`.MultipartUpload` to
+            resume.
+
+        :rtype: :class:`.MultipartUpload`
+        :return: A multipart upload handle for this object.
+        """
+        pass
+
     @abstractmethod
     def delete(self) -> None:
         """
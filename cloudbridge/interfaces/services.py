@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import builtins
 from abc import ABCMeta, abstractmethod, abstractproperty
+from collections.abc import Iterable
 from collections.abc import Iterator
 from typing import Any, IO, TYPE_CHECKING
 
@@ -28,6 +29,7 @@ from cloudbridge.interfaces.resources import Router
 from cloudbridge.interfaces.resources import Snapshot
 from cloudbridge.interfaces.resources import Subnet
 from cloudbridge.interfaces.resources import TrafficDirection
+from cloudbridge.interfaces.resources import TransferManager
 from cloudbridge.interfaces.resources import UploadPart
 from cloudbridge.interfaces.resources import VMFirewall
 from cloudbridge.interfaces.resources import VMFirewallRule
@@ -554,6 +556,37 @@ class StorageService(CloudService):
         """
         pass
 
+    @abstractmethod
+    def transfer_manager(self, max_concurrency: int | None = None
+                         ) -> TransferManager:
+        """
+        Create a manager that runs many object transfers on one shared pool
+        of workers, instead of each transfer setting up its own.
+
+        Example:
+
+        .. code-block:: python
+
+            bucket = provider.storage.buckets.get('my_bucket')
+            with provider.storage.transfer_manager() as tm:
+                futures = [tm.download_file(bucket, obj.name,
+                                            '/tmp/' + obj.name)
+                           for obj in bucket.objects.list(prefix='logs/')]
+            for future in futures:
+                future.result()
+
+        :type max_concurrency: ``int``
+        :param max_concurrency: The number of workers, and so the largest
+            number of requests in flight at once across all transfers.
+            Defaults to the ``transfer_max_concurrency`` configuration value
+            (``CB_TRANSFER_MAX_CONCURRENCY``, 10 if not set).
+
+        :rtype: :class:`.TransferManager`
+        :return: A manager, which should be shut down when no longer needed,
+            e.g. by using it as a context manager.
+        """
+        pass
+
 
 class ImageService(PageableObjectMixin[MachineImage], CloudService):
 
@@ -1257,13 +1290,35 @@ class BucketObjectService(CloudService):
         """
         pass
 
+    @abstractmethod
+    def find_iter(self, bucket: Bucket | str,
+                  **kwargs: Any) -> Iterator[BucketObject]:
+        """
+        Iterate through the bucket objects that :meth:`find` returns for
+        ``kwargs``.
+
+        Only objects whose names start with the literal part of a ``name``
+        pattern are listed, a page at a time as the matches are consumed, so
+        a caller that stops early lists no further.
+
+        :type bucket: :class:`.Bucket`
+        :param bucket: The bucket to search.
+
+        :rtype: iterator of :class:`.BucketObject`
+        :return: The objects matching the supplied attributes.
+        """
+        pass
+
     @abstractmethod
     def list(self, bucket: Bucket | str, prefix: str | None = None,
-             limit: int | None = None,
-             marker: str | None = None) -> ResultList[BucketObject]:
+             limit: int | None = None, marker: str | None = None,
+             delimiter: str | None = None) -> ResultList[BucketObject]:
         """
         List all bucket objects within a bucket.
 
+        If a ``delimiter`` is given, only one level of the bucket is listed;
+        see :meth:`.BucketObjectSubService.list`.
+
         Example:
 
         .. code-block:: python
@@ -1410,6 +1465,127 @@ class BucketObjectService(CloudService):
         """
         pass
 
+    @abstractmethod
+    def iter_range(self, bucket: Bucket | str, object_name: str,
+                   offset: int, length: int) -> Iterator[bytes]:
+        """
+        Stream a byte range of an object.
+
+        Like :meth:`download_range`, but the range is yielded in chunks as it
+        arrives, so it is never held in memory whole. Parallel ranged
+        downloads use this to write each range straight into the file.
+
+        :type bucket: :class:`.Bucket`
+        :param bucket: The bucket containing the object.
+
+        :type object_name: ``str``
+        :param object_name: The key of the object to read.
+
+        :type offset: ``int``
+        :param offset: Zero-based byte offset to start reading at.
+
+        :type length: ``int``
+        :param length: Number of bytes to read.
+
+        :rtype: iterator of ``bytes``
+        :return: Consecutive chunks of the requested byte range.
+        """
+        pass
+
+    @abstractmethod
+    def delete_many(self, bucket: Bucket | str,
+                    names: Iterable[str]) -> dict[str, Exception]:
+        """
+        Delete many objects from a bucket.
+
+        Names are grouped into batches, each deleted with the provider's
+        bulk-delete primitive where it has one (S3 ``DeleteObjects``, Swift
+        bulk delete, Azure blob batch, GCS batch requests), with several
+        batches in flight at once. A failure to delete one object does not
+        stop the others from being deleted. Names of objects that do not
+        exist are not errors.
+
+        :type bucket: :class:`.Bucket`
+        :param bucket: The bucket containing the objects.
+
+        :type names: iterable of ``str``
+        :param names: Keys of the objects to delete. The iterable is consumed
+            lazily, so it may be a generator over a listing.
+
+        :rtype: ``dict``
+        :return: The objects that could not be deleted, mapping each name to
+            the error it failed with. Empty if every object was deleted.
+        """
+        pass
+
+    @abstractmethod
+    def generate_urls(self, bucket: Bucket | str,
+                      objects: Iterable[BucketObject | str],
+                      expires_in: int,
+                      writable: bool = False) -> builtins.list[str]:
+        """
+        Generate signed URLs to many objects of a bucket.
+
+        This is equivalent to calling :meth:`.BucketObject.generate_url` on
+        each object, but providers that need a request to sign URLs make it
+        once for the whole batch (Azure fetches one user delegation key), and
+        objects given by name are signed without being fetched where the
+        provider allows it.
+
+        :type bucket: :class:`.Bucket`
+        :param bucket: The bucket containing the objects.
+
+        :type objects: iterable of :class:`.BucketObject` or ``str``
+        :param objects: The objects, or their names, to sign URLs to.
+
+        :type expires_in: ``int``
+        :param expires_in: Time to live of the URLs in seconds.
+
+        :type writable: ``bool``
+        :param writable: Sign the URLs for uploading to, rather than reading,
+            the objects.
+
+        :rtype: ``list`` of ``str``
+        :return: A URL to each object, in the order they were given.
+        """
+        pass
+
+    @abstractmethod
+    def iter_parallel(self, bucket: Bucket | str, prefix: str | None = None,
+                      shards: Iterable[str] | None = None,
+                      delimiter: str = '/') -> Iterator[BucketObject]:
+        """
+        Iterate over the objects of a bucket, listing several parts of it at
+        once.
+
+        The keyspace is split into shards, prefixes that are each walked
+        page by page with :meth:`list`, with several page requests in flight
+        at once. Objects are yielded as their pages arrive, so they are not
+        in name order.
+
+        :type bucket: :class:`.Bucket`
+        :param bucket: The bucket to list.
+
+        :type prefix: ``str``
+        :param prefix: Only objects whose names start with this are listed.
+
+        :type shards: iterable of ``str``
+        :param shards: The prefixes, relative to ``prefix``, to list in
+            parallel. They must not overlap, and every object to be listed
+            must start with one of them. If not given, shards are discovered
+            by listing the bucket one level at a time with ``delimiter``,
+            until there are enough of them for every worker. Folders that
+            hold no further folders are not descended into, but listed whole
+            as shards.
+
+        :type delimiter: ``str``
+        :param delimiter: The separator used to discover shards.
+
+        :rtype: iterator of :class:`.BucketObject`
+        :return: The objects, in no particular order.
+        """
+        pass
+
 
 class SecurityService(CloudService):
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 import builtins
 from abc import ABCMeta
 from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import Any
 
 from cloudbridge.interfaces.resources import BucketObject
@@ -40,10 +42,22 @@ class BucketObjectSubService(PageableObjectMixin[BucketObject]):
     @abstractmethod
     # pylint:disable=arguments-differ
     def list(self, limit: int | None = None, marker: str | None = None,
-             prefix: str | None = None) -> ResultList[BucketObject]:
+             prefix: str | None = None,
+             delimiter: str | None = None) -> ResultList[BucketObject]:
         """
         List objects in this bucket.
 
+        Example:
+
+        .. code-block:: python
+
+            # List one level of a bucket, as a directory listing would
+            page = bucket.objects.list(prefix='logs/', delimiter='/')
+            for obj in page:
+                print("File:", obj.name)
+            for prefix in page.prefixes:
+                print("Folder:", prefix)
+
         :type limit: ``int``
         :param limit: Maximum number of elements to return.
 
@@ -53,6 +67,13 @@ class BucketObjectSubService(PageableObjectMixin[BucketObject]):
         :type prefix: ``str``
         :param prefix: Prefix criteria by which to filter listed objects.
 
+        :type delimiter: ``str``
+        :param delimiter: If given, only the objects whose names do not
+            contain the delimiter after the prefix are listed. The others are
+            grouped by their name up to and including the first delimiter,
+            and those common prefixes are returned in the ``prefixes``
+            property of the result. The limit counts both.
+
         :rtype: List of ``objects`` of :class:``.BucketObject``
         :return: List of all available BucketObjects within this bucket.
         """
@@ -86,6 +107,106 @@ class BucketObjectSubService(PageableObjectMixin[BucketObject]):
         """
         pass
 
+    @abstractmethod
+    def delete_many(self,
+                    names_or_prefix: str | Iterable[str]
+                    ) -> dict[str, Exception]:
+        """
+        Delete many objects from this bucket in bulk.
+
+        Example:
+
+        .. code-block:: python
+
+            # Delete everything under scratch/
+            errors = bucket.objects.delete_many('scratch/')
+            # Delete specific objects
+            errors = bucket.objects.delete_many(['a.txt', 'b.txt'])
+
+        See :meth:`.BucketObjectService.delete_many` for how the deletes are
+        batched.
+
+        :type names_or_prefix: ``str`` or iterable of ``str``
+        :param names_or_prefix: A string deletes every object whose name
+            starts with it; any other iterable is taken as the names of the
+            objects to delete.
+
+        :rtype: ``dict``
+        :return: The objects that could not be deleted, mapping each name to
+            the error it failed with. Empty if every object was deleted.
+        """
+        pass
+
+    @abstractmethod
+    def generate_urls(self, objects: Iterable[BucketObject | str],
+                      expires_in: int,
+                      writable: bool = False) -> builtins.list[str]:
+        """
+        Generate signed URLs to many objects in this bucket.
+
+        Example:
+
+        .. code-block:: python
+
+            page = bucket.objects.list(prefix='gallery/')
+            urls = bucket.objects.generate_urls(page, expires_in=3600)
+
+        See :meth:`.BucketObjectService.generate_urls` for how the URLs are
+        signed.
+
+        :type objects: iterable of :class:`.BucketObject` or ``str``
+        :param objects: The objects, or their names, to sign URLs to.
+
+        :type expires_in: ``int``
+        :param expires_in: Time to live of the URLs in seconds.
+
+        :type writable: ``bool``
+        :param writable: Sign the URLs for uploading to, rather than reading,
+            the objects.
+
+        :rtype: ``list`` of ``str``
+        :return: A URL to each object, in the order they were given.
+        """
+        pass
+
+    @abstractmethod
+    def iter_parallel(self, prefix: str | None = None,
+                      shards: Iterable[str] | None = None,
+                      delimiter: str = '/') -> Iterator[BucketObject]:
+        """
+        Iterate over the objects in this bucket, listing several parts of it
+        at once.
+
+        Example:
+
+        .. code-block:: python
+
+            # Walk a bucket, splitting it at its top level folders
+            for obj in bucket.objects.iter_parallel():
+                print(obj.name, obj.size)
+            # Walk only the given parts of a bucket
+            for obj in bucket.objects.iter_parallel(
+                    prefix='logs/', shards=['2025/', '2026/']):
+                print(obj.name)
+
+        See :meth:`.BucketObjectService.iter_parallel` for how the bucket is
+        split.
+
+        :type prefix: ``str``
+        :param prefix: Only objects whose names start with this are listed.
+
+        :type shards: iterable of ``str``
+        :param shards: The non-overlapping prefixes, relative to ``prefix``,
+            to list in parallel. Discovered with ``delimiter`` if not given.
+
+        :type delimiter: ``str``
+        :param delimiter: The separator used to discover shards.
+
+        :rtype: iterator of :class:`.BucketObject`
+        :return: The objects, in no particular order.
+        """
+        pass
+
 
 class GatewaySubService(PageableObjectMixin[InternetGateway]):
     """
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from typing import Any
+from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import TypeVar
 
@@ -246,8 +247,10 @@ class BotoGenericService(object):
         pag_type, resume_token, boto_objs = self._make_query(collection,
                                                              limit,
                                                              marker)
+
         # Wrap in CB objects.
-        results = [self.cb_resource(self.provider, obj) for obj in boto_objs]
+        def wrap() -> list[CloudResource]:
+            return [self.cb_resource(self.provider, obj) for obj in boto_objs]
 
         if pag_type == 'server':
             log.debug("Using server pagination.")
@@ -256,11 +259,13 @@ class BotoGenericService(object):
                                          marker=resume_token if resume_token
                                          else None,
                                          supports_total=False,
-                                         data=results)
+                                         data=wrap())
         else:
             log.debug("Did not received a resume token, will page in client"
                       " if necessary.")
-            return ClientPagedResultList(self.provider, results,
+            # The collection is only iterated, and so queried, if the page
+            # is not served from a snapshot.
+            return ClientPagedResultList(self.provider, wrap,
                                          limit=limit, marker=marker)
 
     def find(self, filters: dict[str, Any], limit: int | None = None,
@@ -281,6 +286,20 @@ class BotoGenericService(object):
             collection = collection.filter(**kwargs)
         return self.list(limit=limit, marker=marker, collection=collection)
 
+    def find_iter(self, filters: dict[str, Any],
+                  **kwargs: Any) -> Iterator[CloudResource]:
+        """
+        Iterate through every resource matching ``filters``, as ``find``
+        returns them, fetching the next page only once the previous one has
+        been consumed.
+        """
+        result_list = self.find(filters, **kwargs)
+        yield from result_list
+        while result_list.is_truncated:
+            result_list = self.find(filters, marker=result_list.marker,
+                                    **kwargs)
+            yield from result_list
+
     def create(self, boto_method: str, **kwargs: Any) -> Any:
         """
         Creates a resource
@@ -3,6 +3,7 @@ import logging
 from typing import Any
 
 import boto3
+from boto3.resources.base import ServiceResource
 
 from botocore.client import Config
 
@@ -117,6 +118,27 @@ class AWSCloudProvider(BaseCloudProvider):
     def dns(self) -> DnsService:
         return self._dns
 
+    def _rebind_native(self, value: Any) -> Any:
+        # boto3 resources make requests through the client of the connection
+        # they were made from, so they are remade from this provider's own,
+        # with the data they have loaded. Those of another region than this
+        # provider's connection are kept as they are.
+        if not isinstance(value, ServiceResource) or \
+                value.meta.service_name not in ('ec2', 's3'):
+            return value
+        conn = self.ec2_conn if value.meta.service_name == 'ec2' \
+            else self.s3_conn
+        if value.meta.client.meta.region_name != \
+                conn.meta.client.meta.region_name:
+            return value
+        factory = getattr(conn, value.meta.resource_model.name, None)
+        if factory is None:
+            return value
+        rebound = factory(*[getattr(value, identifier)
+                            for identifier in value.meta.identifiers])
+        rebound.meta.data = value.meta.data
+        return rebound
+
     def _connect_ec2(self) -> Any:
         """
         Get a boto ec2 connection object.
@@ -6,6 +6,7 @@ from __future__ import annotations
 import hashlib
 import inspect
 import logging
+import os
 from typing import Any
 from typing import IO
 from typing import Iterable
@@ -30,6 +31,7 @@ from cloudbridge.base.resources import BaseInternetGateway
 from cloudbridge.base.resources import BaseKeyPair
 from cloudbridge.base.resources import BaseLaunchConfig
 from cloudbridge.base.resources import BaseMachineImage
+from cloudbridge.base.resources import BaseMultipartUpload
 from cloudbridge.base.resources import BaseNetwork
 from cloudbridge.base.resources import BasePlacementZone
 from cloudbridge.base.resources import BaseRegion
@@ -42,6 +44,7 @@ from cloudbridge.base.resources import BaseVMType
 from cloudbridge.base.resources import BaseVolume
 from cloudbridge.interfaces.exceptions import ProviderInternalException
 from cloudbridge.interfaces.resources import AttachmentInfo
+from cloudbridge.interfaces.resources import Bucket
 from cloudbridge.interfaces.resources import BucketObject
 from cloudbridge.interfaces.resources import FloatingIP
 from cloudbridge.interfaces.resources import Gateway
@@ -50,6 +53,7 @@ from cloudbridge.interfaces.resources import Instance
 from cloudbridge.interfaces.resources import InstanceState
 from cloudbridge.interfaces.resources import MachineImage
 from cloudbridge.interfaces.resources import MachineImageState
+from cloudbridge.interfaces.resources import MultipartUpload
 from cloudbridge.interfaces.resources import NetworkState
 from cloudbridge.interfaces.resources import PlacementZone
 from cloudbridge.interfaces.resources import RouterState
@@ -74,6 +78,7 @@ from .subservices import AWSSubnetSubService
 from .subservices import AWSVMFirewallRuleSubService
 
 if TYPE_CHECKING:
+    from cloudbridge.interfaces.services import BucketObjectService
     from cloudbridge.providers.aws.provider import AWSCloudProvider
 
 log = logging.getLogger(__name__)
@@ -883,6 +888,8 @@ class AWSBucketObject(BaseBucketObject):
     def __init__(self, provider: AWSCloudProvider, obj: Any) -> None:
         super(AWSBucketObject, self).__init__(provider)
         self._obj = obj
+        # The Content-Encoding of the content last fetched, if any.
+        self._fetched_encoding: str | None = None
 
     @property
     def id(self) -> str:
@@ -903,6 +910,84 @@ class AWSBucketObject(BaseBucketObject):
     def last_modified(self) -> str:
         return self._obj.last_modified.strftime("%Y-%m-%dT%H:%M:%S.%f")
 
+    @property
+    def _etag(self) -> str | None:
+        return self._obj.e_tag
+
+    @property
+    def _content_encoding(self) -> str | None:
+        try:
+            return self._obj.content_encoding
+        except AttributeError:
+            # An s3.ObjectSummary, as listed, carries no headers. Rather than
+            # make a HEAD request for it, its encoding is only known once its
+            # content has been fetched.
+            return self._fetched_encoding
+
+    def _set_content_encoding(self, service: "BucketObjectService",
+                              encoding: str) -> None:
+        # S3 takes the Content-Encoding with the upload itself (see
+        # _encoding_args), as metadata could only be replaced afterwards by
+        # copying the whole object onto itself.
+        pass
+
+    def _encoding_args(self, config: TransferConfig | None = None
+                       ) -> dict[str, str]:
+        # The arguments storing an upload with the Content-Encoding it is
+        # compressed with, if any.
+        encoding = self._upload_encoding(config)
+        return {'ContentEncoding': encoding} if encoding else {}
+
+    def _stored_checksum(self, algorithm: str
+                         ) -> tuple[bytes, int | None] | None:
+        # The ETag is the MD5 of the content, or for multipart uploads, of
+        # the MD5s of the parts followed by their number, unless the object
+        # is encrypted with a KMS or customer-provided key.
+        if algorithm != 'md5':
+            return None
+        encryption = getattr(self._obj, 'server_side_encryption', None)
+        if encryption == 'aws:kms' or \
+                getattr(self._obj, 'sse_customer_algorithm', None):
+            return None
+        digest, _, part_count = (self._obj.e_tag or '').strip('"') \
+            .partition('-')
+        try:
+            value = bytes.fromhex(digest)
+            if not part_count:
+                return value, None
+            count = int(part_count)
+        except ValueError:
+            return None
+        # The ETag does not say where the parts end. Uploaders split objects
+        # into parts of one size, the last excepted, so that of the first
+        # part gives them all, if it agrees with their number.
+        head = self._obj.meta.client.head_object(
+            Bucket=self._obj.bucket_name, Key=self.id, PartNumber=1)
+        part_size = head['ContentLength']
+        if head.get('PartsCount', count) != count or part_size < 1 or \
+                -(-self.size // part_size) != count:
+            return None
+        return value, part_size
+
+    # Error codes S3 answers with when requests must slow down.
+    _THROTTLING_CODES = frozenset(['SlowDown', 'Throttling',
+                                   'ThrottlingException',
+                                   'RequestLimitExceeded',
+                                   'TooManyRequestsException',
+                                   'ServiceUnavailable', '503'])
+
+    @staticmethod
+    def _is_throttling_error(error: BaseException) -> bool:
+        if not isinstance(error, ClientError):
+            return False
+        return (error.response.get('Error', {}).get('Code') in
+                AWSBucketObject._THROTTLING_CODES)
+
+    @staticmethod
+    def _is_missing_upload_error(error: BaseException) -> bool:
+        return (isinstance(error, ClientError) and
+                error.response.get('Error', {}).get('Code') == 'NoSuchUpload')
+
     @property
     def bucket(self) -> AWSBucket:
         return AWSBucket(
@@ -910,52 +995,114 @@ class AWSBucketObject(BaseBucketObject):
             cast("AWSCloudProvider", self._provider).s3_conn
             .Bucket(self._obj.bucket_name))
 
-    def iter_content(self) -> Iterable[bytes]:
-        return self.BucketObjIterator(self._obj.get().get('Body'))
+    def _iter_content(self) -> Iterable[bytes]:
+        response = self._obj.get()
+        self._fetched_encoding = response.get('ContentEncoding')
+        return self.BucketObjIterator(response.get('Body'))
 
-    def _upload_single_shot(self,
-                            data: str | bytes | IO[bytes]) -> BucketObject:
-        self._obj.put(Body=data)
+    def _upload_single_shot(self, data: str | bytes | IO[bytes],
+                            config: TransferConfig | None = None
+                            ) -> BucketObject:
+        self._obj.put(Body=data, **self._encoding_args(config))
         return self
 
+    def _create_upload(self, service: "BucketObjectService",
+                       config: TransferConfig | None = None
+                       ) -> MultipartUpload:
+        extra_args = self._encoding_args(config)
+        if not extra_args:
+            return super(AWSBucketObject, self)._create_upload(
+                service, config)
+        provider = cast("AWSCloudProvider", service.provider)
+        response = provider.s3_conn.meta.client.create_multipart_upload(
+            Bucket=self._obj.bucket_name, Key=self.id, **extra_args)
+        return BaseMultipartUpload(provider, self.bucket, self.id,
+                                   response['UploadId'])
+
+    def _resume_upload(self, service: "BucketObjectService",
+                       upload_id: str) -> MultipartUpload:
+        # S3 keeps track of uploads, so one that was aborted, or expired by
+        # a lifecycle rule, is reported here, as NoSuchUpload, rather than by
+        # the first part sent to it.
+        provider = cast("AWSCloudProvider", service.provider)
+        provider.s3_conn.meta.client.list_parts(
+            Bucket=self._obj.bucket_name, Key=self.id, UploadId=upload_id,
+            MaxParts=1)
+        return super(AWSBucketObject, self)._resume_upload(service,
+                                                           upload_id)
+
     def _upload_multipart(
             self, stream: IO[bytes],
             config: TransferConfig | None = None) -> BucketObject:
+        if self._needs_generic_driver(config):
+            # boto3 neither exposes the data of the parts it sends, nor
+            # adapts its concurrency, so verified or adaptive uploads use the
+            # generic driver.
+            return super(AWSBucketObject, self)._upload_multipart(
+                stream, config)
         # boto3's TransferManager uploads parts concurrently with a thread-safe
         # client, so the transparent multipart path delegates to it rather than
         # CloudBridge's generic clone-pool driver.
+        part_size = self._multipart_part_size(config, self._data_size(stream))
         transfer_config = S3TransferConfig(
-            multipart_threshold=self._multipart_part_size(config),
-            multipart_chunksize=self._multipart_part_size(config),
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
             max_concurrency=self._multipart_max_concurrency(config))
-        self._obj.upload_fileobj(stream, Config=transfer_config)
+        self._obj.upload_fileobj(stream, ExtraArgs=self._encoding_args(config),
+                                 Config=transfer_config)
         return self
 
     def upload_from_file(self, path: str,
                          config: TransferConfig | None = None) -> BucketObject:
+        if self._needs_generic_file_upload(path, config):
+            # boto3 neither exposes the data it sends, nor adapts its
+            # concurrency, nor reports which parts have completed, so
+            # verified, adaptive or resumable uploads use the generic driver.
+            return super(AWSBucketObject, self).upload_from_file(path, config)
         # boto3's upload_file streams large files in parts via its
         # TransferManager. Drive it with CloudBridge's multipart knobs so that
         # upload_from_file and upload() honour the same configuration rather
         # than boto3's own defaults.
         transfer_config = S3TransferConfig(
             multipart_threshold=self._multipart_threshold(config),
-            multipart_chunksize=self._multipart_part_size(config),
+            multipart_chunksize=self._multipart_part_size(
+                config, os.path.getsize(path)),
             max_concurrency=self._multipart_max_concurrency(config))
         self._obj.upload_file(path, Config=transfer_config)
         return self
 
     def _download_to_path(self, path: str,
                           config: TransferConfig | None = None) -> None:
+        if self._needs_generic_driver(config):
+            # Verified downloads digest each range as they write it, and
+            # adaptive ones pace their ranges, in the generic driver.
+            super(AWSBucketObject, self)._download_to_path(path, config)
+            return
         # boto3's TransferManager downloads large objects as parallel ranged
         # GETs with a thread-safe client, so the transparent ranged path
         # delegates to it rather than CloudBridge's generic clone-pool driver.
         transfer_config = S3TransferConfig(
             multipart_threshold=self._multipart_threshold(config),
-            multipart_chunksize=self._multipart_part_size(config),
+            multipart_chunksize=self._multipart_part_size(config, self.size),
             max_concurrency=self._multipart_max_concurrency(config))
         self._obj.meta.client.download_file(
             self._obj.bucket_name, self.id, path, Config=transfer_config)
 
+    def _copy_to(self, bucket: Bucket, name: str,
+                 config: TransferConfig | None = None) -> BucketObject:
+        # boto3's managed copy makes a single CopyObject request for small
+        # objects, and copies larger ones as UploadPartCopy requests, made
+        # concurrently. CopyObject is limited to the largest part (5 GiB).
+        transfer_config = S3TransferConfig(
+            multipart_threshold=min(self._multipart_threshold(config),
+                                    self.CB_MULTIPART_MAX_PART_SIZE),
+            multipart_chunksize=self._multipart_part_size(config, self.size),
+            max_concurrency=self._multipart_max_concurrency(config))
+        cast(AWSBucket, bucket)._bucket.copy(
+            {'Bucket': self._obj.bucket_name, 'Key': self.id}, name,
+            Config=transfer_config)
+        return cast(BucketObject, bucket.objects.get(name))
+
     def delete(self) -> None:
         self._obj.delete()
 
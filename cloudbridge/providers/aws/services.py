@@ -8,6 +8,7 @@ import string
 import uuid
 from typing import Any
 from typing import IO
+from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -246,9 +247,18 @@ class AWSVMFirewallService(BaseVMFirewallService):
             obj.description = description
         return obj
 
+    def find_iter(self, **kwargs: Any) -> Iterator[VMFirewall]:
+        # find() filters on the server, so its pages are only followed.
+        return cast(Iterator[VMFirewall],
+                    self.svc.find_iter(filters=self._find_filters(kwargs)))
+
     @dispatch(event="provider.security.vm_firewalls.find",
               priority=BaseVMFirewallService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[VMFirewall]:
+        return self.svc.find(filters=self._find_filters(kwargs))
+
+    @staticmethod
+    def _find_filters(kwargs: dict[str, Any]) -> dict[str, Any]:
         # Filter by name or label
         label = kwargs.pop('label', None)
         log.debug("Searching for Firewall Service %s", label)
@@ -257,7 +267,7 @@ class AWSVMFirewallService(BaseVMFirewallService):
             raise InvalidParamException(
                 "Unrecognised parameters for search: %s. Supported "
                 "attributes: %s" % (kwargs, 'label'))
-        return self.svc.find(filters={'tag:Name': label})
+        return {'tag:Name': label}
 
     @dispatch(event="provider.security.vm_firewalls.delete",
               priority=BaseVMFirewallService.STANDARD_EVENT_PRIORITY)
@@ -652,30 +662,54 @@ class AWSBucketObjectService(BaseBucketObjectService):
     # orders the optional parameters as (limit, marker, prefix).
     def list(self, bucket: Bucket | str,  # type: ignore[override]
              limit: int | None = None, marker: str | None = None,
-             prefix: str | None = None) -> ResultList[BucketObject]:
+             prefix: str | None = None,
+             delimiter: str | None = None) -> ResultList[BucketObject]:
         aws_provider = cast("AWSCloudProvider", self.provider)
-        if prefix:
-            # pylint:disable=protected-access
-            boto_objs = cast(Any, bucket)._bucket.objects.filter(Prefix=prefix)
-        else:
-            # pylint:disable=protected-access
-            boto_objs = cast(Any, bucket)._bucket.objects.all()
-        objects: builtins.list[BucketObject] = [
-            AWSBucketObject(aws_provider, obj) for obj in boto_objs]
-        return ClientPagedResultList(self.provider, objects,
-                                     limit=limit, marker=marker)
-
-    def find(self, bucket: Bucket | str,
-             **kwargs: Any) -> ResultList[BucketObject]:
+        limit = limit or self.provider.config.default_result_limit
+        bucket_name = cast(Any, bucket).name
+        # Keys are listed in order, so the marker is simply the last key (or
+        # common prefix) of the previous page, passed on as ``StartAfter``.
+        # A page larger than ListObjectsV2's 1000 keys is gathered over
+        # several calls; MaxKeys counts keys and common prefixes alike.
+        params = trim_empty_params({
+            'Bucket': bucket_name,
+            'Prefix': prefix,
+            'Delimiter': delimiter,
+            'StartAfter': self._delimited_marker(marker, prefix, delimiter),
+            'MaxKeys': min(limit, self._LIST_MAX_KEYS)})
+        client = aws_provider.s3_conn.meta.client
+        objects: builtins.list[BucketObject] = []
+        prefixes: builtins.list[str] = []
+        while True:
+            response = client.list_objects_v2(**params)
+            objects.extend(self._summary_object(bucket_name, item)
+                           for item in response.get('Contents', []))
+            prefixes.extend(item['Prefix']
+                            for item in response.get('CommonPrefixes', []))
+            listed = len(objects) + len(prefixes)
+            if not response.get('IsTruncated') or listed >= limit:
+                break
+            params['ContinuationToken'] = response['NextContinuationToken']
+            params['MaxKeys'] = min(limit - listed, self._LIST_MAX_KEYS)
+        last = max([o.id for o in objects[-1:]] + prefixes[-1:], default=None)
+        is_truncated = bool(response.get('IsTruncated')) and bool(last)
+        return ServerPagedResultList(
+            is_truncated=is_truncated,
+            marker=last if is_truncated else None,
+            supports_total=False, data=objects, prefixes=prefixes)
+
+    # ListObjectsV2 returns at most this many keys per call.
+    _LIST_MAX_KEYS = 1000
+
+    def _summary_object(self, bucket_name: str,
+                        item: dict[str, Any]) -> AWSBucketObject:
+        # Wrap a listing entry as an s3.ObjectSummary preloaded with the
+        # listed attributes (size, ETag, last modified), as boto3's own
+        # collections do, so that no further request is needed to read them.
         aws_provider = cast("AWSCloudProvider", self.provider)
-        # pylint:disable=protected-access
-        obj_list: builtins.list[BucketObject] = [
-            AWSBucketObject(aws_provider, o)
-            for o in cast(Any, bucket)._bucket.objects.all()]
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self.provider, list(matches),
-                                     limit=None, marker=None)
+        summary = aws_provider.s3_conn.ObjectSummary(bucket_name, item['Key'])
+        summary.meta.data = item
+        return AWSBucketObject(aws_provider, summary)
 
     def create(self, bucket: Bucket | str,
                object_name: str) -> BucketObject:
@@ -743,6 +777,33 @@ class AWSBucketObjectService(BaseBucketObjectService):
             Range='bytes=%d-%d' % (offset, offset + length - 1))
         return cast(bytes, response['Body'].read())
 
+    @dispatch(event="provider.storage._bucket_objects.iter_range",
+              priority=BaseBucketObjectService.STANDARD_EVENT_PRIORITY)
+    def iter_range(self, bucket: Bucket | str, object_name: str,
+                   offset: int, length: int) -> Iterator[bytes]:
+        client = cast("AWSCloudProvider", self.provider).s3_conn.meta.client
+        response = client.get_object(
+            Bucket=cast(Any, bucket).name, Key=object_name,
+            Range='bytes=%d-%d' % (offset, offset + length - 1))
+        body = response['Body']
+        try:
+            yield from body.iter_chunks(self._RANGE_CHUNK_SIZE)
+        finally:
+            body.close()
+
+    def _delete_batch(self, bucket: Bucket | str,
+                      names: builtins.list[str]) -> dict[str, Exception]:
+        # DeleteObjects takes up to 1000 keys per request, and reports keys
+        # that do not exist as deleted.
+        client = cast("AWSCloudProvider", self.provider).s3_conn.meta.client
+        response = client.delete_objects(
+            Bucket=cast(Any, bucket).name,
+            Delete={'Objects': [{'Key': name} for name in names],
+                    'Quiet': True})
+        return {error['Key']: ProviderInternalException(
+                    "{0}: {1}".format(error.get('Code'), error.get('Message')))
+                for error in response.get('Errors', [])}
+
 
 class AWSComputeService(BaseComputeService):
 
@@ -1100,10 +1161,11 @@ class AWSVMTypeService(BaseVMTypeService):
               priority=BaseVMTypeService.STANDARD_EVENT_PRIORITY)
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[VMType]:
-        cb_types = [AWSVMType(cast("AWSCloudProvider", self.provider), t)
-                    for t in self._get_catalogue()]
-        return ClientPagedResultList(self.provider, cb_types,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AWSVMType(cast("AWSCloudProvider", self.provider), t)
+                     for t in self._get_catalogue()],
+            limit=limit, marker=marker)
 
 
 class AWSRegionService(BaseRegionService):
@@ -1116,9 +1178,23 @@ class AWSRegionService(BaseRegionService):
     def get(self, region_id: str) -> Region | None:
         log.debug("Getting AWS Region Service with the id: %s",
                   region_id)
-        region = [r for r in self if r.id == region_id]
-        if region:
-            return region[0]
+        # Ask for the one region, rather than listing them all. Like list(),
+        # only regions enabled for the account are returned.
+        ec2_conn = cast("AWSCloudProvider", self.provider).ec2_conn
+        try:
+            regions = ec2_conn.meta.client.describe_regions(
+                RegionNames=[region_id],
+                Filters=[{'Name': 'opt-in-status',
+                          'Values': ['opt-in-not-required', 'opted-in']}]
+            ).get('Regions', [])
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == \
+                    'InvalidParameterValue':
+                return None
+            raise
+        if regions:
+            return AWSRegion(cast("AWSCloudProvider", self.provider),
+                             regions[0])
         else:
             return None
 
@@ -1127,11 +1203,12 @@ class AWSRegionService(BaseRegionService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Region]:
         ec2_conn = cast("AWSCloudProvider", self.provider).ec2_conn
-        regions = [
-            AWSRegion(cast("AWSCloudProvider", self.provider), region) for region in
-            ec2_conn.meta.client.describe_regions().get('Regions', [])]
-        return ClientPagedResultList(self.provider, regions,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AWSRegion(cast("AWSCloudProvider", self.provider), region)
+                     for region in ec2_conn.meta.client.describe_regions().get(
+                         'Regions', [])],
+            limit=limit, marker=marker)
 
     @property
     def current(self) -> Region | None:
@@ -1189,9 +1266,18 @@ class AWSNetworkService(BaseNetworkService):
              marker: str | None = None) -> ResultList[Network]:
         return self.svc.list(limit=limit, marker=marker)
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Network]:
+        # find() filters on the server, so its pages are only followed.
+        return cast(Iterator[Network],
+                    self.svc.find_iter(filters=self._find_filters(kwargs)))
+
     @dispatch(event="provider.networking.networks.find",
               priority=BaseNetworkService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Network]:
+        return self.svc.find(filters=self._find_filters(kwargs))
+
+    @staticmethod
+    def _find_filters(kwargs: dict[str, Any]) -> dict[str, Any]:
         label = kwargs.pop('label', None)
 
         # All kwargs should have been popped at this time.
@@ -1201,7 +1287,7 @@ class AWSNetworkService(BaseNetworkService):
                 "attributes: %s" % (kwargs, 'label'))
 
         log.debug("Searching for AWS Network Service %s", label)
-        return self.svc.find(filters={'tag:Name': label})
+        return {'tag:Name': label}
 
     @dispatch(event="provider.networking.networks.create",
               priority=BaseNetworkService.STANDARD_EVENT_PRIORITY)
@@ -1286,10 +1372,19 @@ class AWSSubnetService(BaseSubnetService):
                 filters={'availability-zone': self.provider.zone_name},
                 limit=limit, marker=marker)
 
+    def find_iter(self, network: Network | None = None,
+                  **kwargs: Any) -> Iterator[Subnet]:
+        # find() filters on the server, so its pages are only followed.
+        return cast(Iterator[Subnet],
+                    self.svc.find_iter(filters=self._find_filters(kwargs)))
+
     @dispatch(event="provider.networking.subnets.find",
               priority=BaseSubnetService.STANDARD_EVENT_PRIORITY)
     def find(self, network: Network | None = None,
              **kwargs: Any) -> ResultList[Subnet]:
+        return self.svc.find(filters=self._find_filters(kwargs))
+
+    def _find_filters(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         label = kwargs.pop('label', None)
 
         # All kwargs should have been popped at this time.
@@ -1299,9 +1394,8 @@ class AWSSubnetService(BaseSubnetService):
                 "attributes: %s" % (kwargs, 'label'))
 
         log.debug("Searching for AWS Subnet Service %s", label)
-        return self.svc.find(
-            filters={'tag:Name': label,
-                     'availability-zone': self.provider.zone_name})
+        return {'tag:Name': label,
+                'availability-zone': self.provider.zone_name}
 
     @dispatch(event="provider.networking.subnets.create",
               priority=BaseSubnetService.STANDARD_EVENT_PRIORITY)
@@ -1671,12 +1765,15 @@ class AWSDnsZoneService(BaseDnsZoneService):
                                      supports_total=False,
                                      data=cb_objs)
 
+    def find_iter(self, **kwargs: Any) -> Iterator[DnsZone]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
+
     @dispatch(event="provider.dns.host_zones.find",
               priority=BaseDnsZoneService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[DnsZone]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, list(self))
-        return ClientPagedResultList(self.provider, list(matches),
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(**kwargs)),
                                      limit=None, marker=None)
 
     @dispatch(event="provider.dns.host_zones.create",
@@ -1760,12 +1857,17 @@ class AWSDnsRecordService(BaseDnsRecordService):
             marker=response.get('NextRecordIdentifier'),
             supports_total=False, data=cb_objs)
 
+    # Like find(), this takes a leading dns_zone, unlike the pageable mixin.
+    def find_iter(self,  # type: ignore[override]
+                  dns_zone: DnsZone | str, **kwargs: Any) -> Iterator[DnsRecord]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs,
+                                    cast(Any, dns_zone).records.iter())
+
     def find(self, dns_zone: DnsZone | str,
              **kwargs: Any) -> ResultList[DnsRecord]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs,
-                                          cast(Any, dns_zone).records)
-        return ClientPagedResultList(self.provider, list(matches),
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(dns_zone, **kwargs)),
                                      limit=None, marker=None)
 
     def _to_resource_records(self, data: str | builtins.list[str],
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import datetime
 import logging
+import threading
 from typing import Any
+from typing import Iterator
+from typing import cast
 
 from azure.core.credentials import AzureNamedKeyCredential
 from azure.core.exceptions import (ClientAuthenticationError,
@@ -171,6 +174,12 @@ class AzureClient(object):
     """
     Azure client is the wrapper on top of azure python sdk
     """
+    # A user delegation key is requested to stay valid this many seconds
+    # beyond the SAS it is first needed for, so that it can sign the URLs of
+    # later calls too. Azure issues keys valid for at most 7 days.
+    DELEGATION_KEY_WINDOW = 3600
+    DELEGATION_KEY_MAX_LIFETIME = 7 * 24 * 3600
+
     def __init__(self, config: dict[str, Any]) -> None:
         self._config = config
         self.subscription_id = str(config.get('azure_subscription_id'))
@@ -195,6 +204,9 @@ class AzureClient(object):
         self._table_service_client: Any = None
         self._public_key_table_client: Any = None
         self._storage_account: Any = None
+        self._delegation_key: Any = None
+        self._delegation_key_expiry: datetime.datetime | None = None
+        self._delegation_key_lock = threading.Lock()
 
         log.debug("azure subscription : %s", self.subscription_id)
 
@@ -335,6 +347,20 @@ class AzureClient(object):
         return self.resource_client.resource_groups. \
             create_or_update(name, ResourceGroup(**parameters))
 
+    def list_resource_ids(self, resource_type: str,
+                          query_filter: str) -> Iterator[str]:
+        """
+        Yield the ids of the resources of ``resource_type`` (for example
+        ``Microsoft.Compute/disks``) in the resource group that match an
+        OData ``query_filter``. Tag filters can't be combined with a type
+        filter, so the type is checked here.
+        """
+        for resource in self.resource_client.resources. \
+                list_by_resource_group(self.resource_group,
+                                       filter=query_filter):
+            if resource.type.lower() == resource_type.lower():
+                yield resource.id
+
     def get_storage_account(self, storage_account: str) -> Any:
         return self.storage_client.storage_accounts. \
             get_properties(self.resource_group, storage_account)
@@ -507,33 +533,81 @@ class AzureClient(object):
         blob_client = self.blob_client(container_name, blob_name)
         blob_client.delete_blob(delete_snapshots)
 
+    def delete_blobs(self, container_name: str,
+                     blob_names: list[str]) -> list[Any]:
+        # One blob batch request; returns a response per blob, in order.
+        container_client = self.blob_service.get_container_client(
+            container_name)
+        return list(container_client.delete_blobs(
+            *blob_names, raise_on_any_failure=False))
+
     def get_blob_range(self, container_name: str, blob_name: str,
                        offset: int, length: int) -> bytes:
         blob_client = self.blob_client(container_name, blob_name)
         downloader = blob_client.download_blob(offset=offset, length=length)
         return downloader.readall()
 
+    def iter_blob_range(self, container_name: str, blob_name: str,
+                        offset: int, length: int) -> Iterator[bytes]:
+        blob_client = self.blob_client(container_name, blob_name)
+        downloader = blob_client.download_blob(offset=offset, length=length)
+        return cast(Iterator[bytes], downloader.chunks())
+
+    def get_user_delegation_key(self, now: datetime.datetime,
+                                expiry: datetime.datetime) -> Any:
+        """
+        Return a user delegation key valid until at least ``expiry``.
+
+        Fetching a key is a round trip to the service, so the last key is
+        kept, and reused for as long as it outlives the SAS being signed.
+        """
+        with self._delegation_key_lock:
+            if (self._delegation_key is None or
+                    cast(datetime.datetime,
+                         self._delegation_key_expiry) < expiry):
+                key_expiry = max(expiry, min(
+                    expiry + datetime.timedelta(
+                        seconds=self.DELEGATION_KEY_WINDOW),
+                    now + datetime.timedelta(
+                        seconds=self.DELEGATION_KEY_MAX_LIFETIME)))
+                self._delegation_key = \
+                    self.blob_service.get_user_delegation_key(
+                        key_start_time=now, key_expiry_time=key_expiry)
+                self._delegation_key_expiry = key_expiry
+            return self._delegation_key
+
     def get_blob_url(self, container_name: Any, blob_name: str,
                      expiry_time: int, writable: bool,
                      content_disposition: str | None = None,
                      content_type: str | None = None) -> str:
+        return self.get_blob_urls(container_name, [blob_name], expiry_time,
+                                  writable, content_disposition,
+                                  content_type)[0]
+
+    def get_blob_urls(self, container_name: Any, blob_names: list[str],
+                      expiry_time: int, writable: bool,
+                      content_disposition: str | None = None,
+                      content_type: str | None = None) -> list[str]:
+        """
+        Sign a URL to each of ``blob_names``. The signatures are computed
+        locally, with a single user delegation key.
+        """
         now = datetime.datetime.utcnow()
         expiry = now + datetime.timedelta(
             seconds=expiry_time)
-        blob_name = blob_name
         container_name = container_name.name
-        delegation_key = self.blob_service.get_user_delegation_key(
-            key_start_time=now, key_expiry_time=expiry
-        )
-        sas = generate_blob_sas(
-            self.storage_account, container_name, blob_name,
-            permission=BlobSasPermissions(read=True, write=writable), expiry=expiry,
-            user_delegation_key=delegation_key,
-            content_disposition=content_disposition,
-            content_type=content_type
-        )
-        url = f"https://{self.storage_account}.blob.core.windows.net/{container_name}/{blob_name}?{sas}"
-        return url
+        delegation_key = self.get_user_delegation_key(now, expiry)
+        urls = []
+        for blob_name in blob_names:
+            sas = generate_blob_sas(
+                self.storage_account, container_name, blob_name,
+                permission=BlobSasPermissions(read=True, write=writable), expiry=expiry,
+                user_delegation_key=delegation_key,
+                content_disposition=content_disposition,
+                content_type=content_type
+            )
+            urls.append(f"https://{self.storage_account}.blob.core.windows.net/{container_name}/{blob_name}?{sas}")
+        return urls
 
     def create_empty_disk(self, disk_name: str, params: dict[str, Any]) -> Any:
         return self.compute_client.disks.begin_create_or_update(
@@ -956,6 +1030,12 @@ class AzureClient(object):
         items = list(page)
         return (items, pager.continuation_token)
 
+    def query_public_keys(self, partition_key: str,
+                          query_filter: str) -> Iterator[Any]:
+        return iter(self.table_service.query_entities(
+            query_filter="PartitionKey eq '{0}' and {1}".format(
+                partition_key, query_filter)))
+
     def delete_route_table(self, route_table_name: str) -> None:
         self.network_management_client. \
             route_tables.begin_delete(self.resource_group,
@@ -1,5 +1,6 @@
 import re
 from typing import Any
+from typing import Callable
 
 from cloudbridge.interfaces.exceptions import InvalidValueException
 
@@ -83,3 +84,36 @@ def generate_urn(gallery_image: Any) -> str:
                      reference_dict['offer'],
                      reference_dict['sku'],
                      reference_dict['version']])
+
+
+def odata_literal(value: str) -> str:
+    """
+    Quote a string for use in an OData ``$filter`` expression.
+    """
+    return "'%s'" % value.replace("'", "''")
+
+
+def odata_term(field: str) -> Callable[[Any], str | None]:
+    """
+    Return a translator rendering ``field eq 'value'`` as an OData filter,
+    for use with ``cb_helpers.split_filters``.
+    """
+    def translate(value: Any) -> str | None:
+        if not isinstance(value, str):
+            return None
+        return '%s eq %s' % (field, odata_literal(value))
+    return translate
+
+
+def tag_term(tag_name: str) -> Callable[[Any], str | None]:
+    """
+    Return a translator matching a tag value in the resource manager's
+    ``$filter``. The resource manager accepts a single tag filter, which
+    cannot be combined with any other.
+    """
+    def translate(value: Any) -> str | None:
+        if not isinstance(value, str):
+            return None
+        return 'tagName eq %s and tagValue eq %s' % (
+            odata_literal(tag_name), odata_literal(value))
+    return translate
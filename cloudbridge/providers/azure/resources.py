@@ -6,6 +6,7 @@ from __future__ import annotations
 import collections
 import io
 import logging
+import time
 from datetime import datetime
 from typing import Any
 from typing import IO
@@ -14,6 +15,7 @@ from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import cast
 
+from azure.core.exceptions import HttpResponseError
 from azure.core.exceptions import ResourceNotFoundError
 from azure.mgmt.compute.models import DataDisk
 from azure.mgmt.compute.models import ManagedDiskParameters
@@ -48,6 +50,7 @@ from cloudbridge.interfaces import InstanceState
 from cloudbridge.interfaces import VolumeState
 from cloudbridge.interfaces.exceptions import ProviderInternalException
 from cloudbridge.interfaces.resources import AttachmentInfo
+from cloudbridge.interfaces.resources import Bucket
 from cloudbridge.interfaces.resources import BucketObject
 from cloudbridge.interfaces.resources import FloatingIP
 from cloudbridge.interfaces.resources import Gateway
@@ -76,6 +79,7 @@ from .subservices import AzureSubnetSubService
 from .subservices import AzureVMFirewallRuleSubService
 
 if TYPE_CHECKING:
+    from cloudbridge.interfaces.services import BucketObjectService
     from cloudbridge.providers.azure.provider import AzureCloudProvider
 
 log = logging.getLogger(__name__)
@@ -212,6 +216,13 @@ class AzureVMFirewallRule(BaseVMFirewallRule):
 
 
 class AzureBucketObject(BaseBucketObject):
+
+    # A block blob has at most 50,000 blocks of up to 4000 MiB.
+    CB_MULTIPART_MAX_PARTS = 50000
+    CB_MULTIPART_MAX_PART_SIZE = 4000 * 1024 * 1024
+    # Seconds between polls of the status of a server-side copy.
+    CB_COPY_POLL_INTERVAL = 1.0
+
     def __init__(self, provider: AzureCloudProvider, container: AzureBucket,
                  blob_properties: Any) -> None:
         super(AzureBucketObject, self).__init__(provider)
@@ -245,7 +256,47 @@ class AzureBucketObject(BaseBucketObject):
         """
         return self._blob_properties.last_modified.strftime("%Y-%m-%dT%H:%M:%S.%f")
 
-    def iter_content(self) -> Iterable[bytes]:
+    @property
+    def _etag(self) -> str | None:
+        return self._blob_properties.etag
+
+    def _stored_checksum(self, algorithm: str
+                         ) -> tuple[bytes, int | None] | None:
+        # Content-MD5 is only kept for blobs whose uploader provided it.
+        settings = self._blob_properties.content_settings
+        md5 = settings.content_md5 if settings else None
+        if algorithm != 'md5' or not md5:
+            return None
+        return bytes(md5), None
+
+    @property
+    def _content_encoding(self) -> str | None:
+        settings = self._blob_properties.content_settings
+        return settings.content_encoding if settings else None
+
+    def _set_content_encoding(self, service: "BucketObjectService",
+                              encoding: str) -> None:
+        # Setting any of the blob's HTTP headers replaces all of them. The
+        # Azure SDK's clients are thread-safe, so the blob's own is used.
+        settings = self._blob_client.get_blob_properties().content_settings
+        settings.content_encoding = encoding
+        self._blob_client.set_http_headers(content_settings=settings)
+
+    @staticmethod
+    def _is_throttling_error(error: BaseException) -> bool:
+        # Storage answers 503 (ServerBusy) when an account or blob is over
+        # its request rate.
+        return (isinstance(error, HttpResponseError) and
+                error.status_code in (429, 503))
+
+    @staticmethod
+    def _is_missing_upload_error(error: BaseException) -> bool:
+        # Committing blocks that have expired, as uncommitted blocks do after
+        # a week, answers InvalidBlockList.
+        return (isinstance(error, HttpResponseError) and
+                error.error_code == 'InvalidBlockList')
+
+    def _iter_content(self) -> Iterable[bytes]:
         """
         Returns this object's content as an
         iterable stream.
@@ -281,7 +332,8 @@ class AzureBucketObject(BaseBucketObject):
     def bucket(self) -> AzureBucket:
         return self._container
 
-    def _upload_single_shot(self, data: str | bytes | IO[bytes]) -> BucketObject:
+    def _upload_single_shot(self, data: str | bytes | IO[bytes],
+                            config: TransferConfig | None = None) -> BucketObject:
         """
         Upload the object in a single request. ``data`` may be text, bytes or
         a file-like object; the Azure SDK streams file-like data rather than
@@ -294,6 +346,11 @@ class AzureBucketObject(BaseBucketObject):
 
     def _upload_multipart(self, stream: IO[bytes],
                           config: TransferConfig | None = None) -> BucketObject:
+        if self._needs_generic_driver(config):
+            # Verified uploads digest each block as they stage it, and
+            # adaptive ones pace their blocks, in the generic driver.
+            return super(AzureBucketObject, self)._upload_multipart(
+                stream, config)
         # The Azure SDK's upload_blob stages blocks concurrently (max_concurrency
         # workers) over a thread-safe client, so the transparent multipart path
         # delegates to it rather than CloudBridge's generic clone-pool driver.
@@ -304,6 +361,11 @@ class AzureBucketObject(BaseBucketObject):
 
     def _download_to_path(self, path: str,
                           config: TransferConfig | None = None) -> None:
+        if self._needs_generic_driver(config):
+            # Verified downloads digest each range as they write it, and
+            # adaptive ones pace their ranges, in the generic driver.
+            super(AzureBucketObject, self)._download_to_path(path, config)
+            return
         # azure-storage-blob's downloader fetches block ranges concurrently
         # with a thread-safe client, so delegate to it rather than
         # CloudBridge's generic clone-pool driver.
@@ -312,6 +374,25 @@ class AzureBucketObject(BaseBucketObject):
                 max_concurrency=self._multipart_max_concurrency(config)
             ).readinto(f)
 
+    def _copy_to(self, bucket: Bucket, name: str,
+                 config: TransferConfig | None = None) -> BucketObject:
+        # Copies within a storage account are made by the service, in the
+        # background; poll the copy until it has finished.
+        target = cast(AzureBucket, bucket)._bucket.get_blob_client(name)
+        status = target.start_copy_from_url(
+            self._blob_client.url).get('copy_status')
+        while status == 'pending':
+            time.sleep(self.CB_COPY_POLL_INTERVAL)
+            copy = target.get_blob_properties().copy
+            log.debug("Copying %s to %s: %s bytes", self.name, name,
+                      copy.progress)
+            status = copy.status
+        if status != 'success':
+            raise ProviderInternalException(
+                "Copy of {0} to {1} ended as {2}".format(
+                    self.name, name, status))
+        return cast(BucketObject, bucket.objects.get(name))
+
     def delete(self) -> None:
         """
         Delete this object.
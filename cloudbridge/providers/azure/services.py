@@ -5,6 +5,8 @@ import builtins
 import logging
 import uuid
 from typing import Any
+from typing import Iterable
+from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -28,6 +30,7 @@ from azure.mgmt.network.models import NetworkInterfaceIPConfiguration
 from azure.mgmt.network.models import PublicIPAddressSku
 from azure.mgmt.network.models import PublicIPAddressSkuName
 from azure.mgmt.network.models import SubResource
+from azure.storage.blob import BlobPrefix
 
 import cloudbridge.base.helpers as cb_helpers
 from cloudbridge.base.middleware import dispatch
@@ -87,6 +90,7 @@ from cloudbridge.interfaces.resources import VMFirewallRule
 from cloudbridge.interfaces.resources import VMType
 from cloudbridge.interfaces.resources import Volume
 
+from . import helpers as azure_helpers
 from .resources import AzureBucket
 from .resources import AzureBucketObject
 from .resources import AzureDnsRecord
@@ -114,6 +118,29 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _find_labelled(service: Any, resource_type: str,
+                   filter_names: builtins.list[str],
+                   kwargs: dict[str, Any]) -> Iterator[Any]:
+    """
+    Lazily find resources of ``resource_type`` for ``service.find_iter``.
+
+    An exact label is matched with the resource manager's tag filter and
+    each hit is fetched by id, rather than listing every resource of the
+    type. The remaining filters are matched on the client.
+    """
+    native, kwargs = cb_helpers.split_filters(
+        kwargs, {'label': azure_helpers.tag_term('Label')})
+    objs: Iterable[Any]
+    if native:
+        provider = cast("AzureCloudProvider", service.provider)
+        resource_ids = provider.azure_client.list_resource_ids(
+            resource_type, native[0])
+        objs = (obj for obj in map(service.get, resource_ids) if obj)
+    else:
+        objs = service.iter()
+    return cb_helpers.iter_find(filter_names, kwargs, objs)
+
+
 class AzureSecurityService(BaseSecurityService):
     def __init__(self, provider: CloudProvider) -> None:
         super(AzureSecurityService, self).__init__(provider)
@@ -157,9 +184,11 @@ class AzureVMFirewallService(BaseVMFirewallService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[VMFirewall]:
         provider = cast("AzureCloudProvider", self.provider)
-        fws = [AzureVMFirewall(provider, fw)
-               for fw in provider.azure_client.list_vm_firewall()]
-        return ClientPagedResultList(self.provider, fws, limit, marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureVMFirewall(provider, fw)
+                     for fw in provider.azure_client.list_vm_firewall()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.security.vm_firewalls.create",
               priority=BaseVMFirewallService.STANDARD_EVENT_PRIORITY)
@@ -229,11 +258,12 @@ class AzureVMFirewallRuleService(BaseVMFirewallRuleService):
         # between 3500 and 4096 are assumed to be owned by cloudbridge
         # default rules.
         # pylint:disable=protected-access
-        rules = [AzureVMFirewallRule(firewall, rule) for rule
-                 in cast(Any, firewall)._vm_firewall.security_rules
-                 if rule.priority < 3500]
-        return ClientPagedResultList(self.provider, rules,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureVMFirewallRule(firewall, rule) for rule
+                     in cast(Any, firewall)._vm_firewall.security_rules
+                     if rule.priority < 3500],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.security.vm_firewall_rules.create",
               priority=BaseVMFirewallRuleService.STANDARD_EVENT_PRIORITY)
@@ -346,21 +376,26 @@ class AzureKeyPairService(BaseKeyPairService):
                                      supports_total=False,
                                      data=results)
 
+    def find_iter(self, **kwargs: Any) -> Iterator[KeyPair]:
+        provider = cast("AzureCloudProvider", self.provider)
+        filters = ['name']
+        native, kwargs = cb_helpers.split_filters(
+            kwargs, {'name': azure_helpers.odata_term('Name')})
+        key_pairs: Iterable[KeyPair]
+        if native:
+            key_pairs = (
+                AzureKeyPair(provider, key_pair)
+                for key_pair in provider.azure_client.query_public_keys(
+                    AzureKeyPairService.PARTITION_KEY, ' and '.join(native)))
+        else:
+            key_pairs = self.iter()
+        return cb_helpers.iter_find(filters, kwargs, key_pairs)
+
     @dispatch(event="provider.security.key_pairs.find",
               priority=BaseKeyPairService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[KeyPair]:
-        obj_list: list[KeyPair] = list(self)
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.security.key_pairs.create",
               priority=BaseKeyPairService.STANDARD_EVENT_PRIORITY)
@@ -447,31 +482,25 @@ class AzureVolumeService(BaseVolumeService):
             log.exception(cloud_error)
             return None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Volume]:
+        return _find_labelled(self, 'Microsoft.Compute/disks', ['label'], kwargs)
+
     @dispatch(event="provider.storage.volumes.find",
               priority=BaseVolumeService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Volume]:
-        obj_list: list[Volume] = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.storage.volumes.list",
               priority=BaseVolumeService.STANDARD_EVENT_PRIORITY)
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Volume]:
         provider = cast("AzureCloudProvider", self.provider)
-        azure_vols = provider.azure_client.list_disks()
-        cb_vols = [AzureVolume(provider, vol) for vol in azure_vols]
-        return ClientPagedResultList(self.provider, cb_vols,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureVolume(provider, vol)
+                     for vol in provider.azure_client.list_disks()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.storage.volumes.create",
               priority=BaseVolumeService.STANDARD_EVENT_PRIORITY)
@@ -545,30 +574,25 @@ class AzureSnapshotService(BaseSnapshotService):
             log.exception(cloud_error)
             return None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Snapshot]:
+        return _find_labelled(self, 'Microsoft.Compute/snapshots', ['label'], kwargs)
+
     @dispatch(event="provider.storage.snapshots.find",
               priority=BaseSnapshotService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Snapshot]:
-        obj_list: list[Snapshot] = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.storage.snapshots.list",
               priority=BaseSnapshotService.STANDARD_EVENT_PRIORITY)
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Snapshot]:
         provider = cast("AzureCloudProvider", self.provider)
-        snaps = [AzureSnapshot(provider, obj)
-                 for obj in provider.azure_client.list_snapshots()]
-        return ClientPagedResultList(self.provider, snaps, limit, marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureSnapshot(provider, obj)
+                     for obj in provider.azure_client.list_snapshots()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.storage.snapshots.create",
               priority=BaseSnapshotService.STANDARD_EVENT_PRIORITY)
@@ -625,11 +649,12 @@ class AzureBucketService(BaseBucketService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Bucket]:
         provider = cast("AzureCloudProvider", self.provider)
-        buckets = [AzureBucket(provider, bucket)
-                   for bucket
-                   in provider.azure_client.list_containers()]
-        return ClientPagedResultList(self.provider, buckets,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureBucket(provider, bucket)
+                     for bucket
+                     in provider.azure_client.list_containers()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.storage.buckets.create",
               priority=BaseBucketService.STANDARD_EVENT_PRIORITY)
@@ -675,8 +700,8 @@ class AzureBucketObjectService(BaseBucketObjectService):
             return None
 
     def list(self, bucket: Bucket | str, prefix: str | None = None,
-             limit: int | None = None,
-             marker: str | None = None) -> ResultList[BucketObject]:
+             limit: int | None = None, marker: str | None = None,
+             delimiter: str | None = None) -> ResultList[BucketObject]:
         """
         List all objects within this bucket.
 
@@ -685,23 +710,29 @@ class AzureBucketObjectService(BaseBucketObjectService):
         """
         provider = cast("AzureCloudProvider", self.provider)
         azure_bucket = cast("AzureBucket", bucket)
-        objects = [AzureBucketObject(provider, azure_bucket, obj)
-                   for obj in
-                   cast(Any, bucket)._bucket.list_blobs(
-                       name_starts_with=prefix)]
-        return ClientPagedResultList(self.provider, objects,
-                                     limit=limit, marker=marker)
-
-    def find(self, bucket: Bucket | str,
-             **kwargs: Any) -> ResultList[BucketObject]:
-        provider = cast("AzureCloudProvider", self.provider)
-        azure_bucket = cast("AzureBucket", bucket)
-        obj_list = [AzureBucketObject(provider, azure_bucket, obj)
-                    for obj in
-                    cast(Any, bucket)._bucket.list_blobs()]
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self.provider, list(matches))
+        if delimiter:
+            # walk_blobs lists one level, yielding a BlobPrefix for each
+            # common prefix, and is paged on the server with its continuation
+            # token as the marker.
+            limit = limit or self.provider.config.default_result_limit
+            pages = cast(Any, bucket)._bucket.walk_blobs(
+                name_starts_with=prefix, delimiter=delimiter,
+                results_per_page=limit).by_page(continuation_token=marker)
+            entries = list(next(pages, []))
+            return ServerPagedResultList(
+                bool(pages.continuation_token), pages.continuation_token,
+                False,
+                data=[AzureBucketObject(provider, azure_bucket, obj)
+                      for obj in entries if not isinstance(obj, BlobPrefix)],
+                prefixes=[obj.name for obj in entries
+                          if isinstance(obj, BlobPrefix)])
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureBucketObject(provider, azure_bucket, obj)
+                     for obj in
+                     cast(Any, bucket)._bucket.list_blobs(
+                         name_starts_with=prefix)],
+            limit=limit, marker=marker)
 
     def create(self, bucket: Bucket | str, name: str) -> BucketObject:
         provider = cast("AzureCloudProvider", self.provider)
@@ -774,6 +805,42 @@ class AzureBucketObjectService(BaseBucketObjectService):
         return cast(bytes, azure_client.get_blob_range(
             cast("Bucket", bucket).name, object_name, offset, length))
 
+    # A blob batch request holds at most 256 subrequests.
+    _DELETE_BATCH_SIZE = 256
+
+    def _delete_batch(self, bucket: Bucket | str,
+                      names: builtins.list[str]) -> dict[str, Exception]:
+        azure_client = cast("AzureCloudProvider", self.provider).azure_client
+        responses = azure_client.delete_blobs(
+            cast("Bucket", bucket).name, names)
+        # 202 Accepted means deleted; 404 means there was nothing to delete.
+        return {name: ProviderInternalException("{0} {1}".format(
+                    response.status_code, response.reason))
+                for name, response in zip(names, responses)
+                if response.status_code not in (202, 404)}
+
+    @dispatch(event="provider.storage._bucket_objects.generate_urls",
+              priority=BaseBucketObjectService.STANDARD_EVENT_PRIORITY)
+    def generate_urls(self, bucket: Bucket | str,
+                      objects: Iterable[BucketObject | str],
+                      expires_in: int,
+                      writable: bool = False) -> builtins.list[str]:
+        # Blob URLs are signed by name, so objects need not be fetched, and
+        # all are signed with one user delegation key.
+        names = [obj if isinstance(obj, str) else obj.name
+                 for obj in objects]
+        provider = cast("AzureCloudProvider", self.provider)
+        return provider.azure_client.get_blob_urls(bucket, names, expires_in,
+                                                   writable)
+
+    @dispatch(event="provider.storage._bucket_objects.iter_range",
+              priority=BaseBucketObjectService.STANDARD_EVENT_PRIORITY)
+    def iter_range(self, bucket: Bucket | str, object_name: str,
+                   offset: int, length: int) -> Iterator[bytes]:
+        azure_client = cast("AzureCloudProvider", self.provider).azure_client
+        return azure_client.iter_blob_range(
+            cast("Bucket", bucket).name, object_name, offset, length)
+
 
 class AzureComputeService(BaseComputeService):
     def __init__(self, provider: CloudProvider) -> None:
@@ -817,19 +884,13 @@ class AzureImageService(BaseImageService):
             log.exception(cloud_error)
             return None
 
-    def find(self, **kwargs: Any) -> ResultList[MachineImage]:
-        obj_list: builtins.list[MachineImage] = list(self)
+    def find_iter(self, **kwargs: Any) -> Iterator[MachineImage]:
         filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
 
+    def find(self, **kwargs: Any) -> ResultList[MachineImage]:
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
     def list(self,  # type: ignore[override]
              filter_by_owner: bool = True, limit: int | None = None,
@@ -841,11 +902,13 @@ class AzureImageService(BaseImageService):
         """
         provider = cast("AzureCloudProvider", self.provider)
         azure_client = provider.azure_client
-        azure_images = azure_client.list_images()
-        azure_gallery_refs = azure_client.list_gallery_refs() \
-            if not filter_by_owner else []
-        cb_images = [AzureMachineImage(provider, img)
-                     for img in azure_images + azure_gallery_refs]
+
+        def cb_images() -> builtins.list[MachineImage]:
+            azure_images = azure_client.list_images()
+            azure_gallery_refs = azure_client.list_gallery_refs() \
+                if not filter_by_owner else []
+            return [AzureMachineImage(provider, img)
+                    for img in azure_images + azure_gallery_refs]
         return ClientPagedResultList(self.provider, cb_images,
                                      limit=limit, marker=marker)
 
@@ -1156,10 +1219,11 @@ class AzureInstanceService(BaseInstanceService):
         List all instances.
         """
         provider = cast("AzureCloudProvider", self.provider)
-        instances = [AzureInstance(provider, inst)
-                     for inst in provider.azure_client.list_vm()]
-        return ClientPagedResultList(self.provider, instances,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureInstance(provider, inst)
+                     for inst in provider.azure_client.list_vm()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.compute.instances.get",
               priority=BaseInstanceService.STANDARD_EVENT_PRIORITY)
@@ -1177,21 +1241,14 @@ class AzureInstanceService(BaseInstanceService):
             log.exception(cloud_error)
             return None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Instance]:
+        return _find_labelled(self, 'Microsoft.Compute/virtualMachines', ['label'], kwargs)
+
     @dispatch(event="provider.compute.instances.find",
               priority=BaseInstanceService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Instance]:
-        obj_list: builtins.list[Instance] = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.compute.instances.delete",
               priority=BaseInstanceService.STANDARD_EVENT_PRIORITY)
@@ -1249,10 +1306,11 @@ class AzureVMTypeService(BaseVMTypeService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[VMType]:
         provider = cast("AzureCloudProvider", self.provider)
-        vm_types = [AzureVMType(provider, vm_type)
-                    for vm_type in self.instance_data]
-        return ClientPagedResultList(self.provider, vm_types,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureVMType(provider, vm_type)
+                     for vm_type in self.instance_data],
+            limit=limit, marker=marker)
 
 
 class AzureRegionService(BaseRegionService):
@@ -1275,10 +1333,11 @@ class AzureRegionService(BaseRegionService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Region]:
         provider = cast("AzureCloudProvider", self.provider)
-        regions = [AzureRegion(provider, region)
-                   for region in provider.azure_client.list_locations()]
-        return ClientPagedResultList(self.provider, regions,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureRegion(provider, region)
+                     for region in provider.azure_client.list_locations()],
+            limit=limit, marker=marker)
 
     @property
     def current(self) -> Region | None:
@@ -1336,10 +1395,11 @@ class AzureNetworkService(BaseNetworkService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Network]:
         provider = cast("AzureCloudProvider", self.provider)
-        networks = [AzureNetwork(provider, network)
-                    for network in provider.azure_client.list_networks()]
-        return ClientPagedResultList(self.provider, networks,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureNetwork(provider, network)
+                     for network in provider.azure_client.list_networks()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.networking.networks.create",
               priority=BaseNetworkService.STANDARD_EVENT_PRIORITY)
@@ -1424,19 +1484,22 @@ class AzureSubnetService(BaseSubnetService):
         # The base SubnetService.list already accepts a leading network
         # filter ahead of list(limit, marker).
         return ClientPagedResultList(self.provider,
-                                     self._list_subnets(network),
+                                     lambda: self._list_subnets(network),
                                      limit=limit, marker=marker)
 
+    def find_iter(self, network: Network | None = None,
+                  **kwargs: Any) -> Iterator[Subnet]:
+        # Subnets are listed in one request per network.
+        filters = ['label']
+        return cb_helpers.iter_find(filters, kwargs,
+                                    self._list_subnets(network))
+
     @dispatch(event="provider.networking.subnets.find",
               priority=BaseSubnetService.STANDARD_EVENT_PRIORITY)
     def find(self, network: Network | None = None,
              **kwargs: Any) -> ResultList[Subnet]:
-        obj_list = self._list_subnets(network)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+        return ClientPagedResultList(
+            self.provider, list(self.find_iter(network, **kwargs)))
 
     @dispatch(event="provider.networking.subnets.create",
               priority=BaseSubnetService.STANDARD_EVENT_PRIORITY)
@@ -1497,32 +1560,25 @@ class AzureRouterService(BaseRouterService):
             log.exception(cloud_error)
             return None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Router]:
+        return _find_labelled(self, 'Microsoft.Network/routeTables', ['label'], kwargs)
+
     @dispatch(event="provider.networking.routers.find",
               priority=BaseRouterService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Router]:
-        obj_list: builtins.list[Router] = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
         return ClientPagedResultList(self.provider,
-                                     matches if matches else [])
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.networking.routers.list",
               priority=BaseRouterService.STANDARD_EVENT_PRIORITY)
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Router]:
         provider = cast("AzureCloudProvider", self.provider)
-        routes = [AzureRouter(provider, route)
-                  for route in provider.azure_client.list_route_tables()]
-        return ClientPagedResultList(self.provider,
-                                     routes,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureRouter(provider, route)
+                     for route in provider.azure_client.list_route_tables()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.networking.routers.create",
               priority=BaseRouterService.STANDARD_EVENT_PRIORITY)
@@ -1572,10 +1628,10 @@ class AzureGatewayService(BaseGatewayService):
              marker: str | None = None) -> ResultList[Gateway]:
         # The base GatewayService.list already requires a leading network
         # argument ahead of list(limit, marker).
-        gws = [self._gateway_singleton(network)]
-        return ClientPagedResultList(self.provider,
-                                     gws,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [self._gateway_singleton(network)],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.networking.gateways.delete",
               priority=BaseGatewayService.STANDARD_EVENT_PRIORITY)
@@ -1605,11 +1661,12 @@ class AzureFloatingIPService(BaseFloatingIPService):
     def list(self, gateway: Gateway, limit: int | None = None,
              marker: str | None = None) -> ResultList[FloatingIP]:
         provider = cast("AzureCloudProvider", self.provider)
-        floating_ips = [AzureFloatingIP(provider, floating_ip)
-                        for floating_ip in
-                        provider.azure_client.list_floating_ips()]
-        return ClientPagedResultList(self.provider, floating_ips,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureFloatingIP(provider, floating_ip)
+                     for floating_ip in
+                     provider.azure_client.list_floating_ips()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.networking.floating_ips.create",
               priority=BaseFloatingIPService.STANDARD_EVENT_PRIORITY)
@@ -1700,17 +1757,21 @@ class AzureDnsZoneService(BaseDnsZoneService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[DnsZone]:
         provider = cast("AzureCloudProvider", self.provider)
-        zones = [AzureDnsZone(provider, z)
-                 for z in provider.azure_client.list_dns_zones()]
-        return ClientPagedResultList(self.provider, zones, limit, marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureDnsZone(provider, z)
+                     for z in provider.azure_client.list_dns_zones()],
+            limit=limit, marker=marker)
+
+    def find_iter(self, **kwargs: Any) -> Iterator[DnsZone]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
 
     @dispatch(event="provider.dns.host_zones.find",
               priority=BaseDnsZoneService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[DnsZone]:
-        filters = ['name']
-        obj_list: builtins.list[DnsZone] = list(self)
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self.provider, list(matches),
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(**kwargs)),
                                      limit=None, marker=None)
 
     @dispatch(event="provider.dns.host_zones.create",
@@ -1819,17 +1880,24 @@ class AzureDnsRecordService(BaseDnsRecordService):
              marker: str | None = None) -> ResultList[DnsRecord]:
         provider = cast("AzureCloudProvider", self.provider)
         azure_zone = cast("AzureDnsZone", dns_zone)
-        records = [AzureDnsRecord(provider, azure_zone, r)
-                   for r in provider.azure_client.list_dns_records(
-                       cast(Any, dns_zone).id)]
-        return ClientPagedResultList(self.provider, records, limit, marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [AzureDnsRecord(provider, azure_zone, r)
+                     for r in provider.azure_client.list_dns_records(
+                         cast(Any, dns_zone).id)],
+            limit=limit, marker=marker)
+
+    # Like find(), this takes a leading dns_zone, unlike the pageable mixin.
+    def find_iter(self,  # type: ignore[override]
+                  dns_zone: DnsZone | str, **kwargs: Any) -> Iterator[DnsRecord]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs,
+                                    cast(Any, dns_zone).records.iter())
 
     def find(self, dns_zone: DnsZone | str,
              **kwargs: Any) -> ResultList[DnsRecord]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs,
-                                          cast(Any, dns_zone).records)
-        return ClientPagedResultList(self.provider, list(matches),
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(dns_zone, **kwargs)),
                                      limit=None, marker=None)
 
     def create(self, dns_zone: DnsZone | str, name: str, type: str,
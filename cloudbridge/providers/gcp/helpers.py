@@ -34,6 +34,31 @@ def iter_all(resource: Any, **kwargs: Any) -> Iterator[Any]:
         token = response['nextPageToken']
 
 
+def filter_term(field: str) -> Callable[[Any], str | None]:
+    """
+    Return a translator rendering ``field = value`` in the Compute API
+    ``filter`` syntax, for use with ``cb_helpers.split_filters``.
+    """
+    def translate(value: Any) -> str | None:
+        if isinstance(value, bool):
+            literal = 'true' if value else 'false'
+        elif isinstance(value, (int, float)):
+            literal = str(value)
+        elif isinstance(value, str):
+            literal = '"%s"' % value.replace('\\', '\\\\').replace('"', '\\"')
+        else:
+            return None
+        return '(%s = %s)' % (field, literal)
+    return translate
+
+
+def join_filters(terms: list[str]) -> str | None:
+    """
+    Combine filter terms from ``filter_term`` into a single expression.
+    """
+    return ' AND '.join(terms) if terms else None
+
+
 def get_common_metadata(provider: "GCPCloudProvider") -> Any:
     """
     Get a project's commonInstanceMetadata entry
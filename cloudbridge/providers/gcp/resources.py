@@ -3,6 +3,7 @@ DataTypes used by this provider
 """
 from __future__ import annotations
 
+import base64
 import hashlib
 import inspect
 import io
@@ -86,6 +87,7 @@ if TYPE_CHECKING:
     from cloudbridge.interfaces.resources import VMFirewallRuleSubService
     from cloudbridge.interfaces.resources import VMType
     from cloudbridge.interfaces.resources import Volume
+    from cloudbridge.interfaces.services import BucketObjectService
     from cloudbridge.providers.gcp.provider import GCPCloudProvider
     from cloudbridge.providers.gcp.provider import GCPResourceUrl
     from cloudbridge.providers.gcp.services import GCPVMFirewallService
@@ -2132,7 +2134,49 @@ class GCPBucketObject(BaseBucketObject):
     def last_modified(self) -> str:
         return self._obj['updated']
 
-    def iter_content(self) -> io.BytesIO:
+    @property
+    def _etag(self) -> str | None:
+        return self._obj.get('etag')
+
+    @property
+    def _content_encoding(self) -> str | None:
+        return self._obj.get('contentEncoding')
+
+    def _set_content_encoding(self, service: "BucketObjectService",
+                              encoding: str) -> None:
+        provider = cast("GCPCloudProvider", service.provider)
+        self._obj = (provider
+                     .gcp_storage
+                     .objects()
+                     .patch(bucket=self._obj['bucket'], object=self.name,
+                            body={'contentEncoding': encoding})
+                     .execute())
+
+    def _ranged_reads_of_encoding(self, encoding: str) -> bool:
+        # The HTTP client decompresses gzip responses, and GCS ignores the
+        # range of requests it would decompress itself.
+        return encoding != 'gzip'
+
+    def _stored_checksum(self, algorithm: str
+                         ) -> tuple[bytes, int | None] | None:
+        # GCS keeps a CRC32C of every object, and an MD5 of every object
+        # but composite ones, both base64 encoded.
+        value = self._obj.get({'md5': 'md5Hash',
+                               'crc32c': 'crc32c'}.get(algorithm, ''))
+        return (base64.b64decode(value), None) if value else None
+
+    @staticmethod
+    def _is_throttling_error(error: BaseException) -> bool:
+        return (isinstance(error, googleapiclient.errors.HttpError) and
+                error.resp.status in (429, 503))
+
+    @staticmethod
+    def _is_missing_upload_error(error: BaseException) -> bool:
+        # Composing answers 404 when a temporary part object is gone.
+        return (isinstance(error, googleapiclient.errors.HttpError) and
+                error.resp.status == 404)
+
+    def _iter_content(self) -> io.BytesIO:
         provider = cast("GCPCloudProvider", self._provider)
         return io.BytesIO(provider
                           .gcp_storage
@@ -2145,7 +2189,8 @@ class GCPBucketObject(BaseBucketObject):
     def bucket(self) -> Bucket:
         return self._bucket
 
-    def _upload_single_shot(self, data: str | bytes | IO[bytes]
+    def _upload_single_shot(self, data: str | bytes | IO[bytes],
+                            config: TransferConfig | None = None
                             ) -> BucketObject:
         """
         Set the contents of this object in a single request. ``data`` may be
@@ -2175,8 +2220,12 @@ class GCPBucketObject(BaseBucketObject):
 
         GCP uses a resumable upload here, which streams the file in chunks on a
         single session; the ``config`` argument is accepted for interface
-        consistency but does not affect this path.
+        consistency but does not affect this path, unless it asks for a
+        checksum, adaptive concurrency or a resumable multipart upload, in
+        which case the generic upload path is used to provide it.
         """
+        if self._needs_generic_file_upload(path, config):
+            return super(GCPBucketObject, self).upload_from_file(path, config)
         with open(path, 'rb') as f:
             media_body = googleapiclient.http.MediaIoBaseUpload(
                     f, 'application/octet-stream')
@@ -2190,6 +2239,31 @@ class GCPBucketObject(BaseBucketObject):
                 self._obj = response
         return self
 
+    def _copy_to(self, bucket: Bucket, name: str,
+                 config: TransferConfig | None = None) -> BucketObject:
+        # A rewrite copies objects of any size, but may take several calls,
+        # each continuing where the last stopped, for large objects or
+        # copies between locations or storage classes.
+        provider = cast("GCPCloudProvider", self._provider)
+        request: dict[str, Any] = {
+            'sourceBucket': self._obj['bucket'],
+            'sourceObject': self.name,
+            'destinationBucket': bucket.name,
+            'destinationObject': name,
+            'body': {}}
+        while True:
+            response = (provider
+                        .gcp_storage
+                        .objects()
+                        .rewrite(**request)
+                        .execute())
+            if response.get('done'):
+                return GCPBucketObject(provider, bucket, response['resource'])
+            log.debug("Copied %s of %s bytes of %s to %s",
+                      response.get('totalBytesRewritten'),
+                      response.get('objectSize'), self.name, name)
+            request['rewriteToken'] = response['rewriteToken']
+
     def delete(self) -> None:
         provider = cast("GCPCloudProvider", self._provider)
         (provider
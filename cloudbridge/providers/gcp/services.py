@@ -5,9 +5,11 @@ import io
 import ipaddress
 import json
 import logging
+import os
 import time
 import uuid
 from typing import Any
+from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -19,6 +21,7 @@ from cloudbridge.base.resources import BaseMultipartUpload
 from cloudbridge.base.resources import BaseUploadPart
 from cloudbridge.base.resources import ClientPagedResultList
 from cloudbridge.base.resources import ServerPagedResultList
+from cloudbridge.base.resources import TransferWorkerPool
 from cloudbridge.base.services import BaseBucketObjectService
 from cloudbridge.base.services import BaseBucketService
 from cloudbridge.base.services import BaseComputeService
@@ -46,10 +49,10 @@ from cloudbridge.interfaces.exceptions import DuplicateResourceException
 from cloudbridge.interfaces.exceptions import InvalidParamException
 from cloudbridge.interfaces.exceptions import ProviderInternalException
 from cloudbridge.interfaces.resources import Bucket
-from cloudbridge.interfaces.resources import BucketObject
 from cloudbridge.interfaces.resources import DnsZone
 from cloudbridge.interfaces.resources import FloatingIP
 from cloudbridge.interfaces.resources import Gateway
+from cloudbridge.interfaces.resources import Instance
 from cloudbridge.interfaces.resources import KeyPair
 from cloudbridge.interfaces.resources import LaunchConfig
 from cloudbridge.interfaces.resources import MachineImage
@@ -140,34 +143,31 @@ class GCPKeyPairService(BaseKeyPairService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[GCPKeyPair]:
         provider = cast("GCPCloudProvider", self.provider)
-        key_pairs = []
-        for item in helpers.find_matching_metadata_items(
-                provider, GCPKeyPair.KP_TAG_REGEX):
-            metadata_value = json.loads(item['value'])
-            kp_info = GCPKeyPair.GCPKeyInfo(**metadata_value)
-            key_pairs.append(GCPKeyPair(provider, kp_info))
+
+        def key_pairs() -> builtins.list[GCPKeyPair]:
+            key_pairs = []
+            for item in helpers.find_matching_metadata_items(
+                    provider, GCPKeyPair.KP_TAG_REGEX):
+                metadata_value = json.loads(item['value'])
+                kp_info = GCPKeyPair.GCPKeyInfo(**metadata_value)
+                key_pairs.append(GCPKeyPair(provider, kp_info))
+            return key_pairs
         return ClientPagedResultList(self.provider, key_pairs,
                                      limit=limit, marker=marker)
 
+    def find_iter(self, **kwargs: Any) -> Iterator[GCPKeyPair]:
+        filters = ['id', 'name']
+        return cast(Iterator[GCPKeyPair],
+                    cb_helpers.iter_find(filters, kwargs, self.iter()))
+
     @dispatch(event="provider.security.key_pairs.find",
               priority=BaseKeyPairService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[GCPKeyPair]:
         """
         Searches for a key pair by a given list of attributes.
         """
-        obj_list = list(self)
-        filters = ['id', 'name']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, ", ".join(filters)))
-
-        return ClientPagedResultList(
-            self.provider,
-            cast("builtins.list[GCPKeyPair]", matches) if matches else [])
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.security.key_pairs.create",
               priority=BaseKeyPairService.STANDARD_EVENT_PRIORITY)
@@ -230,12 +230,14 @@ class GCPVMFirewallService(BaseVMFirewallService):
               priority=BaseVMFirewallService.STANDARD_EVENT_PRIORITY)
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[GCPVMFirewall]:
-        vm_firewalls = []
-        for tag, network_name in self._delegate.tag_networks:
-            network = self.provider.networking.networks.get(
-                network_name)
-            vm_firewall = GCPVMFirewall(self._delegate, tag, network)
-            vm_firewalls.append(vm_firewall)
+        def vm_firewalls() -> builtins.list[GCPVMFirewall]:
+            vm_firewalls = []
+            for tag, network_name in self._delegate.tag_networks:
+                network = self.provider.networking.networks.get(
+                    network_name)
+                vm_firewall = GCPVMFirewall(self._delegate, tag, network)
+                vm_firewalls.append(vm_firewall)
+            return vm_firewalls
         return ClientPagedResultList(self.provider, vm_firewalls,
                                      limit=limit, marker=marker)
 
@@ -297,14 +299,17 @@ class GCPVMFirewallRuleService(BaseVMFirewallRuleService):
     def list(self, firewall: VMFirewall, limit: int | None = None,
              marker: str | None = None) -> ResultList[GCPVMFirewallRule]:
         gcp_fw = cast(GCPVMFirewall, firewall)
-        rules = []
-        for fw in gcp_fw.delegate.iter_firewalls(
-                gcp_fw.name, gcp_fw.network.name):
-            rule = GCPVMFirewallRule(firewall, fw['id'])
-            if rule.is_dummy_rule():
-                self._dummy_rule = rule
-            else:
-                rules.append(rule)
+
+        def rules() -> builtins.list[GCPVMFirewallRule]:
+            rules = []
+            for fw in gcp_fw.delegate.iter_firewalls(
+                    gcp_fw.name, gcp_fw.network.name):
+                rule = GCPVMFirewallRule(firewall, fw['id'])
+                if rule.is_dummy_rule():
+                    self._dummy_rule = rule
+                else:
+                    rules.append(rule)
+            return rules
         return ClientPagedResultList(self.provider, rules,
                                      limit=limit, marker=marker)
 
@@ -388,6 +393,10 @@ class GCPVMFirewallRuleService(BaseVMFirewallRuleService):
 
 class GCPVMTypeService(BaseVMTypeService):
 
+    # Machine type fields that find() can match with the API's filter.
+    NATIVE_FILTERS = ('name', 'guestCpus', 'memoryMb',
+                      'maximumPersistentDisks', 'isSharedCpu')
+
     def __init__(self, provider: CloudProvider) -> None:
         super(GCPVMTypeService, self).__init__(provider)
 
@@ -410,12 +419,27 @@ class GCPVMTypeService(BaseVMTypeService):
         vm_type = provider.get_resource('machineTypes', vm_type_id)
         return GCPVMType(provider, vm_type) if vm_type else None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[GCPVMType]:
+        # find() filters on the server, leaving nothing to stream.
+        return iter(self.find(**kwargs))
+
     @dispatch(event="provider.compute.vm_types.find",
               priority=BaseVMTypeService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[GCPVMType]:
         provider = cast("GCPCloudProvider", self.provider)
+        native, kwargs = cb_helpers.split_filters(
+            kwargs, {key: helpers.filter_term(key)
+                     for key in self.NATIVE_FILTERS})
+        response = (
+            provider
+            .gcp_compute
+            .machineTypes()
+            .list(project=provider.project_name,
+                  zone=provider.zone_name,
+                  filter=helpers.join_filters(native))
+            .execute())
         matched_inst_types = []
-        for inst_type in self.instance_data:
+        for inst_type in response.get('items', []):
             is_match = True
             for key, value in kwargs.items():
                 if key not in inst_type:
@@ -433,10 +457,11 @@ class GCPVMTypeService(BaseVMTypeService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[GCPVMType]:
         provider = cast("GCPCloudProvider", self.provider)
-        inst_types = [GCPVMType(provider, inst_type)
-                      for inst_type in self.instance_data]
-        return ClientPagedResultList(self.provider, inst_types,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [GCPVMType(provider, inst_type)
+                     for inst_type in self.instance_data],
+            limit=limit, marker=marker)
 
 
 class GCPRegionService(BaseRegionService):
@@ -544,16 +569,19 @@ class GCPImageService(BaseImageService):
         """
         List all images.
         """
-        self._retrieve_public_images()
         provider = cast("GCPCloudProvider", self.provider)
-        images = []
-        if (provider.project_name not in
-                GCPImageService._PUBLIC_IMAGE_PROJECTS):
-            for image in helpers.iter_all(
-                    provider.gcp_compute.images(),
-                    project=provider.project_name):
-                images.append(GCPMachineImage(provider, image))
-        images.extend(self._public_images or [])
+
+        def images() -> builtins.list[GCPMachineImage]:
+            self._retrieve_public_images()
+            images = []
+            if (provider.project_name not in
+                    GCPImageService._PUBLIC_IMAGE_PROJECTS):
+                for image in helpers.iter_all(
+                        provider.gcp_compute.images(),
+                        project=provider.project_name):
+                    images.append(GCPMachineImage(provider, image))
+            images.extend(self._public_images or [])
+            return images
         return ClientPagedResultList(self.provider, images,
                                      limit=limit, marker=marker)
 
@@ -739,6 +767,24 @@ class GCPInstanceService(BaseInstanceService):
         return (GCPInstance(provider, instance)
                 if instance else None)
 
+    def find_iter(self, **kwargs: Any) -> Iterator[GCPInstance]:
+        provider = cast("GCPCloudProvider", self.provider)
+        native, kwargs = cb_helpers.split_filters(
+            kwargs, {'label': helpers.filter_term('labels.cblabel')})
+        instances: Iterator[Instance]
+        if native:
+            instances = (
+                GCPInstance(provider, inst)
+                for inst in helpers.iter_all(
+                    provider.gcp_compute.instances(),
+                    project=provider.project_name,
+                    zone=provider.zone_name,
+                    filter=helpers.join_filters(native)))
+        else:
+            instances = self.iter()
+        return cast(Iterator[GCPInstance],
+                    cb_helpers.iter_find(['label'], kwargs, instances))
+
     @dispatch(event="provider.compute.instances.find",
               priority=BaseInstanceService.STANDARD_EVENT_PRIORITY)
     def find(self, limit: int | None = None, marker: str | None = None,
@@ -747,17 +793,8 @@ class GCPInstanceService(BaseInstanceService):
         Searches for instances by instance label.
         :return: a list of Instance objects
         """
-        label = kwargs.pop('label', None)
-
-        # All kwargs should have been popped at this time.
-        if len(kwargs) > 0:
-            raise InvalidParamException(
-                "Unrecognised parameters for search: %s. Supported "
-                "attributes: %s" % (kwargs, 'label'))
-
-        instances = [instance for instance in self.list()
-                     if instance.label == label]
-        return ClientPagedResultList(self.provider, instances,
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(**kwargs)),
                                      limit=limit, marker=marker)
 
     @dispatch(event="provider.compute.instances.list",
@@ -881,6 +918,26 @@ class GCPNetworkService(BaseNetworkService):
             'networks', network_id)
         return GCPNetwork(provider, network) if network else None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[GCPNetwork]:
+        # Labels live in the project metadata, so only names are matched
+        # by the API.
+        provider = cast("GCPCloudProvider", self.provider)
+        filters = ['name', 'label']
+        native, kwargs = cb_helpers.split_filters(
+            kwargs, {'name': helpers.filter_term('name')})
+        networks: Iterator[Network]
+        if native:
+            networks = (
+                GCPNetwork(provider, network)
+                for network in helpers.iter_all(
+                    provider.gcp_compute.networks(),
+                    project=provider.project_name,
+                    filter=helpers.join_filters(native)))
+        else:
+            networks = self.iter()
+        return cast(Iterator[GCPNetwork],
+                    cb_helpers.iter_find(filters, kwargs, networks))
+
     @dispatch(event="provider.networking.networks.find",
               priority=BaseNetworkService.STANDARD_EVENT_PRIORITY)
     def find(self, limit: int | None = None, marker: str | None = None,
@@ -889,11 +946,8 @@ class GCPNetworkService(BaseNetworkService):
         GCP networks are global. There is at most one network with a given
         name.
         """
-        obj_list = list(self)
-        filters = ['name', 'label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
         return ClientPagedResultList(
-            self._provider, cast("builtins.list[GCPNetwork]", matches),
+            self._provider, list(self.find_iter(**kwargs)),
             limit=limit, marker=marker)
 
     @dispatch(event="provider.networking.networks.list",
@@ -902,16 +956,19 @@ class GCPNetworkService(BaseNetworkService):
              filter: str | None = None) -> ResultList[GCPNetwork]:
         # TODO: Decide whether we keep filter in 'list'
         provider = cast("GCPCloudProvider", self.provider)
-        networks = []
-        response = (
-            provider
-            .gcp_compute
-            .networks()
-            .list(project=provider.project_name,
-                  filter=filter)
-            .execute())
-        for network in response.get('items', []):
-            networks.append(GCPNetwork(provider, network))
+
+        def networks() -> builtins.list[GCPNetwork]:
+            networks = []
+            response = (
+                provider
+                .gcp_compute
+                .networks()
+                .list(project=provider.project_name,
+                      filter=filter)
+                .execute())
+            for network in response.get('items', []):
+                networks.append(GCPNetwork(provider, network))
+            return networks
         return ClientPagedResultList(self.provider, networks,
                                      limit=limit, marker=marker)
 
@@ -994,15 +1051,32 @@ class GCPRouterService(BaseRouterService):
             'routers', router_id, region=self.provider.region_name)
         return GCPRouter(provider, router) if router else None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[GCPRouter]:
+        # As with networks, labels live in the project metadata.
+        provider = cast("GCPCloudProvider", self.provider)
+        filters = ['name', 'label']
+        native, kwargs = cb_helpers.split_filters(
+            kwargs, {'name': helpers.filter_term('name')})
+        routers: Iterator[Router]
+        if native:
+            routers = (
+                GCPRouter(provider, router)
+                for router in helpers.iter_all(
+                    provider.gcp_compute.routers(),
+                    project=provider.project_name,
+                    region=provider.region_name,
+                    filter=helpers.join_filters(native)))
+        else:
+            routers = self.iter()
+        return cast(Iterator[GCPRouter],
+                    cb_helpers.iter_find(filters, kwargs, routers))
+
     @dispatch(event="provider.networking.routers.find",
               priority=BaseRouterService.STANDARD_EVENT_PRIORITY)
     def find(self, limit: int | None = None, marker: str | None = None,
              **kwargs: Any) -> ResultList[GCPRouter]:
-        obj_list = list(self)
-        filters = ['name', 'label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
         return ClientPagedResultList(
-            self._provider, cast("builtins.list[GCPRouter]", matches),
+            self._provider, list(self.find_iter(**kwargs)),
             limit=limit, marker=marker)
 
     @dispatch(event="provider.networking.routers.list",
@@ -1117,17 +1191,20 @@ class GCPSubnetService(BaseSubnetService):
                       % cast(GCPNetwork, network_obj).resource_url)
         provider = cast("GCPCloudProvider", self.provider)
         region_name = self.provider.region_name
-        subnets = []
-        response = (
-            provider
-            .gcp_compute
-            .subnetworks()
-            .list(project=provider.project_name,
-                  region=region_name,
-                  filter=filter)
-            .execute())
-        for subnet in response.get('items', []):
-            subnets.append(GCPSubnet(provider, subnet))
+
+        def subnets() -> builtins.list[GCPSubnet]:
+            subnets = []
+            response = (
+                provider
+                .gcp_compute
+                .subnetworks()
+                .list(project=provider.project_name,
+                      region=region_name,
+                      filter=filter)
+                .execute())
+            for subnet in response.get('items', []):
+                subnets.append(GCPSubnet(provider, subnet))
+            return subnets
         return ClientPagedResultList(self.provider, subnets,
                                      limit=limit, marker=marker)
 
@@ -1535,9 +1612,7 @@ class GCPBucketService(BaseBucketService):
             'buckets', bucket_id)
         return GCPBucket(provider, bucket) if bucket else None
 
-    @dispatch(event="provider.storage.buckets.find",
-              priority=BaseBucketService.STANDARD_EVENT_PRIORITY)
-    def find(self, **kwargs: Any) -> ResultList[GCPBucket]:
+    def find_iter(self, **kwargs: Any) -> Iterator[GCPBucket]:
         name = kwargs.pop('name', None)
 
         # All kwargs should have been popped at this time.
@@ -1546,9 +1621,14 @@ class GCPBucketService(BaseBucketService):
                 "Unrecognised parameters for search: %s. Supported "
                 "attributes: %s" % (kwargs, 'name'))
 
-        buckets = [bucket for bucket in self if name in bucket.name]
-        return ClientPagedResultList(
-            self.provider, cast("builtins.list[GCPBucket]", buckets))
+        return (cast(GCPBucket, bucket) for bucket in self.iter()
+                if name in bucket.name)
+
+    @dispatch(event="provider.storage.buckets.find",
+              priority=BaseBucketService.STANDARD_EVENT_PRIORITY)
+    def find(self, **kwargs: Any) -> ResultList[GCPBucket]:
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.storage.buckets.list",
               priority=BaseBucketService.STANDARD_EVENT_PRIORITY)
@@ -1646,7 +1726,8 @@ class GCPBucketObjectService(BaseBucketObjectService):
     # orders the optional parameters as (limit, marker, prefix).
     def list(self, bucket: Bucket | str,  # type: ignore[override]
              limit: int | None = None, marker: str | None = None,
-             prefix: str | None = None) -> ResultList[GCPBucketObject]:
+             prefix: str | None = None,
+             delimiter: str | None = None) -> ResultList[GCPBucketObject]:
         """
         List all objects within this bucket.
         """
@@ -1658,6 +1739,7 @@ class GCPBucketObjectService(BaseBucketObjectService):
             .objects()
             .list(bucket=cast(GCPBucket, bucket).name,
                   prefix=prefix if prefix else '',
+                  delimiter=delimiter,
                   maxResults=max_result,
                   pageToken=marker)
             .execute())
@@ -1669,17 +1751,8 @@ class GCPBucketObjectService(BaseBucketObjectService):
                         max_result, len(objects))
         return ServerPagedResultList('nextPageToken' in response,
                                      response.get('nextPageToken'),
-                                     False, data=objects)
-
-    # ResultList is invariant, so the return is typed with the interface
-    # element type (BucketObject) rather than GCPBucketObject.
-    def find(self, bucket: Bucket | str,
-             **kwargs: Any) -> ResultList[BucketObject]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(
-            filters, kwargs, list(cast(GCPBucket, bucket).objects))
-        return ClientPagedResultList(
-            self._provider, list(matches), limit=None, marker=None)
+                                     False, data=objects,
+                                     prefixes=response.get('prefixes', []))
 
     def _create_object_with_media_body(self, bucket: Bucket | str,
                                        name: str, media_body: Any) -> Any:
@@ -1710,8 +1783,11 @@ class GCPBucketObjectService(BaseBucketObjectService):
     # GCS has no independent "upload part" API, so multipart is emulated by
     # uploading each part as a temporary object and assembling them with the
     # compose API. ``compose`` accepts at most this many source objects per
-    # call, so larger uploads are composed in chained batches.
+    # call, so larger uploads are composed in a tree of intermediate objects.
     _MAX_COMPOSE_SOURCES = 32
+    # Number of compose requests in flight at once.
+    CB_COMPOSE_MAX_CONCURRENCY = int(os.environ.get(
+        'CB_COMPOSE_MAX_CONCURRENCY', 8))
 
     @staticmethod
     def _temp_prefix(upload: MultipartUpload) -> str:
@@ -1758,16 +1834,15 @@ class GCPBucketObjectService(BaseBucketObjectService):
                                       sources)
         # The temporary part objects and any compose intermediates are real,
         # billable objects, so remove them once assembled.
-        self._delete_objects(bucket, sources + intermediates,
-                             ignore_missing=True)
+        self._delete_temp_objects(bucket, sources + intermediates)
         return self.get(bucket, upload.object_name)
 
     @dispatch(event="provider.storage._bucket_objects.abort_multipart_upload",
               priority=BaseBucketObjectService.STANDARD_EVENT_PRIORITY)
     def abort_multipart_upload(self, bucket: Bucket | str,
                                upload: MultipartUpload) -> None:
-        self._delete_objects(bucket, self._list_temp_objects(bucket, upload),
-                             ignore_missing=True)
+        self._delete_temp_objects(bucket,
+                                  self._list_temp_objects(bucket, upload))
 
     @dispatch(event="provider.storage._bucket_objects.download_range",
               priority=BaseBucketObjectService.STANDARD_EVENT_PRIORITY)
@@ -1783,28 +1858,45 @@ class GCPBucketObjectService(BaseBucketObjectService):
     def _compose(self, bucket: Bucket | str, upload: MultipartUpload,
                  destination: str, sources: builtins.list[str]) -> builtins.list[str]:
         """
-        Compose ``sources`` into ``destination``, chaining through
+        Compose ``sources`` into ``destination``, through a balanced tree of
         intermediate objects when there are more than ``_MAX_COMPOSE_SOURCES``.
-        Returns the list of intermediate object names created (to be cleaned
-        up by the caller).
+        The composes of each level of the tree are independent of one
+        another, so they are issued concurrently. Returns the list of
+        intermediate object names created (to be cleaned up by the caller).
         """
-        intermediates = []
+        intermediates: builtins.list[str] = []
         level = sources
-        batch = 0
-        while len(level) > self._MAX_COMPOSE_SOURCES:
-            next_level = []
-            for i in range(0, len(level), self._MAX_COMPOSE_SOURCES):
-                group = level[i:i + self._MAX_COMPOSE_SOURCES]
-                name = "{0}compose-{1:05d}".format(
-                    self._temp_prefix(upload), batch)
-                self._compose_once(bucket, name, group)
-                intermediates.append(name)
-                next_level.append(name)
-                batch += 1
-            level = next_level
+        if len(level) <= self._MAX_COMPOSE_SOURCES:
+            self._compose_once(bucket, destination, level)
+            return intermediates
+        provider = cast("GCPCloudProvider", self.provider)
+        concurrency = max(1, int(provider._get_config_value(
+            'compose_max_concurrency', self.CB_COMPOSE_MAX_CONCURRENCY)))
+        with TransferWorkerPool(provider, concurrency) as pool:
+            while len(level) > self._MAX_COMPOSE_SOURCES:
+                # Split the level into as few groups as compose allows, of
+                # nearly equal size, so that the tree stays balanced and no
+                # level is deeper than it needs to be.
+                count = -(-len(level) // self._MAX_COMPOSE_SOURCES)
+                groups = [level[len(level) * i // count:
+                                len(level) * (i + 1) // count]
+                          for i in range(count)]
+                names = ["{0}compose-{1:05d}".format(
+                    self._temp_prefix(upload), len(intermediates) + i)
+                    for i in range(count)]
+                intermediates.extend(names)
+                pool.run_windowed(
+                    ((self._compose_on, (bucket, name, group))
+                     for name, group in zip(names, groups)), concurrency)
+                level = names
         self._compose_once(bucket, destination, level)
         return intermediates
 
+    @staticmethod
+    def _compose_on(service: "GCPBucketObjectService", bucket: Bucket | str,
+                    destination: str, sources: builtins.list[str]) -> None:
+        service._compose_once(bucket, destination, sources)
+
     def _compose_once(self, bucket: Bucket | str, destination: str,
                       sources: builtins.list[str]) -> None:
         provider = cast("GCPCloudProvider", self.provider)
@@ -1835,19 +1927,42 @@ class GCPBucketObjectService(BaseBucketObjectService):
             if not page_token:
                 return names
 
-    def _delete_objects(self, bucket: Bucket | str, names: builtins.list[str],
-                        ignore_missing: bool = False) -> None:
+    # Google recommends no more than 100 calls in one batch request.
+    _DELETE_BATCH_SIZE = 100
+
+    def _delete_batch(self, bucket: Bucket | str,
+                      names: builtins.list[str]) -> dict[str, Exception]:
         provider = cast("GCPCloudProvider", self.provider)
-        for name in names:
-            try:
-                (provider
-                 .gcp_storage
-                 .objects()
-                 .delete(bucket=cast(GCPBucket, bucket).name, object=name)
-                 .execute())
-            except googleapiclient.errors.HttpError:
-                if not ignore_missing:
-                    raise
+        errors: dict[str, Exception] = {}
+
+        def on_response(request_id: str, response: Any,
+                        exception: Exception | None) -> None:
+            if exception is None or (
+                    isinstance(exception, googleapiclient.errors.HttpError)
+                    and exception.resp.status == 404):
+                return
+            errors[names[int(request_id)]] = exception
+
+        batch = provider.gcp_storage.new_batch_http_request(
+            callback=on_response)
+        for index, name in enumerate(names):
+            batch.add(provider.gcp_storage.objects().delete(
+                bucket=cast(GCPBucket, bucket).name, object=name),
+                request_id=str(index))
+        batch.execute()
+        return errors
+
+    def _delete_temp_objects(self, bucket: Bucket | str,
+                             names: builtins.list[str]) -> None:
+        # Batched and issued concurrently by delete_many; objects already
+        # gone are not errors. Leftovers are logged rather than raised, as
+        # the upload itself has been completed or aborted by now.
+        errors = self.delete_many(bucket, names)
+        if errors:
+            log.warning("Could not delete %d temporary multipart objects "
+                        "from %s: %s", len(errors),
+                        cast(GCPBucket, bucket).name,
+                        next(iter(errors.values())))
 
 
 class GCPGatewayService(BaseGatewayService):
@@ -2026,14 +2141,16 @@ class GCPDnsZoneService(BaseDnsZoneService):
                                      response.get('nextPageToken'),
                                      False, data=dns_zones)
 
+    def find_iter(self, **kwargs: Any) -> Iterator[GCPDnsZone]:
+        filters = ['name']
+        return cast(Iterator[GCPDnsZone],
+                    cb_helpers.iter_find(filters, kwargs, self.iter()))
+
     @dispatch(event="provider.dns.host_zones.find",
               priority=BaseDnsZoneService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[GCPDnsZone]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(
-            filters, kwargs, list(self))
         return ClientPagedResultList(
-            self.provider, cast("builtins.list[GCPDnsZone]", matches),
+            self.provider, list(self.find_iter(**kwargs)),
             limit=None, marker=None)
 
     @dispatch(event="provider.dns.host_zones.create",
@@ -2148,13 +2265,17 @@ class GCPDnsRecordService(BaseDnsRecordService):
                                      response.get('nextPageToken'),
                                      False, data=records)
 
+    # Like find(), this takes a leading dns_zone, unlike the pageable mixin.
+    def find_iter(self,  # type: ignore[override]
+                  dns_zone: DnsZone | str, **kwargs: Any) -> Iterator[GCPDnsRecord]:
+        filters = ['name']
+        return cast(Iterator[GCPDnsRecord], cb_helpers.iter_find(
+            filters, kwargs, cast(Any, dns_zone).records.iter()))
+
     def find(self, dns_zone: DnsZone | str,
              **kwargs: Any) -> ResultList[GCPDnsRecord]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(
-            filters, kwargs, list(cast(GCPDnsZone, dns_zone).records))
         return ClientPagedResultList(
-            self.provider, cast("builtins.list[GCPDnsRecord]", matches),
+            self.provider, list(self.find_iter(dns_zone, **kwargs)),
             limit=None, marker=None)
 
     def create(self,
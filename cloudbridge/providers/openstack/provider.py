@@ -11,10 +11,12 @@ from keystoneclient import client as keystone_client
 
 from neutronclient.v2_0 import client as neutron_client
 
+from novaclient import base as nova_base
 from novaclient import client as nova_client
 from novaclient import shell as nova_shell
 
 from openstack import connection
+from openstack import resource as os_resource
 
 from swiftclient import client as swift_client
 
@@ -304,6 +306,28 @@ class OpenStackCloudProvider(BaseCloudProvider):
             clean_options['session'] = self._keystone_session
         return swift_client.Connection(**clean_options)
 
+    def _rebind_native(self, value: Any) -> Any:
+        # novaclient resources make requests through the manager they were
+        # listed by, so they are remade on the same kind of manager of this
+        # provider's own client, unless they are of another region.
+        # openstacksdk resources keep the connection they were made with;
+        # each was made for the one result, so it is rebound in place.
+        if isinstance(value, nova_base.Resource):
+            manager = value.manager
+            if getattr(manager.api.client, 'region_name', None) != \
+                    getattr(self.nova.client, 'region_name', None):
+                return value
+            own = next((attribute for attribute in vars(self.nova).values()
+                        if type(attribute) is type(manager)), None)
+            if own is None:
+                return value
+            return type(value)(own, dict(value._info),
+                               loaded=value.is_loaded())
+        if isinstance(value, os_resource.Resource) and \
+                value._connection is not None:
+            value._connection = self.os_conn
+        return value
+
     def _connect_neutron(self) -> Any:
         """Get an OpenStack Neutron (networking) client object cloud."""
         return neutron_client.Client(auth_url=self.auth_url,
@@ -5,9 +5,11 @@ from __future__ import annotations
 
 import inspect
 import ipaddress
+import json
 import logging
 import os
 import re
+import uuid
 from datetime import datetime
 from typing import Any
 from typing import IO
@@ -46,6 +48,7 @@ from cloudbridge.base.resources import BaseVMFirewall
 from cloudbridge.base.resources import BaseVMFirewallRule
 from cloudbridge.base.resources import BaseVMType
 from cloudbridge.base.resources import BaseVolume
+from cloudbridge.base.resources import TransferWorkerPool
 from cloudbridge.interfaces.exceptions import ProviderInternalException
 from cloudbridge.interfaces.resources import AttachmentInfo
 from cloudbridge.interfaces.resources import Bucket
@@ -78,6 +81,7 @@ from .subservices import OpenStackSubnetSubService
 from .subservices import OpenStackVMFirewallRuleSubService
 
 if TYPE_CHECKING:
+    from cloudbridge.interfaces.services import BucketObjectService
     from cloudbridge.providers.openstack.provider import OpenStackCloudProvider
 
 ONE_GIG = 1048576000  # in bytes
@@ -1366,6 +1370,11 @@ class OpenStackVMFirewallRule(BaseVMFirewallRule):
 
 class OpenStackBucketObject(BaseBucketObject):
 
+    # Swift's default limits: a static large object manifest lists at most
+    # 1000 segments, each an object of at most 5 GiB.
+    CB_MULTIPART_MAX_PARTS = 1000
+    CB_MULTIPART_MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
+
     def __init__(self, provider: OpenStackCloudProvider,
                  cbcontainer: Any, obj: Any) -> None:
         super(OpenStackBucketObject, self).__init__(provider)
@@ -1389,7 +1398,55 @@ class OpenStackBucketObject(BaseBucketObject):
     def last_modified(self) -> str:
         return self._obj.get("last_modified")
 
-    def iter_content(self) -> Iterable[bytes]:
+    @property
+    def _etag(self) -> str | None:
+        return self._obj.get("hash")
+
+    @property
+    def _content_encoding(self) -> str | None:
+        # Listings do not include the Content-Encoding of objects.
+        headers = cast("OpenStackCloudProvider", self._provider).swift \
+            .head_object(self.cbcontainer.name, self.name)
+        return headers.get('content-encoding')
+
+    def _set_content_encoding(self, service: "BucketObjectService",
+                              encoding: str) -> None:
+        cast("OpenStackCloudProvider", service.provider).swift.post_object(
+            self.cbcontainer.name, self.name,
+            headers={'Content-Encoding': encoding})
+
+    def _ranged_reads_of_encoding(self, encoding: str) -> bool:
+        # swiftclient reads responses through requests, which decompresses
+        # them as they arrive.
+        return False
+
+    def _stored_checksum(self, algorithm: str
+                         ) -> tuple[bytes, int | None] | None:
+        # The hash of a static large object is an MD5 of its manifest, not of
+        # its content.
+        if algorithm != 'md5' or self._obj.get("slo_etag") or \
+                not self._obj.get("hash"):
+            return None
+        try:
+            return bytes.fromhex(self._obj["hash"]), None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _is_throttling_error(error: BaseException) -> bool:
+        # Swift's ratelimit middleware answers 498 or 429.
+        return (isinstance(error, swiftclient.ClientException) and
+                error.http_status in (429, 498, 503))
+
+    @staticmethod
+    def _is_missing_upload_error(error: BaseException) -> bool:
+        # A manifest referring to segments that are gone is answered with 400,
+        # listing a 404 for each of them.
+        return (isinstance(error, swiftclient.ClientException) and
+                error.http_status == 400 and
+                '404' in str(error.http_response_content or ''))
+
+    def _iter_content(self) -> Iterable[bytes]:
         """Returns this object's content as an iterable."""
         _, content = cast("OpenStackCloudProvider", self._provider).swift \
             .get_object(self.cbcontainer.name, self.name, resp_chunk_size=65536)
@@ -1400,7 +1457,8 @@ class OpenStackBucketObject(BaseBucketObject):
         return self.cbcontainer
 
     def _upload_single_shot(
-            self, data: str | bytes | IO[bytes]) -> BucketObject:
+            self, data: str | bytes | IO[bytes],
+            config: TransferConfig | None = None) -> BucketObject:
         """
         Set the contents of this object in a single request.
 
@@ -1420,7 +1478,9 @@ class OpenStackBucketObject(BaseBucketObject):
 
         Swift uses ``SwiftService`` here, which manages its own segmenting and
         concurrency; the ``config`` argument is accepted for interface
-        consistency but does not affect this path.
+        consistency but does not affect this path, unless it asks for a
+        checksum, adaptive concurrency or a resumable multipart upload, in
+        which case the generic upload path is used to provide it.
 
         :type path: ``str``
         :param path: Absolute path to the file to be uploaded to Swift.
@@ -1436,6 +1496,9 @@ class OpenStackBucketObject(BaseBucketObject):
 
         .. seealso:: https://github.com/CloudVE/cloudbridge/issues/35#issuecomment-297629661 # noqa
         """
+        if self._needs_generic_file_upload(path, config):
+            return super(OpenStackBucketObject, self).upload_from_file(
+                path, config)
         upload_options: dict[str, Any] = {}
         if 'segment_size' not in upload_options:
             if os.path.getsize(path) >= FIVE_GIG:
@@ -1454,6 +1517,84 @@ class OpenStackBucketObject(BaseBucketObject):
                 up_res['success']
         return self
 
+    def _copy_to(self, bucket: Bucket, name: str,
+                 config: TransferConfig | None = None) -> BucketObject:
+        # A COPY materialises the whole content as one object, so large
+        # objects, whose content is spread over segments, are copied one
+        # segment at a time into a new static large object instead.
+        if self.size > self.CB_MULTIPART_MAX_PART_SIZE:
+            self._copy_segments(bucket, name, config)
+        else:
+            cast("OpenStackCloudProvider", self._provider).swift.copy_object(
+                self.cbcontainer.name, self.name,
+                destination="/{0}/{1}".format(bucket.name, name))
+        return cast(BucketObject, bucket.objects.get(name))
+
+    def _segments(self) -> list[tuple[str, str, int]]:
+        """
+        The ``(path, etag, size)`` of each segment of this large object, in
+        order, whether it is a static or a dynamic large object.
+        """
+        swift = cast("OpenStackCloudProvider", self._provider).swift
+        headers = swift.head_object(self.cbcontainer.name, self.name)
+        if headers.get('x-static-large-object'):
+            _, manifest = swift.get_object(
+                self.cbcontainer.name, self.name,
+                query_string='multipart-manifest=get')
+            return [(entry['name'], entry['hash'], entry['bytes'])
+                    for entry in json.loads(manifest)]
+        if headers.get('x-object-manifest'):
+            container, _, prefix = headers['x-object-manifest'].partition('/')
+            _, listing = swift.get_container(container, prefix=prefix,
+                                             full_listing=True)
+            return [("/{0}/{1}".format(container, entry['name']),
+                     entry['hash'], entry['bytes']) for entry in listing]
+        raise ProviderInternalException(
+            "{0} is too large to copy and has no segments".format(self.name))
+
+    def _copy_segments(self, bucket: Bucket, name: str,
+                       config: TransferConfig | None = None) -> None:
+        segments = self._segments()
+        prefix = "{0}/slo/copy-{1}/".format(name, uuid.uuid4().hex)
+        targets = ["{0}{1:08d}".format(prefix, number)
+                   for number in range(1, len(segments) + 1)]
+        concurrency = max(1, self._multipart_max_concurrency(config))
+        with TransferWorkerPool(self._provider, concurrency) as pool:
+            try:
+                pool.run_windowed(
+                    ((self._copy_segment, (path, bucket.name, target))
+                     for (path, _, _), target in zip(segments, targets)),
+                    concurrency)
+            except Exception:
+                # Copied segments are real, billable objects.
+                pool.run_windowed(
+                    ((self._delete_segment, (bucket.name, target))
+                     for target in targets), concurrency)
+                raise
+        manifest = [{'path': "/{0}/{1}".format(bucket.name, target),
+                     'etag': etag, 'size_bytes': size}
+                    for (_, etag, size), target in zip(segments, targets)]
+        cast("OpenStackCloudProvider", self._provider).swift.put_object(
+            bucket.name, name, json.dumps(manifest),
+            query_string='multipart-manifest=put')
+
+    @staticmethod
+    def _copy_segment(service: "BucketObjectService", path: str,
+                      container: str, name: str) -> None:
+        source_container, _, source = path.lstrip('/').partition('/')
+        cast("OpenStackCloudProvider", service.provider).swift.copy_object(
+            source_container, source,
+            destination="/{0}/{1}".format(container, name))
+
+    @staticmethod
+    def _delete_segment(service: "BucketObjectService", container: str,
+                        name: str) -> None:
+        try:
+            cast("OpenStackCloudProvider", service.provider).swift \
+                .delete_object(container, name)
+        except swiftclient.ClientException:
+            pass  # never copied
+
     def delete(self) -> None:
         """
         Delete this object.
@@ -6,11 +6,15 @@ from __future__ import annotations
 import builtins
 import json
 import logging
+import os
 import uuid
 from typing import Any
 from typing import IO
+from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import cast
+from urllib.parse import quote
+from urllib.parse import unquote
 
 from neutronclient.common.exceptions import NeutronClientException
 from neutronclient.common.exceptions import PortNotFoundClient
@@ -30,6 +34,7 @@ from cloudbridge.base.resources import BaseLaunchConfig
 from cloudbridge.base.resources import BaseMultipartUpload
 from cloudbridge.base.resources import BaseUploadPart
 from cloudbridge.base.resources import ClientPagedResultList
+from cloudbridge.base.resources import ServerPagedResultList
 from cloudbridge.base.services import BaseBucketObjectService
 from cloudbridge.base.services import BaseBucketService
 from cloudbridge.base.services import BaseComputeService
@@ -201,12 +206,15 @@ class OpenStackKeyPairService(BaseKeyPairService):
         :return:  list of KeyPair objects
         """
         provider = cast("OpenStackCloudProvider", self.provider)
-        keypairs = provider.nova.keypairs.list()
-        results = [OpenStackKeyPair(provider, kp)
-                   for kp in keypairs]
-        log.debug("Listing all key pairs associated with OpenStack "
-                  "Account: %s", results)
-        return ClientPagedResultList(self.provider, results,
+
+        def key_pairs() -> builtins.list[KeyPair]:
+            keypairs = provider.nova.keypairs.list()
+            results: builtins.list[KeyPair] = [
+                OpenStackKeyPair(provider, kp) for kp in keypairs]
+            log.debug("Listing all key pairs associated with OpenStack "
+                      "Account: %s", results)
+            return results
+        return ClientPagedResultList(self.provider, key_pairs,
                                      limit=limit, marker=marker)
 
     @dispatch(event="provider.security.key_pairs.find",
@@ -281,12 +289,11 @@ class OpenStackVMFirewallService(BaseVMFirewallService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[VMFirewall]:
         provider = cast("OpenStackCloudProvider", self.provider)
-        firewalls = [
-            OpenStackVMFirewall(provider, fw)
-            for fw in provider.os_conn.network.security_groups()]
-
-        return ClientPagedResultList(self.provider, firewalls,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [OpenStackVMFirewall(provider, fw)
+                     for fw in provider.os_conn.network.security_groups()],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.security.vm_firewalls.create",
               priority=BaseVMFirewallService.STANDARD_EVENT_PRIORITY)
@@ -623,6 +630,10 @@ class OpenStackBucketService(BaseBucketService):
             log.debug("Bucket %s was not found.", bucket_id)
             return None
 
+    def find_iter(self, **kwargs: Any) -> Iterator[Bucket]:
+        # find() fetches the whole account listing in one request.
+        return iter(self.find(**kwargs))
+
     @dispatch(event="provider.storage.buckets.find",
               priority=BaseBucketService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Bucket]:
@@ -681,6 +692,7 @@ class OpenStackBucketObjectService(BaseBucketObjectService):
 
     def __init__(self, provider: CloudProvider) -> None:
         super(OpenStackBucketObjectService, self).__init__(provider)
+        self._bulk_delete_limit: int | None = None
 
     def get(self, bucket: Bucket | str,
             name: str) -> BucketObject | None:
@@ -704,7 +716,8 @@ class OpenStackBucketObjectService(BaseBucketObjectService):
     # orders the optional parameters as (limit, marker, prefix).
     def list(self, bucket: Bucket | str,  # type: ignore[override]
              limit: int | None = None, marker: str | None = None,
-             prefix: str | None = None) -> ResultList[BucketObject]:
+             prefix: str | None = None,
+             delimiter: str | None = None) -> ResultList[BucketObject]:
         """
         List all objects within this bucket.
 
@@ -715,24 +728,28 @@ class OpenStackBucketObjectService(BaseBucketObjectService):
         _, object_list = provider.swift.get_container(
             cast(Any, bucket).name,
             limit=oshelpers.os_result_limit(self.provider, limit),
-            marker=marker, prefix=prefix)
-        cb_objects = [OpenStackBucketObject(
-                provider, bucket, obj) for obj in object_list]
-
-        return oshelpers.to_server_paged_list(
-            self.provider,
-            cb_objects,
-            limit)
-
-    def find(self, bucket: Bucket | str,
-             **kwargs: Any) -> ResultList[BucketObject]:
-        provider = cast("OpenStackCloudProvider", self.provider)
-        _, obj_list = provider.swift.get_container(cast(Any, bucket).name)
-        cb_objs = [OpenStackBucketObject(provider, bucket, obj)
-                   for obj in obj_list]
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, cb_objs)
-        return ClientPagedResultList(self.provider, list(matches))
+            marker=self._delimited_marker(marker, prefix, delimiter),
+            prefix=prefix, delimiter=delimiter)
+        if not delimiter:
+            cb_objects = [OpenStackBucketObject(
+                    provider, bucket, obj) for obj in object_list]
+            return oshelpers.to_server_paged_list(
+                self.provider,
+                cb_objects,
+                limit)
+        # Common prefixes are returned in line with the objects, as
+        # ``{'subdir': prefix}`` entries.
+        limit = limit or self.provider.config.default_result_limit
+        entries = object_list[:limit]
+        is_truncated = len(object_list) > limit
+        last = entries[-1] if entries else {}
+        return ServerPagedResultList(
+            is_truncated,
+            last.get('subdir', last.get('name')) if is_truncated else None,
+            False,
+            data=[OpenStackBucketObject(provider, bucket, obj)
+                  for obj in entries if 'subdir' not in obj],
+            prefixes=[obj['subdir'] for obj in entries if 'subdir' in obj])
 
     def create(self, bucket: Bucket | str,
                object_name: str) -> BucketObject:
@@ -765,17 +782,26 @@ class OpenStackBucketObjectService(BaseBucketObjectService):
                     part_number: int, data: bytes | IO[bytes]) -> UploadPart:
         if isinstance(data, str):
             data = data.encode()
-        if not isinstance(data, (bytes, bytearray)):
+        if isinstance(data, (bytes, bytearray)):
+            size = len(data)
+        elif data.seekable():
+            # Stream seekable parts (such as slices of a memory-mapped file)
+            # instead of reading them into memory first.
+            start = data.tell()
+            size = data.seek(0, os.SEEK_END) - start
+            data.seek(start)
+        else:
             data = data.read()
+            size = len(data)
         segment_name = self._segment_name(upload, part_number)
         provider = cast("OpenStackCloudProvider", self.provider)
         etag = provider.swift.put_object(
-            cast(Any, bucket).name, segment_name, data)
+            cast(Any, bucket).name, segment_name, data, content_length=size)
         # Retain the manifest entry needed to assemble the SLO on complete.
         return BaseUploadPart(part_number, {
             'path': "/{0}/{1}".format(cast(Any, bucket).name, segment_name),
             'etag': etag,
-            'size_bytes': len(data)})
+            'size_bytes': size})
 
     @dispatch(event="provider.storage._bucket_objects."
                     "complete_multipart_upload",
@@ -818,6 +844,65 @@ class OpenStackBucketObjectService(BaseBucketObjectService):
             headers={'Range': 'bytes=%d-%d' % (offset, offset + length - 1)})
         return cast(bytes, data)
 
+    @dispatch(event="provider.storage._bucket_objects.iter_range",
+              priority=BaseBucketObjectService.STANDARD_EVENT_PRIORITY)
+    def iter_range(self, bucket: Bucket | str, object_name: str,
+                   offset: int, length: int) -> Iterator[bytes]:
+        provider = cast("OpenStackCloudProvider", self.provider)
+        _, chunks = provider.swift.get_object(
+            cast(Any, bucket).name, object_name,
+            headers={'Range': 'bytes=%d-%d' % (offset, offset + length - 1)},
+            resp_chunk_size=self._RANGE_CHUNK_SIZE)
+        return cast(Iterator[bytes], chunks)
+
+    def _bulk_delete_batch_size(self) -> int:
+        # Bulk delete is optional middleware, advertised (with its limit) in
+        # the cluster's capabilities. Zero means it is not available.
+        if self._bulk_delete_limit is None:
+            provider = cast("OpenStackCloudProvider", self.provider)
+            try:
+                bulk_delete = provider.swift.get_capabilities().get(
+                    'bulk_delete') or {}
+                self._bulk_delete_limit = (
+                    int(bulk_delete.get('max_deletes_per_request', 10000))
+                    if bulk_delete else 0)
+            except SwiftClientException:
+                self._bulk_delete_limit = 0
+        return self._bulk_delete_limit
+
+    def _delete_batch(self, bucket: Bucket | str,
+                      names: builtins.list[str]) -> dict[str, Exception]:
+        limit = self._bulk_delete_batch_size()
+        if not limit:
+            return super(OpenStackBucketObjectService, self)._delete_batch(
+                bucket, names)
+        container = cast(Any, bucket).name
+        prefix = "/{0}/".format(container)
+        provider = cast("OpenStackCloudProvider", self.provider)
+        errors: dict[str, Exception] = {}
+        for start in range(0, len(names), limit):
+            chunk = names[start:start + limit]
+            paths = [quote(prefix + name) for name in chunk]
+            _, body = provider.swift.post_account(
+                headers={'Accept': 'application/json',
+                         'Content-Type': 'text/plain'},
+                query_string='bulk-delete', data='\n'.join(paths))
+            result = json.loads(body)
+            # Missing objects are counted under "Number Not Found", not
+            # reported as errors. Failed paths come back URL-quoted.
+            for path, status in result.get('Errors') or []:
+                path = unquote(path)
+                name = path[len(prefix):] if path.startswith(prefix) \
+                    else path
+                errors[name] = ProviderInternalException(status)
+            if not result.get('Errors') and not result.get(
+                    'Response Status', '200').startswith('2'):
+                # The request as a whole failed.
+                for name in chunk:
+                    errors[name] = ProviderInternalException(
+                        result.get('Response Status'))
+        return errors
+
 
 class OpenStackComputeService(BaseComputeService):
 
@@ -872,11 +957,13 @@ class OpenStackImageService(BaseImageService):
             log.debug("Image %s not found", image_id)
             return None
 
-    def find(self, **kwargs: Any) -> ResultList[MachineImage]:
+    def find_iter(self, **kwargs: Any) -> Iterator[MachineImage]:
         filters = ['label']
-        obj_list = list(self)
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self.provider, list(matches))
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
+
+    def find(self, **kwargs: Any) -> ResultList[MachineImage]:
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(**kwargs)))
 
     # Intentionally extends the base list() with a leading filter_by_owner
     # parameter (matches the interface's documented arguments-differ override).
@@ -1176,21 +1263,23 @@ class OpenStackRegionService(BaseRegionService):
         # pylint:disable=protected-access
         provider = cast("OpenStackCloudProvider", self.provider)
         if provider._keystone_version == 3:
-            os_regions = [OpenStackRegion(provider, region)
-                          for region in provider.keystone.regions.list()]
-            return ClientPagedResultList(self.provider, os_regions,
-                                         limit=limit, marker=marker)
+            return ClientPagedResultList(
+                self.provider,
+                lambda: [OpenStackRegion(provider, region)
+                         for region in provider.keystone.regions.list()],
+                limit=limit, marker=marker)
         else:
             # Keystone v3 onwards supports directly listing regions
             # but for v2, this convoluted method is necessary.
-            regions = (
-                endpoint.get('region') or endpoint.get('region_id')
-                for svc in provider.keystone.service_catalog.get_data()
-                for endpoint in svc.get('endpoints', [])
-            )
-            unique_regions = set(region for region in regions if region)
-            os_regions = [OpenStackRegion(provider, region)
-                          for region in unique_regions]
+            def os_regions() -> builtins.list[Region]:
+                regions = (
+                    endpoint.get('region') or endpoint.get('region_id')
+                    for svc in provider.keystone.service_catalog.get_data()
+                    for endpoint in svc.get('endpoints', [])
+                )
+                unique_regions = set(region for region in regions if region)
+                return [OpenStackRegion(provider, region)
+                        for region in unique_regions]
 
             return ClientPagedResultList(self.provider, os_regions,
                                          limit=limit, marker=marker)
@@ -1254,24 +1343,27 @@ class OpenStackNetworkService(BaseNetworkService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Network]:
         provider = cast("OpenStackCloudProvider", self.provider)
-        networks = [OpenStackNetwork(provider, network)
-                    for network in provider.neutron.list_networks()
-                    .get('networks') if network
-                    # If there are no availability zones, keep the network
-                    # in the results list
-                    and (not network.get('availability_zones')
-                         or cast("OpenStackCloudProvider", self.provider).service_zone_name(self)
-                         in network.get('availability_zones'))]
-        return ClientPagedResultList(self.provider, networks,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [OpenStackNetwork(provider, network)
+                     for network in provider.neutron.list_networks()
+                     .get('networks') if network
+                     # If there are no availability zones, keep the network
+                     # in the results list
+                     and (not network.get('availability_zones')
+                          or provider.service_zone_name(self)
+                          in network.get('availability_zones'))],
+            limit=limit, marker=marker)
+
+    def find_iter(self, **kwargs: Any) -> Iterator[Network]:
+        filters = ['label']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
 
     @dispatch(event="provider.networking.networks.find",
               priority=BaseNetworkService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Network]:
-        obj_list = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self._provider, list(matches))
+        return ClientPagedResultList(self._provider,
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.networking.networks.create",
               priority=BaseNetworkService.STANDARD_EVENT_PRIORITY)
@@ -1323,14 +1415,16 @@ class OpenStackSubnetService(BaseSubnetService):
              limit: int | None = None,
              marker: str | None = None) -> ResultList[Subnet]:
         provider = cast("OpenStackCloudProvider", self.provider)
-        if network:
-            network_id = (network.id if isinstance(network, OpenStackNetwork)
-                          else network)
-            subnets = [subnet for subnet in self if network_id ==
-                       subnet.network_id]
-        else:
-            subnets = [OpenStackSubnet(provider, subnet) for subnet in
-                       provider.neutron.list_subnets().get('subnets', [])]
+
+        def subnets() -> builtins.list[Subnet]:
+            if network:
+                network_id = (network.id
+                              if isinstance(network, OpenStackNetwork)
+                              else network)
+                return [subnet for subnet in self if network_id ==
+                        subnet.network_id]
+            return [OpenStackSubnet(provider, subnet) for subnet in
+                    provider.neutron.list_subnets().get('subnets', [])]
         return ClientPagedResultList(self.provider, subnets,
                                      limit=limit, marker=marker)
 
@@ -1412,21 +1506,24 @@ class OpenStackRouterService(BaseRouterService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[Router]:
         provider = cast("OpenStackCloudProvider", self.provider)
-        routers = provider.os_conn.list_routers()
-        os_routers = [OpenStackRouter(provider, r) for r in routers
-                      if not r.availability_zones or
-                      cast("OpenStackCloudProvider", self.provider).service_zone_name(self)
-                      in r.availability_zones]
-        return ClientPagedResultList(self.provider, os_routers, limit=limit,
-                                     marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [OpenStackRouter(provider, r)
+                     for r in provider.os_conn.list_routers()
+                     if not r.availability_zones or
+                     provider.service_zone_name(self)
+                     in r.availability_zones],
+            limit=limit, marker=marker)
+
+    def find_iter(self, **kwargs: Any) -> Iterator[Router]:
+        filters = ['label']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
 
     @dispatch(event="provider.networking.routers.find",
               priority=BaseRouterService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[Router]:
-        obj_list = list(self)
-        filters = ['label']
-        matches = cb_helpers.generic_find(filters, kwargs, obj_list)
-        return ClientPagedResultList(self._provider, list(matches))
+        return ClientPagedResultList(self._provider,
+                                     list(self.find_iter(**kwargs)))
 
     @dispatch(event="provider.networking.routers.create",
               priority=BaseRouterService.STANDARD_EVENT_PRIORITY)
@@ -1475,11 +1572,12 @@ class OpenStackGatewayService(BaseGatewayService):
              marker: str | None = None) -> ResultList[InternetGateway]:
         log.debug("OpenStack listing of all current internet gateways")
         provider = cast("OpenStackCloudProvider", self.provider)
-        igl = [OpenStackInternetGateway(provider, n)
-               for n in self._provider.networking.networks
-               if n.external and not cast(Any, n).shared]
-        return ClientPagedResultList(self._provider, igl, limit=limit,
-                                     marker=marker)
+        return ClientPagedResultList(
+            self._provider,
+            lambda: [OpenStackInternetGateway(provider, n)
+                     for n in self._provider.networking.networks
+                     if n.external and not cast(Any, n).shared],
+            limit=limit, marker=marker)
 
 
 class OpenStackFloatingIPService(BaseFloatingIPService):
@@ -1504,12 +1602,13 @@ class OpenStackFloatingIPService(BaseFloatingIPService):
     def list(self, gateway: Gateway, limit: int | None = None,
              marker: str | None = None) -> ResultList[FloatingIP]:
         provider = cast("OpenStackCloudProvider", self.provider)
-        fips = [OpenStackFloatingIP(provider, fip)
-                for fip in provider.os_conn.network.ips(
-                    floating_network_id=gateway.id
-                )]
-        return ClientPagedResultList(self.provider, fips,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [OpenStackFloatingIP(provider, fip)
+                     for fip in provider.os_conn.network.ips(
+                         floating_network_id=gateway.id
+                     )],
+            limit=limit, marker=marker)
 
     @dispatch(event="provider.networking.floating_ips.create",
               priority=BaseFloatingIPService.STANDARD_EVENT_PRIORITY)
@@ -1575,17 +1674,21 @@ class OpenStackDnsZoneService(BaseDnsZoneService):
     def list(self, limit: int | None = None,
              marker: str | None = None) -> ResultList[DnsZone]:
         provider = cast("OpenStackCloudProvider", self.provider)
-        zones = [OpenStackDnsZone(provider, zone)
-                 for zone in provider.os_conn.dns.zones()]
-        return ClientPagedResultList(self.provider, zones,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [OpenStackDnsZone(provider, zone)
+                     for zone in provider.os_conn.dns.zones()],
+            limit=limit, marker=marker)
+
+    def find_iter(self, **kwargs: Any) -> Iterator[DnsZone]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs, self.iter())
 
     @dispatch(event="provider.dns.host_zones.find",
               priority=BaseDnsZoneService.STANDARD_EVENT_PRIORITY)
     def find(self, **kwargs: Any) -> ResultList[DnsZone]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs, list(self))
-        return ClientPagedResultList(self.provider, list(matches),
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(**kwargs)),
                                      limit=None, marker=None)
 
     @dispatch(event="provider.dns.host_zones.create",
@@ -1644,18 +1747,24 @@ class OpenStackDnsRecordService(BaseDnsRecordService):
              dns_zone: DnsZone | str, limit: int | None = None,
              marker: str | None = None) -> ResultList[DnsRecord]:
         provider = cast("OpenStackCloudProvider", self.provider)
-        recs = [OpenStackDnsRecord(provider, dns_zone, rec)
-                for rec in provider.os_conn.dns.recordsets(
-                    cast(Any, dns_zone).id)]
-        return ClientPagedResultList(self.provider, recs,
-                                     limit=limit, marker=marker)
+        return ClientPagedResultList(
+            self.provider,
+            lambda: [OpenStackDnsRecord(provider, dns_zone, rec)
+                     for rec in provider.os_conn.dns.recordsets(
+                         cast(Any, dns_zone).id)],
+            limit=limit, marker=marker)
+
+    # Like find(), this takes a leading dns_zone, unlike the pageable mixin.
+    def find_iter(self,  # type: ignore[override]
+                  dns_zone: DnsZone | str, **kwargs: Any) -> Iterator[DnsRecord]:
+        filters = ['name']
+        return cb_helpers.iter_find(filters, kwargs,
+                                    cast(Any, dns_zone).records.iter())
 
     def find(self, dns_zone: DnsZone | str,
              **kwargs: Any) -> ResultList[DnsRecord]:
-        filters = ['name']
-        matches = cb_helpers.generic_find(filters, kwargs,
-                                          cast(Any, dns_zone).records)
-        return ClientPagedResultList(self.provider, list(matches),
+        return ClientPagedResultList(self.provider,
+                                     list(self.find_iter(dns_zone, **kwargs)),
                                      limit=None, marker=None)
 
     def create(self, dns_zone: DnsZone | str, name: str, type: str,
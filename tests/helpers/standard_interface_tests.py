@@ -81,14 +81,16 @@ def check_iter(test, service, obj):
 def check_find(test, service, obj):
     # check find
     if isinstance(obj, LabeledCloudResource):
-        find_objs = service.find(label=obj.label)
+        query = {'label': obj.label}
     else:
-        find_objs = service.find(name=obj.name)
+        query = {'name': obj.name}
+    find_objs = service.find(**query)
     test.assertTrue(
         len(find_objs) == 1,
         "Find objects for %s does not return the expected object: %s. Got %s"
         % (type(obj).__name__, getattr(obj, 'label', obj.name), find_objs))
     test.assertEqual(find_objs[0].id, obj.id)
+    test.assertEqual(service.find_first(**query).id, obj.id)
     return find_objs
 
 
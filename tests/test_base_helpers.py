@@ -1,6 +1,9 @@
+import gzip
 import unittest
 
 from cloudbridge.base import helpers as cb_helpers
+from cloudbridge.interfaces.exceptions import InvalidParamException
+from cloudbridge.interfaces.exceptions import ProviderInternalException
 
 
 class BaseHelpersTestCase(unittest.TestCase):
@@ -58,3 +61,125 @@ class BaseHelpersTestCase(unittest.TestCase):
                 invoke_order[0] += "body_"
                 raise CustomException()
         self.assertEqual(invoke_order[0], "body_cleanup")
+
+    def test_crc32c(self):
+        self.assertEqual(cb_helpers.crc32c(b"123456789"), 0xE3069283)
+        self.assertEqual(cb_helpers.crc32c(b""), 0)
+        first, second = b"hello, ", b"world"
+        whole = cb_helpers.crc32c(first + second)
+        self.assertEqual(
+            cb_helpers.crc32c(second, cb_helpers.crc32c(first)), whole)
+        self.assertEqual(
+            cb_helpers.crc32c_combine(cb_helpers.crc32c(first),
+                                      cb_helpers.crc32c(second),
+                                      len(second)), whole)
+
+    def test_iter_find(self):
+        class Obj(object):
+            def __init__(self, name):
+                self.name = name
+
+        consumed = []
+
+        def objs():
+            for name in ["a1", "b1", "a2", "b2"]:
+                consumed.append(name)
+                yield Obj(name)
+
+        matches = cb_helpers.iter_find(['name'], {'name': 'b*'}, objs())
+        self.assertEqual(next(matches).name, "b1")
+        self.assertEqual(consumed, ["a1", "b1"])
+        self.assertEqual([o.name for o in matches], ["b2"])
+        # Unknown filters are rejected before anything is consumed
+        with self.assertRaises(InvalidParamException):
+            cb_helpers.iter_find(['name'], {'size': 1}, objs())
+
+    def test_compile_filters(self):
+        reads = []
+
+        class Obj(object):
+            def __init__(self, name, label, vcpus):
+                self._attrs = {'name': name, 'label': label, 'vcpus': vcpus}
+
+            def __getattr__(self, attr):
+                reads.append(attr)
+                return self._attrs[attr]
+
+        web = Obj("web-1", "prod", 4)
+        matches = cb_helpers.compile_filters(
+            ['name', 'label', 'vcpus'],
+            {'name': 'web-*', 'label': ['prod', 'staging'], 'vcpus': 4})
+        self.assertTrue(matches(web))
+        # Cheap tests run first and each attribute is read once
+        self.assertEqual(reads, ['vcpus', 'label', 'name'])
+        self.assertTrue(matches(Obj("web-2", "staging", 4)))
+        self.assertFalse(matches(Obj("web-3", "dev", 4)))
+        # Globs match the whole value, not just its end
+        self.assertFalse(cb_helpers.compile_filters(
+            ['name'], {'name': 'eb-?'})(web))
+        # A slice is a half-open range
+        self.assertTrue(cb_helpers.compile_filters(
+            ['vcpus'], {'vcpus': slice(2, None)})(web))
+        self.assertFalse(cb_helpers.compile_filters(
+            ['vcpus'], {'vcpus': slice(1, 4)})(web))
+        with self.assertRaises(InvalidParamException):
+            cb_helpers.compile_filters(['name'], {'size': 1})
+
+    def test_glob_prefix(self):
+        self.assertEqual(cb_helpers.glob_prefix("logs/2026-10-*"),
+                         "logs/2026-10-")
+        self.assertEqual(cb_helpers.glob_prefix("a?c"), "a")
+        self.assertEqual(cb_helpers.glob_prefix("[ab]*"), "")
+        self.assertEqual(cb_helpers.glob_prefix("plain.txt"), "plain.txt")
+
+    def test_split_filters(self):
+        def translate(value):
+            return "name = %s" % value if value != "skip" else None
+
+        native, rest = cb_helpers.split_filters(
+            {'name': 'web', 'size': 1}, {'name': translate})
+        self.assertEqual(native, ["name = web"])
+        self.assertEqual(rest, {'size': 1})
+        # Globs, empty values and declined values stay on the client
+        for value in ["web-*", "", "skip"]:
+            native, rest = cb_helpers.split_filters(
+                {'name': value}, {'name': translate})
+            self.assertEqual(native, [])
+            self.assertEqual(rest, {'name': value})
+
+    def test_compress_chunks(self):
+        content = b"a line of a highly compressible log\n" * 1000
+        chunks = [content[i:i + 777] for i in range(0, len(content), 777)]
+        compressed = b"".join(cb_helpers.compress_chunks(chunks, 'gzip'))
+        self.assertLess(len(compressed), len(content) // 10)
+        self.assertEqual(gzip.decompress(compressed), content)
+        # Decompressed from chunks of any size, and across members.
+        twice = compressed + gzip.compress(b"tail")
+        pieces = [twice[i:i + 5] for i in range(0, len(twice), 5)]
+        self.assertEqual(
+            b"".join(cb_helpers.decompress_chunks(pieces, 'gzip')),
+            content + b"tail")
+
+    def test_decompress_chunks_passes_plain_content_through(self):
+        self.assertEqual(
+            b"".join(cb_helpers.decompress_chunks([b"pl", b"ain"], 'gzip')),
+            b"plain")
+
+    def test_decompress_chunks_detects_truncation(self):
+        compressed = gzip.compress(b"some content" * 100)
+        with self.assertRaises(ProviderInternalException):
+            b"".join(cb_helpers.decompress_chunks(
+                [compressed[:len(compressed) // 2]], 'gzip'))
+
+    def test_unsupported_content_encoding(self):
+        with self.assertRaises(InvalidParamException):
+            cb_helpers.check_content_encoding('brotli')
+
+    @unittest.skipIf(cb_helpers.zstandard is None,
+                     "zstandard is not installed")
+    def test_compress_chunks_zstd(self):
+        content = b"zstd compressed content " * 1000
+        compressed = b"".join(cb_helpers.compress_chunks([content], 'zstd'))
+        self.assertEqual(
+            b"".join(cb_helpers.decompress_chunks(
+                [compressed[:10], compressed[10:]], 'zstd')), content)
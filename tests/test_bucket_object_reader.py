@@ -0,0 +1,216 @@
+"""
+Provider-agnostic unit tests for the random-access reader returned by
+``BaseBucketObject.open``.
+
+The reader is built purely on ``download_range``, so it is exercised here
+against in-memory fakes and has coverage in CI without cloud credentials.
+"""
+import io
+import os
+import threading
+import unittest
+import zipfile
+
+from cloudbridge.base.provider import ProviderClonePool
+from cloudbridge.base.resources import BaseBucketObject
+from cloudbridge.interfaces.exceptions import InvalidValueException
+
+
+class _Recorder:
+    """Thread-safe range log shared by the original and cloned fake
+    services."""
+
+    def __init__(self, content):
+        self.content = content
+        self._lock = threading.Lock()
+        self.ranges = []            # (offset, length) served
+        self.threads = set()        # names of threads that served a range
+        self.clone_count = 0
+
+    def serve_range(self, offset, length):
+        with self._lock:
+            self.ranges.append((offset, length))
+            self.threads.add(threading.current_thread().name)
+        return self.content[offset:offset + length]
+
+
+class _FakeService:
+    def __init__(self, recorder):
+        self._recorder = recorder
+
+    def download_range(self, bucket, object_name, offset, length):
+        return self._recorder.serve_range(offset, length)
+
+
+class _FakeStorage:
+    def __init__(self, service):
+        self._bucket_objects = service
+
+
+class _FakeProvider:
+    def __init__(self, recorder):
+        self._recorder = recorder
+        self.storage = _FakeStorage(_FakeService(recorder))
+        self._clone_pool = ProviderClonePool(self)
+
+    def clone(self, zone=None):
+        self._recorder.clone_count += 1
+        return _FakeProvider(self._recorder)
+
+    def _get_config_value(self, key, default_value=None):
+        return default_value
+
+
+class _ReaderObject(BaseBucketObject):
+
+    @property
+    def id(self):
+        return "obj"
+
+    @property
+    def name(self):
+        return "obj"
+
+    @property
+    def size(self):
+        return len(self._provider._recorder.content)
+
+    @property
+    def bucket(self):
+        return "BUCKET"
+
+
+class BucketObjectReaderTestCase(unittest.TestCase):
+
+    def _object(self, content):
+        recorder = _Recorder(content)
+        return recorder, _ReaderObject(_FakeProvider(recorder))
+
+    def test_sequential_read_returns_content(self):
+        content = bytes(range(256)) * 4
+        recorder, obj = self._object(content)
+        with obj.open(block_size=100, cache_blocks=4, read_ahead=2) as f:
+            self.assertEqual(f.read(), content)
+            self.assertEqual(f.read(), b'')
+        # Every block is fetched exactly once.
+        self.assertEqual(
+            sorted(recorder.ranges),
+            [(offset, min(100, len(content) - offset))
+             for offset in range(0, len(content), 100)])
+
+    def test_seek_only_fetches_blocks_that_are_read(self):
+        content = bytes(range(256)) * 40
+        recorder, obj = self._object(content)
+        with obj.open(block_size=64, cache_blocks=4, read_ahead=2) as f:
+            f.seek(-10, os.SEEK_END)
+            self.assertEqual(f.read(10), content[-10:])
+            f.seek(100)
+            self.assertEqual(f.tell(), 100)
+            self.assertEqual(f.read(5), content[100:105])
+            f.seek(5, os.SEEK_CUR)
+            self.assertEqual(f.read(3), content[110:113])
+        # Random access does not trigger read-ahead of the whole object.
+        self.assertEqual(sorted(recorder.ranges),
+                         [(64, 64), (len(content) - 64, 64)])
+        self.assertEqual(recorder.clone_count, 0)
+
+    def test_reads_spanning_blocks(self):
+        content = b"abcdefghijklmnopqrstuvwxyz"
+        _, obj = self._object(content)
+        with obj.open(block_size=4, cache_blocks=2, read_ahead=0) as f:
+            f.seek(3)
+            self.assertEqual(f.read(10), content[3:13])
+            buffer = bytearray(20)
+            self.assertEqual(f.readinto(buffer), 13)
+            self.assertEqual(bytes(buffer[:13]), content[13:])
+
+    def test_cache_is_bounded_and_reused(self):
+        content = bytes(range(100))
+        recorder, obj = self._object(content)
+        with obj.open(block_size=10, cache_blocks=2, read_ahead=0) as f:
+            f.seek(0)
+            f.read(1)
+            f.seek(5)
+            f.read(1)
+            self.assertEqual(len(recorder.ranges), 1)
+            f.seek(50)
+            f.read(1)
+            f.seek(90)
+            f.read(1)
+            # Block 0 was evicted, so it is fetched again.
+            f.seek(0)
+            f.read(1)
+        self.assertEqual(recorder.ranges,
+                         [(0, 10), (50, 10), (90, 10), (0, 10)])
+
+    def test_read_ahead_uses_cloned_services(self):
+        content = bytes(range(200))
+        recorder, obj = self._object(content)
+        with obj.open(block_size=10, cache_blocks=4, read_ahead=3) as f:
+            self.assertEqual(f.read(), content)
+        # Clones are only made as the read-ahead workers need them.
+        self.assertGreaterEqual(recorder.clone_count, 1)
+        self.assertLessEqual(recorder.clone_count, 3)
+        self.assertGreater(len(recorder.threads), 1)
+        self.assertEqual(len(recorder.ranges), 20)
+
+    def test_read_ahead_returns_clones_on_close(self):
+        content = bytes(range(200))
+        recorder, obj = self._object(content)
+        clone_pool = obj._provider._clone_pool
+        f = obj.open(block_size=10, cache_blocks=4, read_ahead=3)
+        self.assertEqual(f.read(), content)
+        cloned = recorder.clone_count
+        f.close()
+        self.assertEqual(clone_pool.idle_count, cloned)
+        # A later reader reuses them rather than cloning again.
+        with obj.open(block_size=10, cache_blocks=4, read_ahead=1) as f:
+            self.assertEqual(f.read(50), content[:50])
+        self.assertEqual(recorder.clone_count, cloned)
+
+    def test_read_ahead_disabled(self):
+        content = bytes(range(50))
+        recorder, obj = self._object(content)
+        with obj.open(block_size=10, read_ahead=0) as f:
+            self.assertEqual(f.read(15), content[:15])
+        self.assertEqual(recorder.clone_count, 0)
+        self.assertEqual(recorder.ranges, [(0, 10), (10, 10)])
+
+    def test_supports_zipfile(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as z:
+            for i in range(20):
+                z.writestr("member-%02d.txt" % i, os.urandom(1000))
+            z.writestr("wanted.txt", b"needle")
+        content = archive.getvalue()
+        recorder, obj = self._object(content)
+        with obj.open(block_size=512, cache_blocks=4, read_ahead=0) as f:
+            with zipfile.ZipFile(f) as z:
+                self.assertEqual(z.read("wanted.txt"), b"needle")
+        fetched = sum(length for _, length in recorder.ranges)
+        self.assertLess(fetched, len(content) // 4)
+
+    def test_closed_reader_raises(self):
+        _, obj = self._object(b"content")
+        f = obj.open()
+        f.close()
+        self.assertTrue(f.closed)
+        with self.assertRaises(ValueError):
+            f.read()
+        with self.assertRaises(ValueError):
+            f.seek(0)
+
+    def test_negative_seek_raises(self):
+        _, obj = self._object(b"content")
+        with obj.open() as f:
+            with self.assertRaises(ValueError):
+                f.seek(-1)
+
+    def test_block_size_must_be_positive(self):
+        _, obj = self._object(b"content")
+        with self.assertRaises(InvalidValueException):
+            obj.open(block_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import itertools
+import time
 
 from cloudbridge.base.helpers import get_env
+from cloudbridge.base.resources import BaseCloudResource
+from cloudbridge.base.resources import BasePageableObjectMixin
 from cloudbridge.base.resources import ClientPagedResultList
 from cloudbridge.base.resources import ServerPagedResultList
 
@@ -17,6 +20,45 @@ class DummyResult(object):
         return "%s (%s)" % (self.id, self.name)
 
 
+class DummyResource(BaseCloudResource):
+
+    def __init__(self, provider, objid):
+        super(DummyResource, self).__init__(provider)
+        self._id = objid
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def name(self):
+        return str(self._id)
+
+    def __eq__(self, other):
+        return (isinstance(other, DummyResource) and
+                # pylint:disable=protected-access
+                self._provider == other._provider and self.id == other.id)
+
+
+class DummyPageable(BasePageableObjectMixin):
+
+    def __init__(self, provider, objects, fail_at=None):
+        self._provider = provider
+        self.objects = objects
+        self.fail_at = fail_at
+        self.markers = []
+
+    def list(self, limit=None, marker=None):
+        self.markers.append(marker)
+        start = int(marker) if marker else 0
+        if start == self.fail_at:
+            raise ValueError("page %s failed" % start)
+        end = start + (limit or 2)
+        return ServerPagedResultList(
+            end < len(self.objects), str(end), False,
+            data=self.objects[start:end])
+
+
 class CloudHelpersTestCase(ProviderTestBase):
 
     _multiprocess_can_split_ = True
@@ -35,7 +77,9 @@ class CloudHelpersTestCase(ProviderTestBase):
         # A list with limit=2 and marker=None
         results = ClientPagedResultList(self.provider, objects, 2, None)
         self.assertListEqual(results, list(itertools.islice(objects, 2)))
-        self.assertEqual(results.marker, objects[1].id)
+        self.assertListEqual(
+            ClientPagedResultList(self.provider, objects, 2, results.marker),
+            list(itertools.islice(objects, 2, 4)))
         self.assertTrue(results.is_truncated)
         self.assertTrue(results.supports_total)
         self.assertEqual(results.total_results, 4)
@@ -60,6 +104,41 @@ class CloudHelpersTestCase(ProviderTestBase):
         self.assertFalse(results.supports_server_paging, "Client paged result"
                          " lists should return False for server paging.")
 
+        # An empty marker starts from the beginning, as no marker does
+        results = ClientPagedResultList(self.provider, objects, 2, "")
+        self.assertListEqual(results, list(itertools.islice(objects, 2)))
+        self.assertTrue(results.is_truncated)
+
+    def test_client_paged_result_list_snapshot(self):
+        objects = self.objects
+        fetches = []
+
+        def fetch():
+            fetches.append(1)
+            return objects
+
+        # Following pages are served from a snapshot of the first
+        seen = []
+        results = ClientPagedResultList(self.provider, fetch, 1, None)
+        seen.extend(results)
+        while results.is_truncated:
+            results = ClientPagedResultList(self.provider, fetch, 1,
+                                            results.marker)
+            seen.extend(results)
+        self.assertListEqual(seen, objects)
+        self.assertEqual(len(fetches), 1)
+        self.assertEqual(results.total_results, 4)
+
+        # A marker whose snapshot is gone refetches and resumes after the
+        # same object
+        results = ClientPagedResultList(self.provider, fetch, 2, None)
+        # pylint:disable=protected-access
+        self.provider._result_snapshots.clear()
+        results = ClientPagedResultList(self.provider, fetch, 2,
+                                        results.marker)
+        self.assertListEqual(results, list(itertools.islice(objects, 2, 4)))
+        self.assertEqual(len(fetches), 3)
+
     def test_server_paged_result_list(self):
 
         objects = list(itertools.islice(self.objects, 2))
@@ -77,6 +156,56 @@ class CloudHelpersTestCase(ProviderTestBase):
         with self.assertRaises(NotImplementedError):
             results.data
 
+    def test_iter_prefetch(self):
+        objects = [DummyResult(i, str(i)) for i in range(20)]
+
+        pageable = DummyPageable(self.provider, objects)
+        self.assertListEqual(list(pageable.iter(prefetch=3)), objects)
+        self.assertListEqual(pageable.markers,
+                             [None] + [str(i) for i in range(2, 20, 2)])
+
+        # Closing the iterator early stops the prefetching
+        pageable = DummyPageable(self.provider, objects)
+        results = pageable.iter(prefetch=1)
+        next(results)
+        results.close()
+        time.sleep(0.5)
+        self.assertLess(len(pageable.markers), 5)
+
+        # A failed page is raised by the iterator
+        pageable = DummyPageable(self.provider, objects, fail_at=4)
+        with self.assertRaises(ValueError):
+            list(pageable.iter(prefetch=2))
+
+    def test_iter_prefetch_rebinds_results(self):
+        class ClonedPageable(DummyPageable):
+            """Found on clones of the provider, with results of its own."""
+            def _on_provider(self, provider):
+                return ClonedPageable(provider, None)
+
+            def list(self, limit=None, marker=None):
+                # Each result holds others, in a list and in a dict.
+                self.objects = []
+                for i in range(6):
+                    result = DummyResource(self._provider, i)
+                    result.children = [DummyResource(self._provider, -i)]
+                    result.by_name = {'self': result, 'ids': (i, -i)}
+                    self.objects.append(result)
+                return super(ClonedPageable, self).list(limit, marker)
+
+        results = list(ClonedPageable(self.provider, None).iter(prefetch=2))
+        # Pages fetched through a clone are handed out bound to the
+        # provider itself, and equal to its own results.
+        self.assertListEqual(
+            results, [DummyResource(self.provider, i) for i in range(6)])
+        for i, result in enumerate(results):
+            # pylint:disable=protected-access
+            self.assertIs(result._provider, self.provider)
+            self.assertIs(result.children[0]._provider, self.provider)
+            self.assertEqual(result.children[0].id, -i)
+            self.assertIs(result.by_name['self'], result)
+            self.assertEqual(result.by_name['ids'], (i, -i))
+
     def test_type_validation(self):
         # Make sure internal type checking implementation properly sets types.
         self.provider.config['text_type_check'] = 'test-text'
@@ -8,14 +8,21 @@ AWS-backed and AWS overrides the driver with boto3's native downloader, the
 driver is exercised here directly against in-memory fakes so it has coverage
 in CI without cloud credentials.
 """
+import gzip
+import hashlib
 import os
 import shutil
 import tempfile
 import threading
 import unittest
+from unittest import mock
 
+from cloudbridge.base.helpers import crc32c
+from cloudbridge.base.provider import ProviderClonePool
 from cloudbridge.base.resources import BaseBucketObject
+from cloudbridge.interfaces.exceptions import ChecksumMismatchException
 from cloudbridge.interfaces.exceptions import InvalidValueException
+from cloudbridge.interfaces.exceptions import ProviderInternalException
 from cloudbridge.interfaces.resources import TransferConfig
 
 
@@ -34,6 +41,14 @@ class _Recorder:
         self.max_active = 0
         self.fail_on_offset = None  # offset that should raise
         self.on_serve = None        # hook called as each range is served
+        self.etag = "etag-1"        # version of the content being served
+        self.chunk_size = 3         # size of the chunks iter_range yields
+        self.chunks = 0             # number of chunks yielded
+        self.drop_tail = False      # end each streamed range one byte early
+        self.stored_content = content  # content the stored checksums are of
+        self.stored_part_size = None  # parts of a stored digest of digests
+        self.refreshes = 0          # metadata lookups made
+        self.encoding = None        # Content-Encoding of the content
 
     def serve_range(self, service, offset, length):
         with self._lock:
@@ -63,23 +78,44 @@ class _FakeService:
     def download_range(self, bucket, object_name, offset, length):
         return self._recorder.serve_range(self, offset, length)
 
+    def iter_range(self, bucket, object_name, offset, length):
+        recorder = self._recorder
+        data = recorder.serve_range(self, offset, length)
+        if recorder.drop_tail:
+            data = data[:-1]
+        for start in range(0, len(data), recorder.chunk_size):
+            recorder.chunks += 1
+            yield data[start:start + recorder.chunk_size]
+
 
 class _FakeStorage:
     def __init__(self, service):
         self._bucket_objects = service
 
 
+class _FakeBucket:
+    name = "BUCKET"
+
+
 class _FakeProvider:
+    PROVIDER_ID = "fake"
+
     def __init__(self, recorder):
         self._recorder = recorder
+        self.config = {}
         self.storage = _FakeStorage(_FakeService(recorder, self))
+        self._clone_pool = ProviderClonePool(self)
 
     def clone(self, zone=None):
         self._recorder.clone_count += 1
         return _FakeProvider(self._recorder)
 
     def _get_config_value(self, key, default_value=None):
-        return default_value
+        return self.config.get(key, default_value)
+
+
+class _Throttled(Exception):
+    pass
 
 
 class _DriverObject(BaseBucketObject):
@@ -105,18 +141,45 @@ class _DriverObject(BaseBucketObject):
 
     @property
     def bucket(self):
-        return "BUCKET"
+        return _FakeBucket()
+
+    @property
+    def _etag(self):
+        return self._provider._recorder.etag
+
+    @staticmethod
+    def _is_throttling_error(error):
+        return isinstance(error, _Throttled)
 
-    def save_content(self, target_stream):
+    def refresh(self):
+        self._provider._recorder.refreshes += 1
+
+    @property
+    def _content_encoding(self):
+        return self._provider._recorder.encoding
+
+    def _stored_checksum(self, algorithm):
+        content = self._provider._recorder.stored_content
+        part_size = self._provider._recorder.stored_part_size
+        if part_size is not None:
+            digests = b"".join(
+                hashlib.new(algorithm, content[i:i + part_size]).digest()
+                for i in range(0, len(content), part_size))
+            return hashlib.new(algorithm, digests).digest(), part_size
+        if algorithm == 'crc32c':
+            return crc32c(content).to_bytes(4, 'big'), None
+        return hashlib.new(algorithm, content).digest(), None
+
+    def _iter_content(self):
         self._provider._recorder.single_shot = True
-        target_stream.write(self._provider._recorder.content)
+        return [self._provider._recorder.content]
 
     def _multipart_threshold(self, config=None):
         if config is not None and config.threshold is not None:
             return config.threshold
         return self._threshold
 
-    def _multipart_part_size(self, config=None):
+    def _multipart_part_size(self, config=None, size=None):
         if config is not None and config.part_size is not None:
             return config.part_size
         return self._part_size
@@ -209,6 +272,24 @@ class DownloadDriverTestCase(unittest.TestCase):
         self.assertGreater(recorder.max_active, 1)
         self.assertLessEqual(recorder.max_active, 3)
 
+    def test_streams_ranges_into_the_file_in_chunks(self):
+        content = bytes(range(200))
+        recorder = _Recorder(content)
+        recorder.chunk_size = 7
+        driver = self._driver(
+            recorder, threshold=1, part_size=32, concurrency=3)
+        self.assertEqual(self._download(driver), content)
+        # 7 ranges of up to 32 bytes, each streamed in 7-byte chunks.
+        self.assertEqual(recorder.chunks, 6 * 5 + 2)
+
+    def test_short_range_raises(self):
+        recorder = _Recorder(bytes(range(32)))
+        recorder.drop_tail = True
+        driver = self._driver(
+            recorder, threshold=1, part_size=8, concurrency=2)
+        with self.assertRaises(ProviderInternalException):
+            self._download(driver)
+
     def test_removes_partial_file_and_raises_on_range_failure(self):
         content = bytes(range(16))
         recorder = _Recorder(content)
@@ -301,6 +382,301 @@ class DownloadDriverTestCase(unittest.TestCase):
             self._download(driver, TransferConfig(part_size=0))
         self.assertEqual(recorder.ranges, [])
 
+    def test_verifies_checksum_of_ranges(self):
+        content = bytes(range(64))
+        for concurrency in (1, 3):
+            recorder = _Recorder(content)
+            driver = self._driver(
+                recorder, threshold=1, part_size=4, concurrency=concurrency)
+            self.assertEqual(
+                self._download(driver, TransferConfig(checksum='crc32c')),
+                content)
+
+    def test_verifies_checksum_of_single_shot(self):
+        content = b"tiny content"
+        recorder = _Recorder(content)
+        driver = self._driver(
+            recorder, threshold=100, part_size=4, concurrency=3)
+        self.assertEqual(
+            self._download(driver, TransferConfig(checksum='md5')), content)
+        self.assertTrue(recorder.single_shot)
+
+    def test_adaptive_download_retries_throttled_range(self):
+        content = bytes(range(64))
+        recorder = _Recorder(content)
+        throttled = []
+        lock = threading.Lock()
+
+        def throttle_once():
+            with lock:
+                if not throttled:
+                    throttled.append(True)
+                    raise _Throttled("slow down")
+        recorder.on_serve = throttle_once
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=1)
+        config = TransferConfig(max_concurrency=4, adaptive=True,
+                                checksum='crc32c')
+        with mock.patch('cloudbridge.base.resources.time.sleep') as sleep:
+            self.assertEqual(self._download(driver, config), content)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(len(recorder.ranges), 16)
+        self.assertLessEqual(recorder.max_active, 4)
+
+    def test_verifies_checksum_of_parts_of_another_size(self):
+        # A digest of the digests of 6 byte parts is verified by fetching
+        # those parts, whatever the configured part size.
+        content = bytes(range(64))
+        for part_size in (4, 7):
+            recorder = _Recorder(content)
+            recorder.stored_part_size = 6
+            driver = self._driver(
+                recorder, threshold=1, part_size=part_size, concurrency=3)
+            self.assertEqual(
+                self._download(driver, TransferConfig(checksum='md5')),
+                content)
+            self.assertEqual(sorted(recorder.ranges),
+                             [(offset, min(6, 64 - offset))
+                              for offset in range(0, 64, 6)])
+
+    def test_checksum_mismatch_fails_download(self):
+        content = bytes(range(64))
+        recorder = _Recorder(content)
+        recorder.stored_content = content[:-1] + b"!"
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=3)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'dataset.dat')
+        try:
+            with self.assertRaises(ChecksumMismatchException):
+                driver.download_to_file(path,
+                                        TransferConfig(checksum='crc32c'))
+            self.assertEqual(os.listdir(directory), [])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_checksum_that_cannot_be_derived_is_not_verified(self):
+        # An MD5 of the whole object cannot be derived from those of its
+        # ranges, so the download succeeds with a warning.
+        content = bytes(range(64))
+        recorder = _Recorder(content)
+        recorder.stored_content = b"something else"
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=3)
+        with self.assertLogs('cloudbridge.base.resources', 'WARNING'):
+            self.assertEqual(
+                self._download(driver, TransferConfig(checksum='md5')),
+                content)
+
+    def _fail_resumable(self, recorder, driver, path, checksum=None):
+        with self.assertRaises(Exception):
+            driver.download_to_file(
+                path, TransferConfig(resumable=True, checksum=checksum))
+        recorder.fail_on_offset = None
+        served = list(recorder.ranges)
+        recorder.ranges = []
+        return served
+
+    def test_resumable_download_fetches_only_missing_ranges(self):
+        content = bytes(range(32))
+        recorder = _Recorder(content)
+        recorder.fail_on_offset = 16
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=1)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'dataset.dat')
+        try:
+            served = self._fail_resumable(recorder, driver, path)
+            self.assertEqual(served, [(0, 4), (4, 4), (8, 4), (12, 4)])
+            # The partial file and its journal survive the failure.
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(
+                sorted(os.listdir(directory)),
+                ['dataset.dat.cbpart', 'dataset.dat.cbpart.journal'])
+
+            driver.download_to_file(path, TransferConfig(resumable=True))
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(recorder.ranges,
+                             [(16, 4), (20, 4), (24, 4), (28, 4)])
+            self.assertEqual(os.listdir(directory), ['dataset.dat'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_resumable_download_concurrently(self):
+        content = bytes(range(64))
+        recorder = _Recorder(content)
+        recorder.fail_on_offset = 32
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=3)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'dataset.dat')
+        try:
+            served = self._fail_resumable(recorder, driver, path)
+            driver.download_to_file(path, TransferConfig(resumable=True))
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), content)
+            # No range is fetched twice, and together they tile the object.
+            self.assertFalse(set(served) & set(recorder.ranges))
+            self.assertEqual(
+                sorted(served + recorder.ranges),
+                [(offset, 4) for offset in range(0, 64, 4)])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_resumable_download_verifies_journalled_ranges(self):
+        content = bytes(range(64))
+        recorder = _Recorder(content)
+        recorder.fail_on_offset = 32
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=3)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'dataset.dat')
+        config = TransferConfig(resumable=True, checksum='crc32c')
+        try:
+            self._fail_resumable(recorder, driver, path, 'crc32c')
+            driver.download_to_file(path, config)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), content)
+
+            # A corrupt download is discarded, progress and all.
+            os.remove(path)
+            recorder.fail_on_offset = 32
+            self._fail_resumable(recorder, driver, path, 'crc32c')
+            recorder.stored_content = content[:-1] + b"!"
+            with self.assertRaises(ChecksumMismatchException):
+                driver.download_to_file(path, config)
+            self.assertEqual(os.listdir(directory), [])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_resumable_download_restarts_when_object_changes(self):
+        content = bytes(range(32))
+        recorder = _Recorder(content)
+        recorder.fail_on_offset = 16
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=1)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'dataset.dat')
+        try:
+            self._fail_resumable(recorder, driver, path)
+            recorder.etag = "etag-2"
+            driver.download_to_file(path, TransferConfig(resumable=True))
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(
+                recorder.ranges, [(offset, 4) for offset in range(0, 32, 4)])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_non_resumable_download_discards_progress(self):
+        content = bytes(range(32))
+        recorder = _Recorder(content)
+        recorder.fail_on_offset = 16
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=1)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'dataset.dat')
+        try:
+            with self.assertRaises(Exception):
+                driver.download_to_file(path)
+            self.assertEqual(os.listdir(directory), [])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_decompresses_encoded_content(self):
+        content = b"0123456789" * 100
+        recorder = _Recorder(gzip.compress(content))
+        recorder.encoding = 'gzip'
+        ranged = self._driver(
+            recorder, threshold=10, part_size=64, concurrency=3)
+        self.assertEqual(self._download(ranged), content)
+        self.assertFalse(recorder.single_shot)
+        single_shot = self._driver(
+            recorder, threshold=10000, part_size=64, concurrency=3)
+        self.assertEqual(self._download(single_shot), content)
+        self.assertEqual(b"".join(single_shot.iter_content()), content)
+        # Unless the content is asked for as it is stored.
+        self.assertEqual(
+            self._download(ranged, TransferConfig(compression='identity')),
+            recorder.content)
+
+    def _cached_driver(self, recorder, directory, max_size=1024):
+        driver = self._driver(
+            recorder, threshold=1, part_size=4, concurrency=2)
+        driver._provider.config.update({
+            'object_cache_dir': os.path.join(directory, 'cache'),
+            'object_cache_max_size': max_size})
+        return driver
+
+    def test_cached_download_is_served_from_cache(self):
+        content = bytes(range(32))
+        recorder = _Recorder(content)
+        directory = tempfile.mkdtemp()
+        try:
+            driver = self._cached_driver(recorder, directory)
+            first = os.path.join(directory, 'first.dat')
+            second = os.path.join(directory, 'second.dat')
+            driver.download_to_file(first)
+            fetched = len(recorder.ranges)
+            driver.download_to_file(second)
+            # The second download only checked the object's version.
+            self.assertEqual(len(recorder.ranges), fetched)
+            self.assertEqual(recorder.refreshes, 2)
+            for path in (first, second):
+                with open(path, 'rb') as f:
+                    self.assertEqual(f.read(), content)
+            self.assertTrue(os.path.samefile(first, second))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_cached_download_refetches_changed_object(self):
+        recorder = _Recorder(b"version one of the data")
+        directory = tempfile.mkdtemp()
+        try:
+            driver = self._cached_driver(recorder, directory)
+            path = os.path.join(directory, 'data.dat')
+            driver.download_to_file(path)
+            recorder.content = b"version two of the data"
+            recorder.etag = "etag-2"
+            driver.download_to_file(path)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b"version two of the data")
+        finally:
+            shutil.rmtree(directory)
+
+    def test_cache_evicts_least_recently_used(self):
+        recorder = _Recorder(bytes(10))
+        directory = tempfile.mkdtemp()
+        try:
+            driver = self._cached_driver(recorder, directory, max_size=25)
+            cache = driver._object_cache()
+            path = os.path.join(directory, 'data.dat')
+            entries = {}
+            for mtime, etag in enumerate(['a', 'b', 'a', 'c']):
+                recorder.etag = etag
+                driver.download_to_file(path)
+                entries[etag] = cache._entry_path(cache.key(driver))
+                os.utime(entries[etag], (mtime, mtime))
+            self.assertTrue(os.path.exists(entries['a']))
+            self.assertFalse(os.path.exists(entries['b']))
+            self.assertTrue(os.path.exists(entries['c']))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_cache_can_be_bypassed(self):
+        recorder = _Recorder(bytes(range(32)))
+        directory = tempfile.mkdtemp()
+        try:
+            driver = self._cached_driver(recorder, directory)
+            path = os.path.join(directory, 'data.dat')
+            driver.download_to_file(path, TransferConfig(cache=False))
+            self.assertFalse(os.path.exists(
+                os.path.join(directory, 'cache')))
+            self.assertEqual(recorder.refreshes, 0)
+        finally:
+            shutil.rmtree(directory)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,15 +8,37 @@ and AWS overrides the driver with boto3's native uploader, the driver is
 exercised here directly against in-memory fakes so it has coverage in CI
 without cloud credentials.
 """
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
 import threading
 import unittest
 from io import BytesIO
+from unittest import mock
 
+from cloudbridge.base.helpers import crc32c
+from cloudbridge.base.provider import ProviderClonePool
 from cloudbridge.base.resources import BaseBucketObject
 from cloudbridge.base.resources import BaseMultipartUpload
 from cloudbridge.base.resources import BaseUploadPart
+from cloudbridge.base.resources import MemoryPartReader
+from cloudbridge.interfaces.exceptions import ChecksumMismatchException
 from cloudbridge.interfaces.exceptions import InvalidValueException
 from cloudbridge.interfaces.resources import TransferConfig
+from cloudbridge.providers.aws.resources import AWSBucketObject
+
+try:
+    from cloudbridge.providers.gcp.resources import GCPBucketObject
+except ImportError:
+    GCPBucketObject = None
+
+try:
+    from cloudbridge.providers.openstack.resources import \
+        OpenStackBucketObject
+except ImportError:
+    OpenStackBucketObject = None
 
 
 class _Recorder:
@@ -32,6 +54,15 @@ class _Recorder:
         self.active = 0
         self.max_active = 0
         self.fail_on_part = None    # part_number that should raise
+        self.uploads_created = []   # ids of the multipart uploads created
+        self.sent = []              # part numbers in the order they arrived
+        self.completed_upload = None
+        self.readers = []           # file-like parts, as they were handed in
+        self.corrupt_part = None    # part_number stored with a flipped byte
+        self.throttle_part = None   # part_number throttled on its first try
+        self.single_shot = None     # payload uploaded in a single request
+        self.encoding = None        # Content-Encoding set after uploading
+        self.gone_uploads = set()   # ids of uploads aborted on the server
 
     def record_part(self, service, part_number, data):
         with self._lock:
@@ -40,17 +71,37 @@ class _Recorder:
         try:
             if self.fail_on_part == part_number:
                 raise RuntimeError("boom on part %d" % part_number)
+            with self._lock:
+                throttle = self.throttle_part == part_number
+                if throttle:
+                    self.throttle_part = None
+            if throttle:
+                raise _Throttled("slow down on part %d" % part_number)
             # Hold briefly so concurrent uploads genuinely overlap.
             time_to_sleep = 0.02
             _sleep(time_to_sleep)
+            if hasattr(data, 'read'):
+                self.readers.append(data)
+                data = data.read()
+            if self.corrupt_part == part_number:
+                data = bytes([data[0] ^ 0xFF]) + data[1:]
             with self._lock:
                 self.parts[part_number] = bytes(data)
+                self.sent.append(part_number)
                 self.services_used.add(id(service))
         finally:
             with self._lock:
                 self.active -= 1
 
 
+class _Throttled(Exception):
+    pass
+
+
+class _NoSuchUpload(Exception):
+    pass
+
+
 def _sleep(seconds):
     # Indirection so the deterministic tests can monkeypatch if needed; a plain
     # sleep is fine here and keeps the overlap window small.
@@ -62,21 +113,55 @@ class _FakeService:
         self._recorder = recorder
         self._provider = provider
 
+    @property
+    def provider(self):
+        return self._provider
+
     def create_multipart_upload(self, bucket, object_name):
-        return BaseMultipartUpload(self._provider, bucket, object_name, "upl")
+        upload_id = "upl-%d" % len(self._recorder.uploads_created)
+        self._recorder.uploads_created.append(upload_id)
+        return BaseMultipartUpload(
+            self._provider, bucket, object_name, upload_id)
 
     def upload_part(self, bucket, upload, part_number, data):
+        if upload.id in self._recorder.gone_uploads:
+            raise _NoSuchUpload(upload.id)
         self._recorder.record_part(self, part_number, data)
         return BaseUploadPart(part_number, "etag-%d" % part_number)
 
     def complete_multipart_upload(self, bucket, upload, parts):
         ordered = sorted(parts, key=lambda p: p.part_number)
         self._recorder.completed_order = [p.part_number for p in ordered]
+        self._recorder.completed_upload = upload.id
         return b"".join(self._recorder.parts[p.part_number] for p in ordered)
 
     def abort_multipart_upload(self, bucket, upload):
         self._recorder.aborted = True
 
+    def get(self, bucket, object_name):
+        return _StoredObject(self._recorder)
+
+
+class _StoredObject:
+    """The uploaded object, with checksums of the parts as stored: a CRC32C
+    of the whole content, or other digests of the parts' digests."""
+
+    def __init__(self, recorder):
+        self._recorder = recorder
+
+    def _stored_checksum(self, algorithm):
+        parts = [self._recorder.parts[number]
+                 for number in sorted(self._recorder.parts)]
+        if algorithm == 'crc32c':
+            return crc32c(b"".join(parts)).to_bytes(4, 'big'), None
+        digests = b"".join(hashlib.new(algorithm, part).digest()
+                           for part in parts)
+        return hashlib.new(algorithm, digests).digest(), len(parts[0])
+
+
+class _FakeBucket:
+    name = "BUCKET"
+
 
 class _FakeStorage:
     def __init__(self, service):
@@ -87,6 +172,7 @@ class _FakeProvider:
     def __init__(self, recorder):
         self._recorder = recorder
         self.storage = _FakeStorage(_FakeService(recorder, self))
+        self._clone_pool = ProviderClonePool(self)
 
     def clone(self, zone=None):
         self._recorder.clone_count += 1
@@ -117,9 +203,9 @@ class _DriverObject(BaseBucketObject):
 
     @property
     def bucket(self):
-        return "BUCKET"
+        return _FakeBucket()
 
-    def _multipart_part_size(self, config=None):
+    def _multipart_part_size(self, config=None, size=None):
         if config is not None and config.part_size is not None:
             return config.part_size
         return self._part_size
@@ -129,6 +215,21 @@ class _DriverObject(BaseBucketObject):
             return config.max_concurrency
         return self._concurrency
 
+    @staticmethod
+    def _is_throttling_error(error):
+        return isinstance(error, _Throttled)
+
+    @staticmethod
+    def _is_missing_upload_error(error):
+        return isinstance(error, _NoSuchUpload)
+
+    def _upload_single_shot(self, data, config=None):
+        self._provider._recorder.single_shot = data
+        return data
+
+    def _set_content_encoding(self, service, encoding):
+        self._provider._recorder.encoding = encoding
+
 
 class MultipartDriverTestCase(unittest.TestCase):
 
@@ -165,6 +266,53 @@ class MultipartDriverTestCase(unittest.TestCase):
         self.assertEqual(len(recorder.parts[2]), 8)
         self.assertEqual(len(recorder.parts[3]), 4)
 
+    def test_upload_from_generator_switches_to_multipart(self):
+        recorder = _Recorder()
+        driver = self._driver(recorder, part_size=8, concurrency=2)
+        content = bytes(range(20))  # past the threshold -> 8, 8, 4
+        chunks = (content[i:i + 3] for i in range(0, len(content), 3))
+        result = driver.upload(chunks, TransferConfig(threshold=10))
+        self.assertEqual(result, content)
+        self.assertIsNone(recorder.single_shot)
+        self.assertEqual([len(recorder.parts[n]) for n in (1, 2, 3)],
+                         [8, 8, 4])
+
+    def test_upload_from_short_generator_is_single_shot(self):
+        recorder = _Recorder()
+        driver = self._driver(recorder, part_size=8, concurrency=2)
+        chunks = iter([b"abc", b"", b"def"])
+        driver.upload(chunks, TransferConfig(threshold=10))
+        self.assertEqual(recorder.single_shot, b"abcdef")
+        self.assertEqual(recorder.parts, {})
+
+    def test_upload_from_unsized_stream(self):
+        recorder = _Recorder()
+        driver = self._driver(recorder, part_size=8, concurrency=1)
+
+        class _Pipe:
+            """A stream that can only be read, as from a pipe."""
+            def __init__(self, data):
+                self._buf = BytesIO(data)
+
+            def read(self, size=-1):
+                return self._buf.read(min(size, 5))
+
+        content = bytes(range(30))
+        result = driver.upload(_Pipe(content), TransferConfig(threshold=10))
+        self.assertEqual(result, content)
+        self.assertEqual(recorder.completed_order, [1, 2, 3, 4])
+
+    def test_compressed_upload(self):
+        recorder = _Recorder()
+        driver = self._driver(recorder, part_size=64, concurrency=2)
+        content = os.urandom(2000).hex().encode()  # compresses to ~60%
+        result = driver.upload(
+            BytesIO(content), TransferConfig(threshold=100, compression='gzip'))
+        self.assertGreater(len(recorder.parts), 1)
+        self.assertLess(len(result), len(content))
+        self.assertEqual(gzip.decompress(result), content)
+        self.assertEqual(recorder.encoding, 'gzip')
+
     def test_uploads_parts_concurrently_via_cloned_services(self):
         recorder = _Recorder()
         concurrency = 4
@@ -180,6 +328,46 @@ class MultipartDriverTestCase(unittest.TestCase):
         self.assertGreater(recorder.max_active, 1)
         self.assertLessEqual(recorder.max_active, concurrency)
 
+    def test_later_uploads_reuse_clones(self):
+        recorder = _Recorder()
+        concurrency = 4
+        driver = self._driver(recorder, part_size=1, concurrency=concurrency)
+        driver._upload_multipart(BytesIO(b"0123456789ab"))
+        driver._upload_multipart(BytesIO(b"cdefghijklmn"))
+        # The second upload checks out the clones the first one returned to
+        # the provider's pool.
+        self.assertEqual(recorder.clone_count, concurrency)
+        self.assertEqual(len(recorder.services_used), concurrency)
+
+    def test_verifies_checksum_of_parts(self):
+        content = b"abcdefghijABCDEFGHIJ0123456789x"
+        for algorithm in ('md5', 'crc32c', 'sha256'):
+            for concurrency in (1, 3):
+                recorder = _Recorder()
+                driver = self._driver(recorder, part_size=4,
+                                      concurrency=concurrency)
+                result = driver._upload_multipart(
+                    BytesIO(content), TransferConfig(checksum=algorithm))
+                self.assertEqual(result, content)
+
+    def test_corrupted_part_fails_verification(self):
+        recorder = _Recorder()
+        recorder.corrupt_part = 3
+        driver = self._driver(recorder, part_size=4, concurrency=3)
+        with self.assertRaises(ChecksumMismatchException):
+            driver._upload_multipart(BytesIO(bytes(range(32))),
+                                     TransferConfig(checksum='md5'))
+        # The upload was completed before it could be verified.
+        self.assertFalse(recorder.aborted)
+
+    def test_unknown_checksum_raises(self):
+        recorder = _Recorder()
+        driver = self._driver(recorder, part_size=4, concurrency=1)
+        with self.assertRaises(InvalidValueException):
+            driver._upload_multipart(BytesIO(b"abcdefgh"),
+                                     TransferConfig(checksum='sha1'))
+        self.assertEqual(recorder.uploads_created, [])
+
     def test_single_concurrency_does_not_clone(self):
         recorder = _Recorder()
         driver = self._driver(recorder, part_size=4, concurrency=1)
@@ -218,6 +406,272 @@ class MultipartDriverTestCase(unittest.TestCase):
         # Nothing should have been created before validation failed.
         self.assertEqual(recorder.completed_order, None)
 
+    def test_part_size_grows_to_fit_part_limit(self):
+        recorder = _Recorder()
+        driver = self._driver(recorder, part_size=4, concurrency=1)
+        # The resolver proper, rather than the fixed size of the fake.
+        part_size = BaseBucketObject._multipart_part_size
+        default = BaseBucketObject.CB_MULTIPART_PART_SIZE
+        self.assertEqual(part_size(driver, None, default * 10000), default)
+        self.assertEqual(part_size(driver, None, default * 10000 + 1),
+                         2 * default)
+        self.assertEqual(part_size(driver, None, default * 25000),
+                         3 * default)
+        # A part size given per call is used as is...
+        config = TransferConfig(part_size=default)
+        self.assertEqual(part_size(driver, config, default * 25000), default)
+        # ...but is rejected up-front if it needs too many parts.
+        driver.CB_MULTIPART_MAX_PARTS = 4
+        with self.assertRaises(InvalidValueException):
+            driver._upload_multipart(BytesIO(bytes(20)))
+        self.assertEqual(recorder.uploads_created, [])
+
+    def test_adaptive_concurrency_grows_with_throughput(self):
+        recorder = _Recorder()
+        driver = self._driver(recorder, part_size=1, concurrency=1)
+        content = bytes(range(64))
+        result = driver._upload_multipart(
+            BytesIO(content), TransferConfig(max_concurrency=8,
+                                             adaptive=True))
+        self.assertEqual(result, content)
+        # Started with two parts in flight, and added more as each round
+        # moved more data, up to the ceiling.
+        self.assertGreater(recorder.max_active, 2)
+        self.assertLessEqual(recorder.max_active, 8)
+
+    def test_adaptive_upload_retries_throttled_part(self):
+        recorder = _Recorder()
+        recorder.throttle_part = 3
+        driver = self._driver(recorder, part_size=4, concurrency=1)
+        content = bytes(range(32))
+        with mock.patch('cloudbridge.base.resources.time.sleep') as sleep:
+            result = driver._upload_multipart(
+                BytesIO(content), TransferConfig(max_concurrency=4,
+                                                 adaptive=True))
+        self.assertEqual(result, content)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(recorder.sent.count(3), 1)
+        self.assertFalse(recorder.aborted)
+
+    def test_throttled_part_fails_without_adaptive(self):
+        recorder = _Recorder()
+        recorder.throttle_part = 3
+        driver = self._driver(recorder, part_size=4, concurrency=4)
+        with self.assertRaises(Exception):
+            driver._upload_multipart(BytesIO(bytes(range(32))))
+        self.assertTrue(recorder.aborted)
+
+
+class MappedUploadTestCase(unittest.TestCase):
+
+    def test_file_parts_are_views_of_the_mapped_file(self):
+        recorder = _Recorder()
+        driver = _DriverObject(_FakeProvider(recorder), part_size=4,
+                               concurrency=3)
+        content = bytes(range(30))
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+        try:
+            result = driver.upload_from_file(
+                f.name, TransferConfig(threshold=1))
+        finally:
+            os.remove(f.name)
+        self.assertEqual(result, content)
+        self.assertEqual(len(recorder.readers), 8)
+        for reader in recorder.readers:
+            self.assertIsInstance(reader, MemoryPartReader)
+            # Each part's view is released once it has been sent.
+            self.assertTrue(reader.closed)
+
+    def test_memory_part_reader(self):
+        reader = MemoryPartReader(memoryview(b"0123456789"))
+        self.assertEqual(len(reader), 10)
+        self.assertEqual(reader.read(3), b"012")
+        part = reader.read_part(4)
+        self.assertEqual(reader.tell(), 7)
+        self.assertEqual(len(part), 4)
+        self.assertEqual(part.read(), b"3456")
+        part.seek(1)
+        buffer = bytearray(2)
+        self.assertEqual(part.readinto(buffer), 2)
+        self.assertEqual(bytes(buffer), b"45")
+        self.assertEqual(reader.read_part(10).read(), b"789")
+        self.assertEqual(len(reader.read_part(10)), 0)
+        reader.seek(-2, os.SEEK_END)
+        self.assertEqual(reader.read(), b"89")
+        part.close()
+        reader.close()
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+
+
+class ResumableUploadTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'archive.tar')
+        self.content = bytes(range(32))  # part_size 4 -> 8 parts
+        with open(self.path, 'wb') as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _upload(self, driver, checksum=None):
+        return driver.upload_from_file(
+            self.path, TransferConfig(threshold=1, resumable=True,
+                                      checksum=checksum))
+
+    def _fail_once(self, recorder, driver, part_number, checksum=None):
+        recorder.fail_on_part = part_number
+        with self.assertRaises(Exception):
+            self._upload(driver, checksum)
+        recorder.fail_on_part = None
+        sent = list(recorder.sent)
+        recorder.sent = []
+        return sent
+
+    def test_resumes_same_upload_sending_only_missing_parts(self):
+        recorder = _Recorder()
+        driver = _DriverObject(_FakeProvider(recorder), part_size=4,
+                               concurrency=1)
+        self.assertEqual(self._fail_once(recorder, driver, 5), [1, 2, 3, 4])
+        self.assertFalse(recorder.aborted)
+        self.assertTrue(os.path.exists(self.path + '.cbupload'))
+
+        self.assertEqual(self._upload(driver), self.content)
+        self.assertEqual(recorder.sent, [5, 6, 7, 8])
+        self.assertEqual(recorder.uploads_created, ['upl-0'])
+        self.assertEqual(recorder.completed_upload, 'upl-0')
+        self.assertEqual(recorder.completed_order, list(range(1, 9)))
+        self.assertEqual(os.listdir(self.directory), ['archive.tar'])
+
+    def test_upload_gone_from_server_starts_over(self):
+        for concurrency in (1, 3):
+            recorder = _Recorder()
+            driver = _DriverObject(_FakeProvider(recorder), part_size=4,
+                                   concurrency=concurrency)
+            self._fail_once(recorder, driver, 5)
+            recorder.gone_uploads.add('upl-0')
+            with self.assertLogs('cloudbridge.base.resources', 'WARNING'):
+                self.assertEqual(self._upload(driver), self.content)
+            self.assertEqual(sorted(recorder.sent), list(range(1, 9)))
+            self.assertEqual(recorder.uploads_created, ['upl-0', 'upl-1'])
+            self.assertEqual(recorder.completed_upload, 'upl-1')
+            self.assertEqual(os.listdir(self.directory), ['archive.tar'])
+
+    def test_resumes_concurrent_upload(self):
+        recorder = _Recorder()
+        driver = _DriverObject(_FakeProvider(recorder), part_size=4,
+                               concurrency=3)
+        sent = self._fail_once(recorder, driver, 5)
+        self.assertEqual(self._upload(driver), self.content)
+        # No part is sent twice, and together they cover the file.
+        self.assertFalse(set(sent) & set(recorder.sent))
+        self.assertEqual(sorted(sent + recorder.sent), list(range(1, 9)))
+        self.assertEqual(recorder.uploads_created, ['upl-0'])
+
+    def test_resumed_upload_verifies_journalled_parts(self):
+        recorder = _Recorder()
+        driver = _DriverObject(_FakeProvider(recorder), part_size=4,
+                               concurrency=2)
+        self._fail_once(recorder, driver, 5, checksum='crc32c')
+        self.assertEqual(self._upload(driver, checksum='crc32c'),
+                         self.content)
+        self.assertEqual(os.listdir(self.directory), ['archive.tar'])
+
+    def test_modified_file_starts_a_new_upload(self):
+        recorder = _Recorder()
+        driver = _DriverObject(_FakeProvider(recorder), part_size=4,
+                               concurrency=1)
+        self._fail_once(recorder, driver, 5)
+        self.content = bytes(reversed(range(36)))
+        with open(self.path, 'wb') as f:
+            f.write(self.content)
+
+        self.assertEqual(self._upload(driver), self.content)
+        self.assertEqual(recorder.sent, list(range(1, 10)))
+        self.assertEqual(recorder.uploads_created, ['upl-0', 'upl-1'])
+        self.assertEqual(recorder.completed_upload, 'upl-1')
+
+    def test_without_resumable_failure_aborts(self):
+        recorder = _Recorder()
+        recorder.fail_on_part = 5
+        driver = _DriverObject(_FakeProvider(recorder), part_size=4,
+                               concurrency=1)
+        with self.assertRaises(Exception):
+            driver.upload_from_file(self.path, TransferConfig(threshold=1))
+        self.assertTrue(recorder.aborted)
+        self.assertEqual(os.listdir(self.directory), ['archive.tar'])
+
+
+class NativeUploadFromFileTestCase(unittest.TestCase):
+    """Providers that upload files with their SDK's own uploader must still
+    hand resumable multipart uploads to the generic, journalled driver, and
+    compressed uploads to the compressing one."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'archive.tar')
+        with open(self.path, 'wb') as f:
+            f.write(bytes(range(32)))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def _object(cls):
+        # Bypass the provider's constructor, which needs an SDK object.
+        obj = cls.__new__(cls)
+        BaseBucketObject.__init__(obj, _FakeProvider(_Recorder()))
+        return obj
+
+    def _check_resumable_upload(self, cls):
+        obj = self._object(cls)
+        config = TransferConfig(threshold=1, resumable=True)
+        with mock.patch.object(BaseBucketObject, '_upload_resumable',
+                               return_value=obj) as upload_resumable:
+            self.assertIs(obj.upload_from_file(self.path, config), obj)
+        upload_resumable.assert_called_once_with(self.path, 32, config)
+        # Files within the threshold have no parts to resume.
+        self.assertFalse(obj._needs_generic_file_upload(
+            self.path, TransferConfig(threshold=32, resumable=True)))
+
+    def _check_compressed_upload(self, cls):
+        obj = self._object(cls)
+        config = TransferConfig(compression='gzip')
+        with mock.patch.object(BaseBucketObject, '_upload_compressed',
+                               return_value=obj) as upload_compressed:
+            self.assertIs(obj.upload_from_file(self.path, config), obj)
+        upload_compressed.assert_called_once()
+        self.assertEqual(upload_compressed.call_args.args[1], 'gzip')
+
+    def test_aws_resumable_upload_from_file(self):
+        self._check_resumable_upload(AWSBucketObject)
+
+    def test_aws_compressed_upload_from_file(self):
+        self._check_compressed_upload(AWSBucketObject)
+
+    @unittest.skipIf(GCPBucketObject is None,
+                     "google-api-python-client is not installed")
+    def test_gcp_resumable_upload_from_file(self):
+        self._check_resumable_upload(GCPBucketObject)
+
+    @unittest.skipIf(GCPBucketObject is None,
+                     "google-api-python-client is not installed")
+    def test_gcp_compressed_upload_from_file(self):
+        self._check_compressed_upload(GCPBucketObject)
+
+    @unittest.skipIf(OpenStackBucketObject is None,
+                     "python-swiftclient is not installed")
+    def test_openstack_resumable_upload_from_file(self):
+        self._check_resumable_upload(OpenStackBucketObject)
+
+    @unittest.skipIf(OpenStackBucketObject is None,
+                     "python-swiftclient is not installed")
+    def test_openstack_compressed_upload_from_file(self):
+        self._check_compressed_upload(OpenStackBucketObject)
+
 
 if __name__ == "__main__":
     unittest.main()
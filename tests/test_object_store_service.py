@@ -1,16 +1,25 @@
 import filecmp
+import json
 import os
+import shutil
 import tempfile
+import threading
 from datetime import datetime
 from io import BytesIO
+from unittest import TestCase
 from unittest import mock
 from unittest import skip
+from unittest import skipIf
+from urllib.parse import unquote
 
 import requests
 
 from cloudbridge.base import helpers as cb_helpers
 from cloudbridge.base.resources import BaseBucketObject
+from cloudbridge.base.resources import BaseTransferManager
+from cloudbridge.interfaces.exceptions import ChecksumMismatchException
 from cloudbridge.interfaces.exceptions import DuplicateResourceException
+from cloudbridge.interfaces.exceptions import InvalidValueException
 from cloudbridge.interfaces.provider import TestMockHelperMixin
 from cloudbridge.interfaces.resources import Bucket
 from cloudbridge.interfaces.resources import BucketObject
@@ -20,6 +29,12 @@ from tests import helpers
 from tests.helpers import ProviderTestBase
 from tests.helpers import standard_interface_tests as sit
 
+try:
+    from cloudbridge.providers.openstack.services import \
+        OpenStackBucketObjectService
+except ImportError:
+    OpenStackBucketObjectService = None
+
 # S3 (and Swift) require every part except the last to be >= 5 MiB. Tests use
 # this size so they remain valid against real cloud providers, not just moto.
 MIN_PART_SIZE = 5 * 1024 * 1024
@@ -200,6 +215,35 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                         " access generated url")
                 self.assertEqual(requests.get(url).content, content)
 
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_generate_urls(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            contents = {"first.txt": b"first", "second.txt": b"second"}
+            for obj_name, content in contents.items():
+                test_bucket.objects.create(obj_name).upload(content)
+
+            with cb_helpers.cleanup_action(
+                    lambda: test_bucket.objects.delete_many(list(contents))):
+                first = test_bucket.objects.get("first.txt")
+                urls = test_bucket.objects.generate_urls(
+                    [first, "second.txt"], 100)
+                self.assertEqual(len(urls), 2)
+                self.assertIn("first.txt", urls[0])
+                self.assertIn("second.txt", urls[1])
+
+                with self.assertRaises(InvalidValueException):
+                    test_bucket.objects.generate_urls(["missing.txt"], 100)
+
+                if isinstance(self.provider, TestMockHelperMixin):
+                    raise self.skipTest(
+                        "Skipping rest of test - mock providers can't"
+                        " access generated url")
+                for url, content in zip(urls, contents.values()):
+                    self.assertEqual(requests.get(url).content, content)
+
     @helpers.skipIfNoService(['storage.buckets'])
     def test_generate_url_write_permissions(self):
         name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
@@ -310,6 +354,240 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                 with open(test_file, 'rb') as f:
                     self.assertEqual(target_stream.getvalue(), f.read())
 
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_list_objects_in_pages(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)):
+            names = ["a/{0:02d}.txt".format(i) for i in range(7)] + ["b.txt"]
+            for obj_name in names:
+                test_bucket.objects.create(obj_name).upload(b"data")
+
+            page = test_bucket.objects.list(limit=3, prefix="a/")
+            seen = [o.name for o in page]
+            while page.is_truncated:
+                self.assertEqual(len(page), 3)
+                page = test_bucket.objects.list(limit=3, prefix="a/",
+                                                marker=page.marker)
+                seen += [o.name for o in page]
+            self.assertEqual(seen, names[:7])
+
+            # Prefetching the next pages does not change what is iterated.
+            prefetched = test_bucket.objects.iter(prefetch=2, limit=3,
+                                                  prefix="a/")
+            self.assertEqual([o.name for o in prefetched], names[:7])
+
+            # A page larger than one listing call allows is still whole.
+            svc = self.provider.storage._bucket_objects
+            with mock.patch.object(type(svc), '_LIST_MAX_KEYS', 2,
+                                   create=True):
+                page = test_bucket.objects.list(limit=5, prefix="a/")
+            self.assertEqual([o.name for o in page], names[:5])
+            self.assertTrue(page.is_truncated)
+
+            # Listed objects carry their attributes without a further fetch.
+            listed = test_bucket.objects.list(prefix="b.txt")[0]
+            self.assertEqual(listed.size, 4)
+            self.assertEqual([o.name for o in test_bucket.objects], names)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_list_objects_with_delimiter(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)):
+            names = ["top.txt", "a/1.txt", "a/2.txt", "b/1.txt",
+                     "b/c/1.txt", "c/1.txt", "d.txt"]
+            for obj_name in names:
+                test_bucket.objects.create(obj_name).upload(b"data")
+
+            page = test_bucket.objects.list(delimiter="/")
+            self.assertEqual(sorted(o.name for o in page),
+                             ["d.txt", "top.txt"])
+            self.assertEqual(sorted(page.prefixes), ["a/", "b/", "c/"])
+
+            page = test_bucket.objects.list(prefix="b/", delimiter="/")
+            self.assertEqual([o.name for o in page], ["b/1.txt"])
+            self.assertEqual(page.prefixes, ["b/c/"])
+
+            # Paging counts objects and prefixes, and never repeats a
+            # prefix on the next page.
+            seen = []
+            page = test_bucket.objects.list(limit=2, delimiter="/")
+            while True:
+                self.assertLessEqual(len(page) + len(page.prefixes), 2)
+                seen += [o.name for o in page] + page.prefixes
+                if not page.is_truncated:
+                    break
+                page = test_bucket.objects.list(limit=2, delimiter="/",
+                                                marker=page.marker)
+            self.assertEqual(sorted(seen),
+                             ["a/", "b/", "c/", "d.txt", "top.txt"])
+
+            # Without a delimiter, listings have no prefixes.
+            self.assertEqual(test_bucket.objects.list().prefixes, [])
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_iter_parallel_lists_every_object_once(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)):
+            # More objects under c/ than fit on one page of the listing.
+            names = ["top.txt", "a/1.txt", "a/2.txt", "a/b/1.txt",
+                     "c/d/e/1.txt", "f/1.txt"] + [
+                "c/{0:02d}.txt".format(i) for i in range(12)]
+            for obj_name in names:
+                test_bucket.objects.create(obj_name).upload(b"data")
+
+            svc = self.provider.storage._bucket_objects
+            with mock.patch.object(type(svc), 'CB_LIST_MAX_CONCURRENCY', 2):
+                # Shards are discovered from the top level folders.
+                listed = list(test_bucket.objects.iter_parallel())
+                self.assertEqual(sorted(o.name for o in listed),
+                                 sorted(names))
+                # Objects listed through clones of the provider are handed
+                # out bound to the provider itself.
+                for obj in listed:
+                    # pylint:disable=protected-access
+                    self.assertIs(obj._provider, self.provider)
+                self.assertIn(test_bucket.objects.get("c/d/e/1.txt"), listed)
+                # Shards are given relative to the prefix.
+                found = test_bucket.objects.iter_parallel(
+                    prefix="c/", shards=["0", "1", "d/"])
+                self.assertEqual(sorted(o.name for o in found),
+                                 sorted(names[6:] + ["c/d/e/1.txt"]))
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_iter_parallel_shards_flat_folders(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)):
+            # Fewer folders than workers, each with several pages of objects
+            # and no folders of its own.
+            names = ["{0}/{1:02d}.txt".format(folder, i)
+                     for folder in "ab" for i in range(12)]
+            for obj_name in names:
+                test_bucket.objects.create(obj_name).upload(b"data")
+
+            svc = self.provider.storage._bucket_objects
+            list_objects = type(svc).list
+            with mock.patch.object(type(svc), 'CB_LIST_MAX_CONCURRENCY', 4), \
+                    mock.patch.object(type(svc), 'list', autospec=True,
+                                      side_effect=list_objects) as list_spy:
+                self.assertEqual(
+                    sorted(o.name for o in test_bucket.objects.iter_parallel()),
+                    sorted(names))
+            listed = [(c.kwargs.get('prefix'), c.kwargs.get('delimiter'))
+                      for c in list_spy.call_args_list]
+            # Each folder is probed for subfolders with a single page, and
+            # then listed whole as a shard.
+            self.assertEqual(listed.count(("a/", "/")), 1)
+            self.assertEqual(listed.count(("b/", "/")), 1)
+            self.assertGreater(listed.count(("a/", None)), 1)
+            self.assertGreater(listed.count(("b/", None)), 1)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_find_pushes_glob_prefix_down(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)):
+            names = ["logs/2026-09-30.txt", "logs/2026-10-01.txt",
+                     "logs/2026-10-02.gz", "old/logs/2026-10-03.txt"]
+            for obj_name in names:
+                test_bucket.objects.create(obj_name).upload(b"data")
+
+            svc = self.provider.storage._bucket_objects
+            with mock.patch.object(svc, 'list', wraps=svc.list) as list_spy:
+                found = test_bucket.objects.find(name="logs/2026-10-*.txt")
+            self.assertEqual([o.name for o in found], ["logs/2026-10-01.txt"])
+            for call in list_spy.call_args_list:
+                self.assertEqual(call.kwargs['prefix'], "logs/2026-10-")
+
+            # find_first stops listing at the first match.
+            with mock.patch.dict(self.provider.config,
+                                 {'default_result_limit': 1}), \
+                    mock.patch.object(svc, 'list',
+                                      wraps=svc.list) as list_spy:
+                first = test_bucket.objects.find_first(
+                    name="logs/2026-10-*.txt")
+            self.assertEqual(first.name, "logs/2026-10-01.txt")
+            self.assertEqual(list_spy.call_count, 1)
+            self.assertEqual(list_spy.call_args.kwargs['prefix'],
+                             "logs/2026-10-")
+            self.assertIsNone(test_bucket.objects.find_first(name="nope-*"))
+
+            # The pattern is anchored at the start of the name.
+            found = test_bucket.objects.find(name="*logs/2026-10-03.txt")
+            self.assertEqual([o.name for o in found],
+                             ["old/logs/2026-10-03.txt"])
+            found = test_bucket.objects.find(name="logs/2026-10-03.txt")
+            self.assertEqual(len(found), 0)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_delete_many_by_name_and_prefix(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)):
+            names = ["keep.txt"] + ["scratch/{0:03d}.txt".format(i)
+                                    for i in range(25)]
+            for obj_name in names:
+                test_bucket.objects.create(obj_name).upload(b"data")
+
+            errors = test_bucket.objects.delete_many(
+                ["scratch/000.txt", "scratch/001.txt", "no-such-object"])
+            self.assertEqual(errors, {})
+            self.assertIsNone(test_bucket.objects.get("scratch/000.txt"))
+            self.assertIsNotNone(test_bucket.objects.get("scratch/002.txt"))
+
+            errors = test_bucket.objects.delete_many("scratch/")
+            self.assertEqual(errors, {})
+            self.assertEqual([o.name for o in test_bucket.objects],
+                             ["keep.txt"])
+
+    @helpers.skipIfNoService(['storage._bucket_objects', 'storage.buckets'])
+    def test_delete_many_reports_per_key_errors(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)):
+            names = ["obj-{0:03d}".format(i) for i in range(30)]
+            for obj_name in names:
+                test_bucket.objects.create(obj_name).upload(b"data")
+
+            svc = self.provider.storage._bucket_objects
+            # Small batches so that several are in flight at once, one of
+            # which fails outright.
+            failure = RuntimeError("batch rejected")
+            real_delete_batch = type(svc)._delete_batch
+
+            def delete_batch(service, bucket, batch):
+                if "obj-010" in batch:
+                    raise failure
+                return real_delete_batch(service, bucket, batch)
+
+            with mock.patch.object(type(svc), '_DELETE_BATCH_SIZE', 4), \
+                    mock.patch.object(type(svc), '_delete_batch',
+                                      delete_batch):
+                errors = test_bucket.objects.delete_many(names)
+
+            failed = ["obj-008", "obj-009", "obj-010", "obj-011"]
+            self.assertEqual(sorted(errors), failed)
+            self.assertIs(errors["obj-010"], failure)
+            self.assertEqual(sorted(o.name for o in test_bucket.objects),
+                             failed)
+
     @helpers.skipIfNoService(['storage.buckets'])
     def test_explicit_multipart_upload_roundtrip(self):
         name = "cbtest-mpu-{0}".format(helpers.get_uuid())
@@ -367,6 +645,273 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                 stored.save_content(target_stream)
                 self.assertEqual(target_stream.getvalue(), expected)
 
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_resume_multipart_upload(self):
+        name = "cbtest-mpu-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            obj_name = "mpu-resume.bin"
+            obj = test_bucket.objects.create(obj_name)
+
+            with cb_helpers.cleanup_action(lambda: obj.delete()):
+                part1 = b"a" * MIN_PART_SIZE
+                part2 = b"b" * 1024
+
+                upload = obj.create_multipart_upload()
+                p1 = upload.upload_part(1, part1)
+                # Carry on with the same upload from a fresh handle, as a
+                # restarted process would, given only the upload id.
+                resumed = test_bucket.objects.get(obj_name) or obj
+                resumed_upload = resumed.resume_multipart_upload(upload.id)
+                self.assertEqual(resumed_upload.id, upload.id)
+                p2 = resumed_upload.upload_part(2, part2)
+                resumed_upload.complete([p1, p2])
+
+                target_stream = BytesIO()
+                test_bucket.objects.get(obj_name).save_content(target_stream)
+                self.assertEqual(target_stream.getvalue(), part1 + part2)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_resumable_upload_from_file_after_failure(self):
+        name = "cbtest-mpu-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            obj_name = "mpu-resumable.bin"
+            obj = test_bucket.objects.create(obj_name)
+            content = os.urandom(2 * MIN_PART_SIZE + 1024)
+            config = TransferConfig(threshold=MIN_PART_SIZE,
+                                    part_size=MIN_PART_SIZE,
+                                    max_concurrency=1, resumable=True)
+
+            with cb_helpers.cleanup_action(lambda: obj.delete()), \
+                    tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'payload.bin')
+                with open(path, 'wb') as f:
+                    f.write(content)
+
+                svc = self.provider.storage._bucket_objects
+                real_upload_part = svc.upload_part
+
+                def fail_on_part_3(bucket, upload, part_number, data):
+                    if part_number == 3:
+                        raise RuntimeError("interrupted")
+                    return real_upload_part(bucket, upload, part_number, data)
+
+                with mock.patch.object(svc, 'upload_part',
+                                       side_effect=fail_on_part_3):
+                    with self.assertRaises(RuntimeError):
+                        obj.upload_from_file(path, config)
+                self.assertTrue(os.path.exists(path + '.cbupload'))
+
+                with mock.patch.object(svc, 'upload_part',
+                                       wraps=real_upload_part) as spy:
+                    obj.upload_from_file(path, config)
+                # Only the part that failed is sent again.
+                self.assertEqual(
+                    [c.args[2] for c in spy.call_args_list], [3])
+                self.assertFalse(os.path.exists(path + '.cbupload'))
+
+                target_stream = BytesIO()
+                test_bucket.objects.get(obj_name).save_content(target_stream)
+                self.assertEqual(target_stream.getvalue(), content)
+
+                # An upload aborted on the server since is started over.
+                with mock.patch.object(svc, 'upload_part',
+                                       side_effect=fail_on_part_3):
+                    with self.assertRaises(RuntimeError):
+                        obj.upload_from_file(path, config)
+                with open(path + '.cbupload') as f:
+                    upload_id = json.load(f)['state']['upload_id']
+                obj.resume_multipart_upload(upload_id).abort()
+                with mock.patch.object(svc, 'upload_part',
+                                       wraps=real_upload_part) as spy:
+                    obj.upload_from_file(path, config)
+                self.assertEqual(
+                    [c.args[2] for c in spy.call_args_list], [1, 2, 3])
+                self.assertFalse(os.path.exists(path + '.cbupload'))
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_transfer_with_checksum(self):
+        name = "cbtest-checksum-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)), \
+                tempfile.TemporaryDirectory() as directory:
+            config = TransferConfig(threshold=MIN_PART_SIZE,
+                                    part_size=MIN_PART_SIZE,
+                                    checksum='md5')
+            # Uploaded in a single request, and in parts.
+            for size in (1024, 2 * MIN_PART_SIZE + 1024):
+                obj_name = "checksum-{0}.bin".format(size)
+                content = os.urandom(size)
+                path = os.path.join(directory, obj_name)
+                with open(path, 'wb') as f:
+                    f.write(content)
+                obj = test_bucket.objects.create(obj_name)
+                obj.upload_from_file(path, config)
+
+                obj = test_bucket.objects.get(obj_name)
+                target = path + '.out'
+                obj.download_to_file(target, config)
+                with open(target, 'rb') as f:
+                    self.assertEqual(f.read(), content)
+
+                stored = obj._stored_checksum('md5')
+                if stored is None:
+                    continue
+                # The same checksum, of other data.
+                with mock.patch.object(type(obj), '_stored_checksum',
+                                       return_value=(b'\0' * 16, stored[1])):
+                    with self.assertRaises(ChecksumMismatchException):
+                        obj.download_to_file(target + '.bad', config)
+                self.assertFalse(os.path.exists(target + '.bad'))
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_transfer_with_checksum_of_other_part_size(self):
+        name = "cbtest-checksum-parts-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)), \
+                tempfile.TemporaryDirectory() as directory:
+            # Uploaded in 3 parts, and downloaded in ranges of another size
+            # that would also make 3.
+            content = os.urandom(3 * MIN_PART_SIZE + 1024)
+            path = os.path.join(directory, "parts.bin")
+            with open(path, 'wb') as f:
+                f.write(content)
+            obj = test_bucket.objects.create("parts.bin")
+            obj.upload_from_file(path, TransferConfig(
+                threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE + 1024 * 1024,
+                checksum='md5'))
+
+            obj = test_bucket.objects.get("parts.bin")
+            for resumable in (False, True):
+                target = os.path.join(directory, "out-{0}".format(resumable))
+                obj.download_to_file(target, TransferConfig(
+                    threshold=MIN_PART_SIZE,
+                    part_size=MIN_PART_SIZE + 2 * 1024 * 1024,
+                    checksum='md5', resumable=resumable))
+                with open(target, 'rb') as f:
+                    self.assertEqual(f.read(), content)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_copy_to(self):
+        name = "cbtest-copy-{0}".format(helpers.get_uuid())
+        source_bucket = self.provider.storage.buckets.create(name)
+        with cb_helpers.cleanup_action(
+                lambda: source_bucket.delete(delete_contents=True)):
+            target_bucket = self.provider.storage.buckets.create(
+                name + "-to")
+            with cb_helpers.cleanup_action(
+                    lambda: target_bucket.delete(delete_contents=True)):
+                small = os.urandom(1024)
+                obj = source_bucket.objects.create("small.bin")
+                obj.upload(small)
+                copy = obj.copy_to(source_bucket, "small-copy.bin")
+                self.assertEqual(copy.name, "small-copy.bin")
+                self.assertEqual(b"".join(copy.iter_content()), small)
+
+                # Copied in parts, to a bucket given by name, keeping the
+                # object's name.
+                large = os.urandom(2 * MIN_PART_SIZE + 1024)
+                obj = source_bucket.objects.create("large.bin")
+                obj.upload(large)
+                config = TransferConfig(threshold=MIN_PART_SIZE,
+                                        part_size=MIN_PART_SIZE)
+                copy = obj.copy_to(target_bucket.name, config=config)
+                self.assertEqual(copy.name, "large.bin")
+                self.assertEqual(copy.size, len(large))
+                self.assertEqual(b"".join(copy.iter_content()), large)
+                self.assertEqual(
+                    b"".join(obj.iter_content()), large)
+
+                with self.assertRaises(InvalidValueException):
+                    obj.copy_to(source_bucket)
+                with self.assertRaises(InvalidValueException):
+                    obj.copy_to("cbtest-no-such-bucket-{0}".format(
+                        helpers.get_uuid()))
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_adaptive_transfer(self):
+        name = "cbtest-adaptive-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)), \
+                tempfile.TemporaryDirectory() as directory:
+            config = TransferConfig(threshold=MIN_PART_SIZE,
+                                    part_size=MIN_PART_SIZE,
+                                    max_concurrency=4, adaptive=True)
+            content = os.urandom(3 * MIN_PART_SIZE + 1024)
+            path = os.path.join(directory, "adaptive.bin")
+            with open(path, 'wb') as f:
+                f.write(content)
+            obj = test_bucket.objects.create("adaptive.bin")
+            obj.upload_from_file(path, config)
+
+            obj = test_bucket.objects.get("adaptive.bin")
+            self.assertEqual(obj.size, len(content))
+            target = path + '.out'
+            obj.download_to_file(target, config)
+            with open(target, 'rb') as f:
+                self.assertEqual(f.read(), content)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_transfer_manager_shares_workers_across_files(self):
+        name = "cbtest-tm-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)), \
+                tempfile.TemporaryDirectory() as directory:
+            # Several small files, and one large enough to go in parts.
+            contents = {"small-{0}.txt".format(i): os.urandom(1024 + i)
+                        for i in range(6)}
+            contents["large.bin"] = os.urandom(2 * MIN_PART_SIZE + 1024)
+            for obj_name, content in contents.items():
+                with open(os.path.join(directory, obj_name), 'wb') as f:
+                    f.write(content)
+            config = TransferConfig(threshold=MIN_PART_SIZE,
+                                    part_size=MIN_PART_SIZE)
+
+            with mock.patch.object(self.provider, 'clone',
+                                   wraps=self.provider.clone) as clone_spy:
+                with self.provider.storage.transfer_manager(
+                        max_concurrency=2) as tm:
+                    uploads = [tm.upload_file(os.path.join(directory, n),
+                                              test_bucket, n, config)
+                               for n in contents]
+                for future in uploads:
+                    self.assertIsInstance(future.result(), BucketObject)
+                uploaded_with = clone_spy.call_count
+
+                with self.provider.storage.transfer_manager(
+                        max_concurrency=2) as tm:
+                    downloads = [
+                        tm.download_file(name, n,
+                                         os.path.join(directory, n + '.out'),
+                                         config)
+                        for n in contents]
+                    missing = tm.download_file(
+                        test_bucket, "missing", os.path.join(directory, "m"))
+                for future in downloads:
+                    future.result()
+                with self.assertRaises(InvalidValueException):
+                    missing.result()
+            # At most one clone per worker, however many files are
+            # transferred, and the second manager reuses the first's clones.
+            self.assertLessEqual(uploaded_with, 2)
+            self.assertEqual(clone_spy.call_count, uploaded_with)
+
+            for obj_name, content in contents.items():
+                with open(os.path.join(directory, obj_name + '.out'),
+                          'rb') as f:
+                    self.assertEqual(f.read(), content)
+
     @helpers.skipIfNoService(['storage.buckets'])
     def test_multipart_upload_abort(self):
         name = "cbtest-mpu-{0}".format(helpers.get_uuid())
@@ -446,6 +991,143 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                 obj.save_content(target_stream)
                 self.assertEqual(target_stream.getvalue(), content)
 
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_upload_from_generator(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            obj = test_bucket.objects.create("generated.bin")
+
+            with cb_helpers.cleanup_action(lambda: obj.delete()):
+                chunk = os.urandom(1024 * 1024)
+                # Larger than the threshold, of a size not known up front.
+                obj.upload((chunk for _ in range(11)),
+                           TransferConfig(threshold=MIN_PART_SIZE,
+                                          part_size=MIN_PART_SIZE))
+                stored = test_bucket.objects.get("generated.bin")
+                self.assertEqual(stored.size, 11 * len(chunk))
+                target = BytesIO()
+                stored.save_content(target)
+                self.assertEqual(target.getvalue(), chunk * 11)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_compressed_transfer(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            obj = test_bucket.objects.create("compressed.csv")
+
+            with cb_helpers.cleanup_action(lambda: obj.delete()):
+                content = b"".join(b"%d,row %d,some value\n" % (i, i)
+                                   for i in range(500000))
+                obj.upload(BytesIO(content), TransferConfig(
+                    threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE,
+                    compression='gzip'))
+                stored = test_bucket.objects.get("compressed.csv")
+                self.assertLess(stored.size, len(content) // 3)
+                # pylint:disable=protected-access
+                self.assertEqual(stored._content_encoding, 'gzip')
+                self.assertEqual(b"".join(stored.iter_content()), content)
+                # Listed objects are decompressed too.
+                listed = test_bucket.objects.find_first(name="compressed.csv")
+                self.assertEqual(b"".join(listed.iter_content()), content)
+
+                directory = tempfile.mkdtemp()
+                path = os.path.join(directory, "compressed.csv")
+                with cb_helpers.cleanup_action(
+                        lambda: shutil.rmtree(directory)):
+                    stored.download_to_file(path, TransferConfig(
+                        threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE))
+                    with open(path, 'rb') as f:
+                        self.assertEqual(f.read(), content)
+                    self.assertEqual(os.listdir(directory),
+                                     ["compressed.csv"])
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_transfer_manager_compresses_large_files(self):
+        name = "cbtest-tmgz-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)), \
+                tempfile.TemporaryDirectory() as directory:
+            content = b"".join(b"%d,row %d,some value\n" % (i, i)
+                               for i in range(500000))
+            path = os.path.join(directory, "large.csv")
+            with open(path, 'wb') as f:
+                f.write(content)
+            config = TransferConfig(threshold=MIN_PART_SIZE,
+                                    part_size=MIN_PART_SIZE,
+                                    compression='gzip')
+            with self.provider.storage.transfer_manager(
+                    max_concurrency=2) as tm:
+                tm.upload_file(path, test_bucket, "large.csv",
+                               config).result()
+            stored = test_bucket.objects.get("large.csv")
+            self.assertLess(stored.size, len(content) // 3)
+            self.assertEqual(b"".join(stored.iter_content()), content)
+
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_transfer_manager_threads_make_no_requests(self):
+        name = "cbtest-tmreq-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(
+                lambda: test_bucket.delete(delete_contents=True)), \
+                tempfile.TemporaryDirectory() as directory:
+            content = b"".join(b"%d,row %d,some value\n" % (i, i)
+                               for i in range(500000))
+            path = os.path.join(directory, "large.csv")
+            with open(path, 'wb') as f:
+                f.write(content)
+            test_bucket.objects.create("plain.csv").upload_from_file(path)
+            test_bucket.objects.create("packed.csv").upload_from_file(
+                path, TransferConfig(compression='gzip'))
+            cls = type(test_bucket.objects.get("plain.csv"))
+
+            # The threads objects are used on, by requests made through them.
+            used_on = []
+            transfer_threads = []
+
+            def record(fn, threads):
+                def recorded(*args, **kwargs):
+                    threads.append(threading.get_ident())
+                    return fn(*args, **kwargs)
+                return recorded
+
+            # Both objects are above the threshold, compressed or not.
+            config = TransferConfig(threshold=1024 * 1024,
+                                    part_size=MIN_PART_SIZE, checksum='md5',
+                                    resumable=True)
+            with mock.patch.object(
+                    BaseTransferManager, '_download_file',
+                    record(BaseTransferManager._download_file,
+                           transfer_threads)), \
+                    mock.patch.object(cls, '_stored_checksum', record(
+                        cls._stored_checksum, used_on)), \
+                    mock.patch.object(cls, '_content_encoding', property(
+                        record(cls._content_encoding.fget, used_on))), \
+                    mock.patch.object(cls, 'iter_content', record(
+                        cls.iter_content, used_on)), \
+                    mock.patch.object(cls, '_ranged_reads_of_encoding',
+                                      return_value=False):
+                with self.provider.storage.transfer_manager(
+                        max_concurrency=2) as tm:
+                    futures = [tm.download_file(
+                        test_bucket, obj_name,
+                        os.path.join(directory, obj_name + ".out"), config)
+                        for obj_name in ("plain.csv", "packed.csv")]
+                for future in futures:
+                    future.result()
+            self.assertTrue(used_on)
+            self.assertFalse(set(used_on) & set(transfer_threads))
+            for obj_name in ("plain.csv", "packed.csv"):
+                with open(os.path.join(directory, obj_name + ".out"),
+                          'rb') as f:
+                    self.assertEqual(f.read(), content)
+
     @helpers.skipIfNoService(['storage.buckets'])
     def test_upload_from_file_uses_multipart_config(self):
         # AWS drives boto3's TransferManager with CloudBridge's multipart
@@ -529,6 +1211,27 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                     with open(path, 'rb') as f:
                         self.assertEqual(f.read(), content)
 
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_open_random_access_read(self):
+        name = "cbtest-open-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            obj = test_bucket.objects.create("random-access.bin")
+
+            with cb_helpers.cleanup_action(lambda: obj.delete()):
+                content = bytes(range(256)) * 64
+                obj.upload(content)
+
+                stored = test_bucket.objects.get("random-access.bin")
+                with stored.open(block_size=1024, read_ahead=2) as f:
+                    f.seek(-100, os.SEEK_END)
+                    self.assertEqual(f.read(), content[-100:])
+                    f.seek(1000)
+                    self.assertEqual(f.read(2000), content[1000:3000])
+                    f.seek(0)
+                    self.assertEqual(f.read(), content)
+
     @helpers.skipIfNoService(['storage.buckets'])
     def test_transparent_download_large_uses_ranged(self):
         name = "cbtest-dl-{0}".format(helpers.get_uuid())
@@ -558,6 +1261,22 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                     with open(path, 'rb') as f:
                         self.assertEqual(f.read(), content)
 
+    @helpers.skipIfNoService(['storage._bucket_objects', 'storage.buckets'])
+    def test_iter_range_streams_the_requested_range(self):
+        name = "cbtest-dl-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            obj = test_bucket.objects.create("streamed.bin")
+
+            with cb_helpers.cleanup_action(lambda: obj.delete()):
+                content = bytes(range(256)) * 64
+                obj.upload(content)
+                svc = self.provider.storage._bucket_objects
+                chunks = svc.iter_range(test_bucket, "streamed.bin",
+                                        1000, 5000)
+                self.assertEqual(b"".join(chunks), content[1000:6000])
+
     @helpers.skipIfNoService(['storage.buckets'])
     def test_download_to_file_uses_transfer_config(self):
         # AWS drives boto3's TransferManager with CloudBridge's transfer
@@ -598,6 +1317,37 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                         self.assertEqual(
                             f.read(), b"some downloadable content")
 
+    @helpers.skipIfNoService(['storage.buckets'])
+    def test_download_to_file_from_cache(self):
+        name = "cbtestbucketobjs-{0}".format(helpers.get_uuid())
+        test_bucket = self.provider.storage.buckets.create(name)
+
+        with cb_helpers.cleanup_action(lambda: test_bucket.delete()):
+            obj = test_bucket.objects.create("cached.bin")
+
+            with cb_helpers.cleanup_action(lambda: obj.delete()):
+                obj.upload(b"version one")
+                listed = test_bucket.objects.list(prefix="cached.bin")[0]
+                directory = tempfile.mkdtemp()
+                path = os.path.join(directory, "cached.bin")
+                with cb_helpers.cleanup_action(
+                        lambda: shutil.rmtree(directory)), \
+                        mock.patch.object(
+                            BaseBucketObject, 'CB_OBJECT_CACHE_DIR',
+                            os.path.join(directory, 'cache')):
+                    listed.download_to_file(path)
+                    with mock.patch.object(
+                            type(listed), '_download_file') as download:
+                        listed.download_to_file(path + ".copy")
+                    download.assert_not_called()
+                    self.assertTrue(os.path.samefile(path, path + ".copy"))
+
+                    # A new version is fetched, not served from the cache.
+                    obj.upload(b"version two")
+                    listed.download_to_file(path)
+                    with open(path, 'rb') as f:
+                        self.assertEqual(f.read(), b"version two")
+
     @skip("Skip unless you want to test objects bigger than 5GB")
     @helpers.skipIfNoService(['storage.buckets'])
     def test_upload_download_bucket_content_with_large_file(self):
@@ -626,3 +1376,37 @@ class CloudObjectStoreServiceTestCase(ProviderTestBase):
                             self.assertTrue(
                                 filecmp.cmp(six_gig_file, download_file),
                                 "Uploaded file != downloaded")
+
+
+@skipIf(OpenStackBucketObjectService is None,
+        "python-swiftclient is not installed")
+class OpenStackBulkDeleteTestCase(TestCase):
+    """Swift's bulk-delete middleware, faked: every path it is sent fails."""
+
+    def _delete_batch(self, names):
+        provider = mock.Mock()
+        provider.swift.get_capabilities.return_value = {
+            'bulk_delete': {'max_deletes_per_request': 2}}
+        sent = []
+
+        def post_account(headers, query_string, data):
+            paths = data.split('\n')
+            sent.extend(paths)
+            # Like Swift, report the failed paths as they were sent.
+            return {}, json.dumps({
+                'Response Status': '400 Bad Request',
+                'Errors': [[path, '409 Conflict'] for path in paths]})
+
+        provider.swift.post_account.side_effect = post_account
+        bucket = mock.Mock()
+        bucket.name = 'my bucket'
+        svc = OpenStackBucketObjectService(provider)
+        return svc._delete_batch(bucket, names), sent
+
+    def test_errors_are_reported_under_object_names(self):
+        names = ['a b', 'caf\u00e9/menu.txt', 'plain.txt']
+        errors, sent = self._delete_batch(names)
+        self.assertEqual([unquote(path) for path in sent],
+                         ['/my bucket/' + name for name in names])
+        self.assertNotIn(' ', ''.join(sent))
+        self.assertEqual(sorted(errors), sorted(names))
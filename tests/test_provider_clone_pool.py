@@ -0,0 +1,78 @@
+"""
+Unit tests for the pool of provider clones shared by parallel workers
+(``BaseCloudProvider._clone_pool``).
+"""
+import unittest
+from unittest import mock
+
+from cloudbridge.base.provider import ProviderClonePool
+
+
+class _FakeProvider:
+    def __init__(self, config=None):
+        self._config = config or {}
+        self.clones = []
+
+    def clone(self, zone=None):
+        clone = _FakeProvider(self._config)
+        self.clones.append(clone)
+        return clone
+
+    def _get_config_value(self, key, default_value=None):
+        return self._config.get(key, default_value)
+
+
+class ProviderClonePoolTestCase(unittest.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def test_checked_in_clones_are_reused(self):
+        provider = _FakeProvider()
+        pool = ProviderClonePool(provider)
+        first = pool.checkout()
+        second = pool.checkout()
+        self.assertIsNot(first, second)
+        pool.checkin(first)
+        pool.checkin(second)
+        # The most recently used clone is handed out first.
+        self.assertIs(pool.checkout(), second)
+        self.assertIs(pool.checkout(), first)
+        self.assertEqual(len(provider.clones), 2)
+
+    def test_borrow_returns_clone(self):
+        provider = _FakeProvider()
+        pool = ProviderClonePool(provider)
+        with pool.borrow() as clone:
+            self.assertEqual(pool.idle_count, 0)
+        self.assertEqual(pool.idle_count, 1)
+        with pool.borrow() as again:
+            self.assertIs(again, clone)
+
+    def test_idle_clones_are_capped(self):
+        provider = _FakeProvider({'clone_pool_max_size': 2})
+        pool = ProviderClonePool(provider)
+        clones = [pool.checkout() for _ in range(3)]
+        for clone in clones:
+            pool.checkin(clone)
+        self.assertEqual(pool.idle_count, 2)
+        pool.clear()
+        self.assertEqual(pool.idle_count, 0)
+
+    def test_idle_clones_are_evicted(self):
+        provider = _FakeProvider({'clone_pool_idle_timeout': 60})
+        pool = ProviderClonePool(provider)
+        with mock.patch('cloudbridge.base.provider.time.monotonic',
+                        return_value=1000.0):
+            pool.checkin(pool.checkout())
+        with mock.patch('cloudbridge.base.provider.time.monotonic',
+                        return_value=1030.0):
+            self.assertEqual(pool.idle_count, 1)
+        with mock.patch('cloudbridge.base.provider.time.monotonic',
+                        return_value=1061.0):
+            self.assertEqual(pool.idle_count, 0)
+            pool.checkout()
+        self.assertEqual(len(provider.clones), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
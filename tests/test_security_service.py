@@ -1,4 +1,6 @@
 """Test cloudbridge.security modules."""
+from unittest import mock
+
 import cloudbridge.base.helpers as cb_helpers
 from cloudbridge.interfaces.exceptions import DuplicateResourceException
 from cloudbridge.interfaces.resources import KeyPair
@@ -117,6 +119,25 @@ class CloudSecurityServiceTestCase(ProviderTestBase):
 
             self.assertEqual(label, fw.description)
 
+    @helpers.skipIfNoService(['security.vm_firewalls'])
+    def test_find_iter_follows_every_page(self):
+        label = 'cb-findpages-{0}'.format(helpers.get_uuid())
+        fws = []
+        with cb_helpers.cleanup_action(
+                lambda: [fw.delete() for fw in fws]):
+            net = helpers.get_or_create_default_subnet(self.provider).network
+            for _ in range(6):
+                fws.append(self.provider.security.vm_firewalls.create(
+                    label=label, description=label, network=net.id))
+            # Fewer matches a page than there are, however the service
+            # searches.
+            with mock.patch.dict(self.provider.config,
+                                 {'default_result_limit': 5}):
+                found = list(self.provider.security.vm_firewalls.find_iter(
+                    label=label))
+            self.assertCountEqual([fw.id for fw in found],
+                                  [fw.id for fw in fws])
+
     @helpers.skipIfNoService(['security.vm_firewalls'])
     def test_crud_vm_firewall_rules(self):
         label = 'cb-crudfw-rules-{0}'.format(helpers.get_uuid())